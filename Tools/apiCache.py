@@ -0,0 +1,182 @@
+# apiCache.py
+
+# Author  : Byeong Heon Lee
+# Contact : lww7438@gmail.com
+
+# Required Modules
+import os
+import sqlite3
+import threading
+import time
+import zlib
+
+from urllib.parse import urlsplit, parse_qsl
+
+from apiConfig import *
+
+
+
+# * * *   Classes   * * *
+class ResponseCache:
+    """
+    API 응답 본문을 SQLite 파일에 저장하는 디스크 캐시
+    키는 (호스트 + 경로 + 인증키를 제외하고 정렬한 쿼리 파라미터)이며, 본문은 zlib으로 압축하여 저장한다.
+    전체 크기가 maxBytes를 넘으면 가장 오래 전에 사용된 항목부터 삭제한다. (LRU)
+
+    [Parameters]
+    path      (str) : 캐시 파일 경로 (Default: CACHE_PATH)
+    maxBytes  (int) : 캐시 최대 크기 (Byte, 압축 후 기준) (Default: CACHE_MAX_BYTES)
+    ttlLatest (int) : 과거 일자가 아닌 조회("최신" 조회)의 유효 시간 (초) (Default: CACHE_TTL_LATEST)
+    """
+
+    def __init__(self, path:str=CACHE_PATH, maxBytes:int=CACHE_MAX_BYTES, ttlLatest:int=CACHE_TTL_LATEST):
+        self.path      = path
+        self.maxBytes  = maxBytes
+        self.ttlLatest = ttlLatest
+        self.hits      = 0
+        self.misses    = 0
+
+        os.makedirs(os.path.dirname(os.path.abspath(path)), exist_ok=True)
+
+        self._lock = threading.Lock()
+        self._conn = sqlite3.connect(path, check_same_thread=False, timeout=30)
+        self._conn.execute("""
+            CREATE TABLE IF NOT EXISTS response (
+                key         TEXT PRIMARY KEY,
+                body        BLOB    NOT NULL,
+                size        INTEGER NOT NULL,
+                expires     REAL,
+                last_access REAL    NOT NULL
+            )
+        """)
+        self._conn.execute("CREATE INDEX IF NOT EXISTS idx_response_last_access ON response (last_access)")
+        self._conn.commit()
+
+    def get(self, url:str):
+        key = make_cache_key(url)
+        now = time.time()
+
+        with self._lock:
+            row = self._conn.execute("SELECT body, expires FROM response WHERE key = ?", (key,)).fetchone()
+
+            # Miss (or Expired)
+            if row is None or (row[1] is not None and row[1] < now):
+                self.misses += 1
+                return None
+
+            # Hit
+            self._conn.execute("UPDATE response SET last_access = ? WHERE key = ?", (now, key))
+            self._conn.commit()
+            self.hits += 1
+
+        return zlib.decompress(row[0]).decode("utf-8")
+
+    def put(self, url:str, text:str):
+        key  = make_cache_key(url)
+        now  = time.time()
+        ttl  = get_cache_ttl(url, self.ttlLatest)
+        body = zlib.compress(text.encode("utf-8"))
+
+        with self._lock:
+            self._conn.execute(
+                "INSERT OR REPLACE INTO response (key, body, size, expires, last_access) VALUES (?, ?, ?, ?, ?)",
+                (key, body, len(body), None if ttl is None else now + ttl, now)
+            )
+            self._evict()
+            self._conn.commit()
+
+    def _evict(self):
+        # Expired Entries
+        self._conn.execute("DELETE FROM response WHERE expires IS NOT NULL AND expires < ?", (time.time(),))
+
+        # Least Recently Used Entries
+        total_size = self._conn.execute("SELECT COALESCE(SUM(size), 0) FROM response").fetchone()[0]
+        if total_size <= self.maxBytes:
+            return
+
+        for key, size in self._conn.execute("SELECT key, size FROM response ORDER BY last_access").fetchall():
+            if total_size <= self.maxBytes:
+                break
+            self._conn.execute("DELETE FROM response WHERE key = ?", (key,))
+            total_size -= size
+
+    def clear(self):
+        with self._lock:
+            self._conn.execute("DELETE FROM response")
+            self._conn.commit()
+            self.hits   = 0
+            self.misses = 0
+
+    def stats(self):
+        with self._lock:
+            entries, total_size = self._conn.execute("SELECT COUNT(*), COALESCE(SUM(size), 0) FROM response").fetchone()
+
+        return {"hits": self.hits, "misses": self.misses, "entries": entries, "bytes": total_size}
+
+
+
+# * * *   Functions   * * *
+def make_cache_key(url:str):
+    """
+    요청 URL에서 캐시 키를 만든다. (호스트 + 경로 + 인증키를 제외하고 정렬한 쿼리 파라미터)
+    """
+
+    parsed_url = urlsplit(url)
+    params     = sorted((k, v) for k, v in parse_qsl(parsed_url.query, keep_blank_values=True) if k not in CACHE_EXCLUDED_PARAMS)
+
+    return parsed_url.netloc + parsed_url.path + "?" + "&".join(k + "=" + v for k, v in params)
+
+def get_cache_ttl(url:str, ttlLatest:int=CACHE_TTL_LATEST):
+    """
+    요청 URL의 캐시 유효 시간(초)을 반환한다.
+    기준일자 파라미터(basDd, basDt, endBasDt)가 있고 모두 이전 영업일보다 과거이면 변하지 않는 데이터이므로 None(영구)을 반환한다.
+    그 외("최신" 조회, 기간이 열려 있는 조회 등)에는 ttlLatest를 반환한다.
+    """
+
+    params = dict(parse_qsl(urlsplit(url).query, keep_blank_values=True))
+    dates  = [params[k] for k in CACHE_DATE_PARAMS if params.get(k, "") != ""]
+
+    if params.get("beginBasDt", "") != "" and params.get("endBasDt", "") == "":
+        return ttlLatest
+
+    if len(dates) > 0 and all(date < PREVIOUS_BUSINESS_DAY for date in dates):
+        return None
+
+    return ttlLatest
+
+def is_cacheable_response(text:str):
+    """
+    응답 본문이 캐시 가능한지 여부를 반환한다. (공공데이터포털 오류 응답은 캐시하지 않는다.)
+    """
+
+    return len(text) > 0 and "OpenAPI_ServiceResponse" not in text
+
+_response_cache      = None
+_response_cache_lock = threading.Lock()
+
+def get_response_cache():
+    """
+    공용 ResponseCache를 반환한다. (처음 호출될 때 CACHE_PATH에 생성된다.)
+    """
+
+    global _response_cache
+
+    with _response_cache_lock:
+        if _response_cache is None:
+            _response_cache = ResponseCache()
+
+    return _response_cache
+
+def get_cache_stats():
+    """
+    공용 캐시의 적중/실패 횟수, 항목 수, 크기를 반환한다.
+
+    [Returns]
+    stats : 캐시 통계 (dict)
+        hits    (int) : 캐시 적중 횟수 (네트워크 요청 없음)
+        misses  (int) : 캐시 실패 횟수 (네트워크 요청 발생)
+        entries (int) : 저장된 응답 수
+        bytes   (int) : 저장된 응답 크기 (Byte, 압축 후 기준)
+    """
+
+    return get_response_cache().stats()
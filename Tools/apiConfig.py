@@ -6,11 +6,54 @@
 # Contact : lww7438@gmail.com
 
 # Required Modules
+import os
+
 from pytz        import timezone
 from datetime    import datetime, timedelta
 
 # * * *   Network Configuration   * * *
-INTERVAL_API_CALL = 0.05 # 0.05 Second = 50ms
+MAX_WORKERS_API_CALL = 8    # The number of worker threads for concurrent API calls
+HTTP_POOL_SIZE       = 16   # The number of Keep-Alive connections per host
+HTTP_TIMEOUT         = (3.05, 30) # (Connect, Read) Timeout in Seconds
+DATA_GO_KR_PAGE_SIZE = 1000 # numOfRows per page for paginated data.go.kr requests
+DATA_GO_KR_ENVELOPE_KEYS = {"response", "header", "body", "items", "item", "resultCode", "resultMsg", "numOfRows", "pageNo", "totalCount"} # Kept by projected decoding
+
+# * * *   Rate Limit Configuration   * * *
+RATE_LIMIT_RPS          = 20.0 # Initial requests per second per host (Token bucket refill rate)
+RATE_LIMIT_MIN_RPS      = 1.0  # Lower bound of the adaptive rate
+RATE_LIMIT_MAX_RPS      = 50.0 # Upper bound of the adaptive rate
+RATE_LIMIT_BURST        = 5    # Token bucket capacity (Requests sent back-to-back)
+RATE_LIMIT_CONCURRENCY  = 8    # Maximum in-flight requests per host
+RATE_LIMIT_INCREASE     = 0.1  # Rate increase per successful request (Additive increase)
+RATE_LIMIT_DECREASE     = 0.5  # Rate multiplier on throttling (Multiplicative decrease)
+RETRY_MAX               = 5    # Retries per request before giving up
+RETRY_BACKOFF_BASE      = 0.5  # Seconds; backoff = uniform(0, min(RETRY_BACKOFF_MAX, BASE * 2^attempt))
+RETRY_BACKOFF_MAX       = 30.0 # Seconds
+RETRY_STATUS_CODES      = [429, 500, 502, 503, 504]
+RETRY_THROTTLE_MARKERS  = ["LIMITED_NUMBER_OF_SERVICE_REQUESTS_PER_SECOND_EXCEEDS_ERROR", "SERVICE_TIMEOUT_ERROR", "HTTP ROUTING ERROR"] # data.go.kr (HTTP 200 with an error body)
+INTERVAL_API_CALL       = 1.0 / RATE_LIMIT_RPS # Deprecated: Seconds between calls (0.05); the pacing is done by API_LIMITER (apiLimiter)
+
+# * * *   Cache Configuration   * * *
+CACHE_ENABLED         = True
+CACHE_PATH            = os.path.join(os.path.dirname(os.path.abspath(__file__)), os.pardir, "Data", "cache", "api_cache.sqlite")
+CACHE_MAX_BYTES       = 1024 * 1024 * 1024           # 1 GiB (Compressed)
+CACHE_TTL_LATEST      = 60 * 60                      # 1 Hour (Queries for the latest data)
+CACHE_EXCLUDED_PARAMS = ["serviceKey", "AUTH_KEY"]   # Not a part of the cache key
+CACHE_DATE_PARAMS     = ["basDd", "basDt", "endBasDt"] # Responses for past dates never change
+
+# * * *   Storage Configuration   * * *
+LAKE_PATH           = os.path.join(os.path.dirname(os.path.abspath(__file__)), os.pardir, "Data", "lake") # Parquet Datasets
+LAKE_DATE_COLUMNS   = ["BAS_DD", "basDt", "date"] # Candidates of the date column (In order)
+LAKE_ROW_GROUP_SIZE = 64 * 1024                    # Rows per Parquet row group
+SECTOR_MONTHLY_PATH = os.path.join(os.path.dirname(os.path.abspath(__file__)), os.pardir, "Data", "섹터별_월별_20000101_20220901.csv")
+SECTOR_YEARLY_PATH  = os.path.join(os.path.dirname(os.path.abspath(__file__)), os.pardir, "Data", "섹터별_연별_20000101_20220901.csv")
+SECTOR_FIELDS       = ["Open", "High", "Low", "Close", "Volume", "Volume($)"]
+ECOS_CHUNK_SIZE     = 64 * 1024                    # Characters per read when streaming ECOS CSV exports
+COLLECTOR_START_DATE = "20000101"                 # The first date to collect for a new dataset
+TICKER_SOURCE_PATH   = os.path.join(os.path.dirname(os.path.abspath(__file__)), "supported_tickers.zip")
+TICKER_REGISTRY_PATH = os.path.join(os.path.dirname(os.path.abspath(__file__)), os.pardir, "Data", "cache", "tickers.sqlite") # Indexed copy of supported_tickers.zip
+ID_CROSSWALK_PATH    = os.path.join(os.path.dirname(os.path.abspath(__file__)), os.pardir, "Data", "cache", "id_crosswalk.sqlite") # isinCd / srtnCd / shotnIsin / crno / issucoCustno
+WORLD_INDEX_CACHE_PATH = os.path.join(os.path.dirname(os.path.abspath(__file__)), os.pardir, "Data", "cache", "world_index") # A Parquet file per index
 
 # * * *   Date Strings   * * *
 YESTERDAY             = datetime.strftime(datetime.now(timezone('Asia/Seoul')) - timedelta(1)  , "%Y%m%d") # Yesterday (Format:"YYYYMMDD")
@@ -70,41 +113,86 @@ ALL_STOCKS_KR = KOSPI_ITEMS + KOSDAQ_ITEMS + KONEX_ITEMS
 # The number of Maximum Corporations in Korea
 ALL_CORPS = 160000
 
+# Search conditions of enrichment (get_financials_kr, Both "company" and "bulk" modes)
+# Every dataset is bounded to one snapshot (basDt) or business year (bizYear); without a bound, bulk mode pages through the whole history
+BULK_ENRICHMENT_PARAMS = {
+    "corp_outline"     : {"basDt": PREVIOUS_BUSINESS_DAY},
+    "stoc_issu_stat"   : {"basDt": PREVIOUS_BUSINESS_DAY},
+    "item_basi_info"   : {"basDt": PREVIOUS_BUSINESS_DAY},
+    "summ_fina_stat"   : {"bizYear": LAST_YEAR},
+    "stock_price_info" : {"basDt": PREVIOUS_BUSINESS_DAY},
+}
+
+# KRX Holidays (휴장일)
+# Fixed solar holidays (MMDD): 신정, 삼일절, 근로자의 날, 어린이날, 현충일, 광복절, 개천절, 성탄절
+KRX_FIXED_HOLIDAYS = ["0101", "0301", "0501", "0505", "0606", "0815", "1003", "1225"]
+# Other holidays on weekdays (YYYYMMDD): 설날, 추석, 부처님오신날, 선거일, 대체공휴일, 임시공휴일, 식목일(~2005), 제헌절(~2007, 2026~) 등
+# https://global.krx.co.kr/contents/GLB/05/0501/0501110000/GLB0501110000.jsp (KRX Market Holidays; Add new years as they are announced)
+KRX_HOLIDAYS = [
+    "20000204", "20000405", "20000413", "20000511", "20000717", "20000911", "20000912", "20000913", # 2000: 설날, 식목일, 국회의원 선거일, 부처님오신날, 제헌절, 추석
+    "20010123", "20010124", "20010125", "20010405", "20010717", "20011001", "20011002", # 2001: 설날, 식목일, 제헌절, 추석
+    "20020211", "20020212", "20020213", "20020405", "20020613", "20020701", "20020717", "20020920", "20021219", # 2002: 설날, 식목일, 지방선거일, 월드컵 4강 임시공휴일, 제헌절, 추석, 대통령 선거일
+    "20030131", "20030508", "20030717", "20030910", "20030911", "20030912", # 2003: 설날, 부처님오신날, 제헌절, 추석
+    "20040121", "20040122", "20040123", "20040405", "20040415", "20040526", "20040927", "20040928", "20040929", # 2004: 설날, 식목일, 국회의원 선거일, 부처님오신날, 추석
+    "20050208", "20050209", "20050210", "20050405", "20050919", # 2005: 설날, 식목일, 추석
+    "20060130", "20060531", "20060717", "20061005", "20061006", # 2006: 설날, 지방선거일, 제헌절, 추석
+    "20070219", "20070524", "20070717", "20070924", "20070925", "20070926", "20071219", # 2007: 설날, 부처님오신날, 제헌절, 추석, 대통령 선거일
+    "20080206", "20080207", "20080208", "20080409", "20080512", "20080915", # 2008: 설날, 국회의원 선거일, 부처님오신날, 추석
+    "20090126", "20090127", "20091002", # 2009: 설날, 추석
+    "20100215", "20100521", "20100602", "20100921", "20100922", "20100923", # 2010: 설날, 부처님오신날, 지방선거일, 추석
+    "20110202", "20110203", "20110204", "20110510", "20110912", "20110913", # 2011: 설날, 부처님오신날, 추석
+    "20120123", "20120124", "20120411", "20120528", "20121001", "20121219", # 2012: 설날, 국회의원 선거일, 부처님오신날, 추석, 대통령 선거일
+    "20130211", "20130517", "20130918", "20130919", "20130920", # 2013: 설날, 부처님오신날, 추석
+    "20140130", "20140131", "20140506", "20140604", "20140908", "20140909", "20140910", # 2014: 설날, 부처님오신날, 지방선거일, 추석, 대체공휴일
+    "20150218", "20150219", "20150220", "20150525", "20150814", "20150928", "20150929", # 2015: 설날, 부처님오신날, 임시공휴일, 추석, 대체공휴일
+    "20160208", "20160209", "20160210", "20160413", "20160506", "20160914", "20160915", "20160916", # 2016: 설날, 대체공휴일, 국회의원 선거일, 임시공휴일, 추석
+    "20170127", "20170130", "20170503", "20170509", "20171002", "20171004", "20171005", "20171006", # 2017: 설날, 대체공휴일, 부처님오신날, 대통령 선거일, 임시공휴일, 추석
+    "20180215", "20180216", "20180507", "20180522", "20180613", "20180924", "20180925", "20180926", # 2018: 설날, 대체공휴일, 부처님오신날, 지방선거일, 추석
+    "20190204", "20190205", "20190206", "20190506", "20190912", "20190913", # 2019: 설날, 대체공휴일, 추석
+    "20200124", "20200127", "20200415", "20200430", "20200817", "20200930", "20201001", "20201002", # 2020: 설날, 대체공휴일, 국회의원 선거일, 부처님오신날, 임시공휴일, 추석
+    "20210211", "20210212", "20210519", "20210816", "20210920", "20210921", "20210922", "20211004", "20211011", # 2021: 설날, 부처님오신날, 대체공휴일, 추석
+    "20220131", "20220201", "20220202", "20220309", "20220601", "20220909", "20220912", "20221010", # 2022: 설날, 대통령 선거일, 지방선거일, 추석, 대체공휴일
+    "20230123", "20230124", "20230529", "20230928", "20230929", "20231002", # 2023: 설날, 대체공휴일, 추석, 임시공휴일
+    "20240209", "20240212", "20240410", "20240506", "20240515", "20240916", "20240917", "20240918", "20241001", # 2024: 설날, 대체공휴일, 국회의원 선거일, 부처님오신날, 추석, 국군의 날
+    "20250127", "20250128", "20250129", "20250130", "20250303", "20250506", "20250603", "20251006", "20251007", "20251008", # 2025: 임시공휴일, 설날, 대체공휴일, 대통령 선거일, 추석
+    "20260216", "20260217", "20260218", "20260302", "20260525", "20260603", "20260717", "20260817", "20260924", "20260925", "20261005", # 2026: 설날, 대체공휴일, 지방선거일, 제헌절, 추석
+]
+
 # Tickers of World Indexes
-WORLD_INDEX_TICKERS = [ {'ticker':'^GSPC', 'country':'US', 'index':'S&P 500'},
-                        '^DJI',       # Dow Jones Industrial Average (US)
-                        '^IXIC',      # NASDAQ Composite (US)
-                        '^NYA',       # NYSE COMPOSITE (DJ) (US)
-                        '^XAX',       # NYSE AMEX COMPOSITE INDEX (US)
-                        '^BUK100P',   # Cboe UK 100 (UK)
-                        '^RUT',       # Russell 2000 (US)
-                        '^VIX',       # Vix (US)
-                        '\^FTSE',     # FTSE 100 (UK)
-                        '^GDAXI',     # DAX PERFORMANCE-INDEX (Germany)	
-                        '^FCHI',      # CAC 40 (France)
-                        '^STOXX50E',  # ESTX 50 PR.EUR (Europe)
-                        '^N100',      # Euronext 100 Index (France)
-                        '^BFX',	      # BEL 20 (Belgium)
-                        'IMOEX.ME',	  # MOEX Russia Index (Russia)
-                        '^N225',	  # Nikkei 225 (Japan)
-                        '^HSI',	      # HANG SENG INDEX (Taiwan)
-                        '000001.SS',  # SSE Composite Index (China)
-                        '399001.SZ',  # Shenzhen Index (China)
-                        '\^STI',       # STI Index (Singapore)
-                        '^AXJO',      # S&P/ASX 200 (Australia)
-                        '^AORD',      # ALL ORDINARIES (Australia)	
-                        '^BSESN',     # S&P BSE SENSEX (India)
-                        '^JKSE',      # Jakarta Composite Index (Indonesia)
-                        '\^KLSE',      # FTSE Bursa Malaysia KLCI (Malaysia)
-                        '^NZ50',      # S&P/NZX 50 INDEX GROSS (New Zealand)
-                        '^KS11',      # KOSPI Composite Index (Korea)
-                        '^TWII',      # TSEC weighted index (Taiwan)
-                        '^GSPTSE',    # S&P/TSX Composite index (Canada)
-                        '^BVSP',      # IBOVESPA (Brazil)
-                        '^MXX',       # IPC MEXICO (Mexico)
-                        '^IPSA',      # S&P/CLX IPSA (Chile)
-                        '^MERV',      # MERVAL (Argentina)
-                        '^TA125.TA',  # TA-125 (Israel)
-                        '^CASE30',    # EGX 30 Price Return Index (Egypt)
-                        '^JN0U.JO',   # Top 40 USD Net TRI Index (Republic of South Africa)
+WORLD_INDEX_TICKERS = [ {'ticker':'^GSPC',      'nation':'US',                       'name':'S&P 500'},
+                        {'ticker':'^DJI',       'nation':'US',                       'name':'Dow Jones Industrial Average'},
+                        {'ticker':'^IXIC',      'nation':'US',                       'name':'NASDAQ Composite'},
+                        {'ticker':'^NYA',       'nation':'US',                       'name':'NYSE COMPOSITE (DJ)'},
+                        {'ticker':'^XAX',       'nation':'US',                       'name':'NYSE AMEX COMPOSITE INDEX'},
+                        {'ticker':'^BUK100P',   'nation':'UK',                       'name':'Cboe UK 100'},
+                        {'ticker':'^RUT',       'nation':'US',                       'name':'Russell 2000'},
+                        {'ticker':'^VIX',       'nation':'US',                       'name':'Vix'},
+                        {'ticker':'^FTSE',      'nation':'UK',                       'name':'FTSE 100'},
+                        {'ticker':'^GDAXI',     'nation':'Germany',                  'name':'DAX PERFORMANCE-INDEX'},
+                        {'ticker':'^FCHI',      'nation':'France',                   'name':'CAC 40'},
+                        {'ticker':'^STOXX50E',  'nation':'Europe',                   'name':'ESTX 50 PR.EUR'},
+                        {'ticker':'^N100',      'nation':'France',                   'name':'Euronext 100 Index'},
+                        {'ticker':'^BFX',       'nation':'Belgium',                  'name':'BEL 20'},
+                        {'ticker':'IMOEX.ME',   'nation':'Russia',                   'name':'MOEX Russia Index'},
+                        {'ticker':'^N225',      'nation':'Japan',                    'name':'Nikkei 225'},
+                        {'ticker':'^HSI',       'nation':'Hong Kong',                'name':'HANG SENG INDEX'},
+                        {'ticker':'000001.SS',  'nation':'China',                    'name':'SSE Composite Index'},
+                        {'ticker':'399001.SZ',  'nation':'China',                    'name':'Shenzhen Index'},
+                        {'ticker':'^STI',       'nation':'Singapore',                'name':'STI Index'},
+                        {'ticker':'^AXJO',      'nation':'Australia',                'name':'S&P/ASX 200'},
+                        {'ticker':'^AORD',      'nation':'Australia',                'name':'ALL ORDINARIES'},
+                        {'ticker':'^BSESN',     'nation':'India',                    'name':'S&P BSE SENSEX'},
+                        {'ticker':'^JKSE',      'nation':'Indonesia',                'name':'Jakarta Composite Index'},
+                        {'ticker':'^KLSE',      'nation':'Malaysia',                 'name':'FTSE Bursa Malaysia KLCI'},
+                        {'ticker':'^NZ50',      'nation':'New Zealand',              'name':'S&P/NZX 50 INDEX GROSS'},
+                        {'ticker':'^KS11',      'nation':'Korea',                    'name':'KOSPI Composite Index'},
+                        {'ticker':'^TWII',      'nation':'Taiwan',                   'name':'TSEC weighted index'},
+                        {'ticker':'^GSPTSE',    'nation':'Canada',                   'name':'S&P/TSX Composite index'},
+                        {'ticker':'^BVSP',      'nation':'Brazil',                   'name':'IBOVESPA'},
+                        {'ticker':'^MXX',       'nation':'Mexico',                   'name':'IPC MEXICO'},
+                        {'ticker':'^IPSA',      'nation':'Chile',                    'name':'S&P/CLX IPSA'},
+                        {'ticker':'^MERV',      'nation':'Argentina',                'name':'MERVAL'},
+                        {'ticker':'^TA125.TA',  'nation':'Israel',                   'name':'TA-125'},
+                        {'ticker':'^CASE30',    'nation':'Egypt',                    'name':'EGX 30 Price Return Index'},
+                        {'ticker':'^JN0U.JO',   'nation':'Republic of South Africa', 'name':'Top 40 USD Net TRI Index'},
 ]
\ No newline at end of file
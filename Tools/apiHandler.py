@@ -14,33 +14,164 @@
 # import FinanceDataReader     as fdr
 import pandas_datareader     as pdr
 import pandas                as pd
+import os
+import re
 import time
 import sys
 
+from concurrent.futures import ThreadPoolExecutor
+from itertools          import islice
+
 from apiConfig       import *
 from dataManipulator import *
+from dataSchema      import *
+from tradingCalendar import *
+from crawlJournal    import *
+from tickerRegistry  import *
+from idCrosswalk     import *
 
 
 
 # * * *   Functions   * * *
 
-def get_world_index(indexNm:str=None, startDt:str="20000101", endDt:str=YESTERDAY):
-    
+def get_world_index_info(indexNm:str):
+    """
+    WORLD_INDEX_TICKERS에서 Ticker 또는 지수명이 indexNm인 지수 정보를 반환한다. (없으면 None)
+
+    [Returns]
+    index_info : 지수 정보 (dict; ticker, nation, name)
+    """
+
+    for index_info in WORLD_INDEX_TICKERS:
+        if indexNm == index_info["ticker"] or indexNm == index_info["name"]:
+            return index_info
+
+    return None
+
+def _read_world_index(ticker:str, startDt:str, endDt:str, dataReader=None, useCache:bool=True):
+    # Default Data Source: Yahoo Finance
+    if dataReader is None:
+        dataReader = lambda ticker, start, end: pdr.DataReader(ticker, "yahoo", start, end)
+
+    def read(start, end):
+        return dataReader(ticker, datetime.strptime(start, "%Y%m%d"), datetime.strptime(end, "%Y%m%d"))
+
+    if not useCache:
+        return read(startDt, endDt)
+
+    # Local Cache: <ticker>_<startDt>_<lastDt>.parquet (The requested start and the last date actually returned)
+    cache_name = re.sub(r"[^0-9A-Za-z]+", "_", ticker).strip("_")
+    cache_path = None
+    for file_name in os.listdir(WORLD_INDEX_CACHE_PATH):
+        match = re.fullmatch(re.escape(cache_name) + r"_(\d{8})_(\d{8})\.parquet", file_name)
+        if match is not None:
+            cache_path, cached_start, cached_end = os.path.join(WORLD_INDEX_CACHE_PATH, file_name), match.group(1), match.group(2)
+            break
+
+    # Hit
+    if cache_path is not None and cached_start <= startDt and endDt <= cached_end:
+        df = pd.read_parquet(cache_path)
+        return df.loc[startDt:endDt]
+
+    # Incremental (Only the days after the cached range)
+    if cache_path is not None and cached_start <= startDt:
+        cached_df = pd.read_parquet(cache_path)
+        new_start = datetime.strftime(datetime.strptime(cached_end, "%Y%m%d") + timedelta(1), "%Y%m%d")
+        df        = pd.concat([cached_df, read(new_start, endDt)])
+        df        = df[~df.index.duplicated(keep="last")].sort_index()
+        new_start = cached_start
+    # Miss (Nothing cached, or the cached range starts later)
+    else:
+        new_start = startDt
+        df        = read(startDt, max(endDt, cached_end) if cache_path is not None else endDt)
+
+    # Nothing returned yet (Not cached, so the next call asks again)
+    if len(df) == 0:
+        return df
+
+    # Store (Write a new file, then remove the old one)
+    # The end of the range is the last date returned; days not yet published are fetched again next time
+    new_end  = pd.Timestamp(df.index.max()).strftime("%Y%m%d")
+    new_path = os.path.join(WORLD_INDEX_CACHE_PATH, f"{cache_name}_{new_start}_{new_end}.parquet")
+    df.to_parquet(new_path + ".tmp")
+    os.replace(new_path + ".tmp", new_path)
+    if cache_path is not None and cache_path != new_path:
+        os.remove(cache_path)
+
+    return df.loc[startDt:endDt]
+
+def get_world_index(indexNm:str=None, startDt:str="20000101", endDt:str=YESTERDAY, field:str="Close", wide:bool=True, numWorkers:int=MAX_WORKERS_API_CALL, dataReader=None, useCache:bool=True):
+    """
+    세계 주요 주가 지수의 일별 OHLCV(Open, High, Low, Close, Volume) 데이터를 반환한다.
+    indexNm이 없으면 WORLD_INDEX_TICKERS의 모든 지수를 동시에 조회하여 하나의 DataFrame으로 정렬한다.
+    조회한 지수는 WORLD_INDEX_CACHE_PATH에 지수별로 저장되며, 다시 조회할 때는 저장된 기간 이후만 요청한다.
+
+    [Parameters]
+    indexNm    (str)      : 조회할 지수의 Ticker 또는 지수명 (Default: None; 전체 지수)
+    startDt    (str)      : 조회할 데이터의 시작 일자 (YYYYMMDD) (Default: "20000101")
+    endDt      (str)      : 조회할 데이터의 종료 일자 (YYYYMMDD) (Default: YESTERDAY)
+    field      (str)      : 전체 지수 조회 시 wide 형식으로 정렬할 필드 (Default: "Close")
+    wide       (bool)     : 전체 지수 조회 시 반환 형식 (Default: True)
+                            True  : 일자 x Ticker의 field 값 (pandas.DataFrame)
+                            False : 일자, ticker(category), nation, name, OHLCV 필드를 갖는 long 형식 (pandas.DataFrame)
+    numWorkers (int)      : 동시에 조회할 지수 수 (Default: MAX_WORKERS_API_CALL)
+    dataReader (function) : (ticker, start, end) -> DataFrame 형식의 데이터 소스 (Default: None; pandas_datareader의 Yahoo Finance)
+    useCache   (bool)     : 지수별 로컬 캐시 사용 여부 (Default: True)
+
+    [Returns]
+    pandas.DataFrame : 세계 주요 주가 지수의 일별 데이터 (조회에 실패한 지수는 제외, 단일 지수 조회 실패 시 None)
+    """
+
+    if useCache:
+        os.makedirs(WORLD_INDEX_CACHE_PATH, exist_ok=True)
+
     # Search Single Index
     if indexNm is not None:
-        if indexNm not in WORLD_INDEX_TICKERS:
+        index_info = get_world_index_info(indexNm)
+        if index_info is None:
             print(f"Fail: Invalid index name {indexNm}")
             return None
-        else:
-            return pdr.DataReader(indexNm, 'yahoo', startDt, endDt)
-    # Search World Indices
-    else:
-        indices = list()
-        for index_info in WORLD_INDEX_TICKERS:
-            item_indices = list(index_info, pdr.DataReader(index_info['ticker'], 'yahoo', datetime(2000,1,1), datetime(2022,9,25)))
-            indices.append(item_indices)
 
-    return indices
+        try:
+            return _read_world_index(index_info["ticker"], startDt, endDt, dataReader, useCache)
+        except Exception as err_msg:
+            print(f"Fail: {index_info['ticker']}", err_msg)
+            return None
+
+    # Search World Indices (Concurrently)
+    def read(index_info):
+        try:
+            return _read_world_index(index_info["ticker"], startDt, endDt, dataReader, useCache)
+        except Exception as err_msg:
+            print(f"Fail: {index_info['ticker']}", err_msg)
+            return None
+
+    with ThreadPoolExecutor(max_workers=max(numWorkers, 1)) as executor:
+        indices = {index_info["ticker"]: df for index_info, df in zip(WORLD_INDEX_TICKERS, executor.map(read, WORLD_INDEX_TICKERS)) if df is not None}
+
+    # Wide: Date x Ticker
+    if wide:
+        return pd.DataFrame({ticker: df[field] for ticker, df in indices.items()}).sort_index()
+
+    # Long: (Date, Ticker) Rows
+    tickers = [index_info["ticker"] for index_info in WORLD_INDEX_TICKERS]
+    frames  = []
+    for index_info in WORLD_INDEX_TICKERS:
+        df = indices.get(index_info["ticker"], None)
+        if df is not None:
+            frames.append(df.assign(ticker=index_info["ticker"], nation=index_info["nation"], name=index_info["name"]))
+
+    if len(frames) == 0:
+        return pd.DataFrame()
+
+    df_long = pd.concat(frames)
+    df_long.index.name = "Date"
+    df_long = df_long.reset_index()
+    df_long["ticker"] = pd.Categorical(df_long["ticker"], categories=tickers)
+    df_long["nation"] = df_long["nation"].astype("category")
+    df_long["name"]   = df_long["name"].astype("category")
+
+    return df_long.sort_values(["Date", "ticker"], kind="stable").reset_index(drop=True)
 
 def get_krx_series_daily_price(serviceKey:str, basDd:str=PREVIOUS_BUSINESS_DAY):
     """
@@ -838,6 +969,62 @@ def get_carbon_credit_market_daily_trading(serviceKey:str, basDd:str=PREVIOUS_BU
     # Request
     return request_data_to_api(URL_CARBON_CREDIT_MARKET_DAILY_TRADING, query_params)
 
+def get_krx_daily_backfill(getter, serviceKey:str, startDd:str, endDd:str=PREVIOUS_BUSINESS_DAY, tradingDays=None, existingDd=(), numWorkers:int=MAX_WORKERS_API_CALL, decode:bool=True):
+    """
+    KRX 일별 API(get_kospi_daily_trading, get_etf_daily_trading 등)를 기간 단위로 조회하여 하나의 DataFrame으로 반환한다.
+    영업일에 대해서만 요청하며, 이미 보유한 일자(existingDd)는 건너뛴다. 호스트별 호출 간격은 http_get이 제한한다.
+    조회에 실패한(getter가 None을 반환한) 일자는 출력하고 df.attrs["failedDd"]에 기록하므로, 호출하는 쪽에서 다시 조회할 수 있다.
+
+    [Parameters]
+    getter      (function)     : basDd를 인자로 받는 KRX 일별 조회 함수 (Mandatory)
+    serviceKey  (str)          : 한국거래소 정보데이터시스템 Open API에서 인가받은 인증키 (Mandatory)
+    startDd     (str)          : 시작일자 (YYYYMMDD) (Mandatory)
+    endDd       (str)          : 종료일자 (YYYYMMDD, 포함) (Default: PREVIOUS_BUSINESS_DAY)
+    tradingDays (iterable str) : KRX 영업일 목록 (YYYYMMDD) (Default: None; get_krx_trading_days(startDd, endDd))
+    existingDd  (iterable str) : 이미 보유하여 조회하지 않을 일자 목록 (YYYYMMDD) (Default: ())
+    numWorkers  (int)          : 동시에 조회할 일자 수 (Default: MAX_WORKERS_API_CALL)
+    decode      (bool)         : API_SCHEMAS에 따라 숫자, 날짜, 범주형 dtype으로 변환할지 여부 (Default: True)
+
+    [Returns]
+    df : 기간 내 조회 결과 (pandas.DataFrame, BAS_DD 오름차순, 조회 결과가 없으면 빈 DataFrame)
+         df.attrs["failedDd"] : 조회에 실패한 일자 목록 (list of str, YYYYMMDD)
+    """
+
+    if tradingDays is None:
+        tradingDays = get_krx_trading_days(startDd, endDd)
+
+    # Missing Business Days
+    existingDd   = set(existingDd)
+    missing_days = sorted(basDd for basDd in set(tradingDays) if startDd <= basDd <= endDd and basDd not in existingDd)
+
+    failed_days = []
+
+    def fetch(basDd):
+        items = getter(serviceKey=serviceKey, basDd=basDd)
+        if items is None:
+            failed_days.append(basDd) # Not stored; retried by the next backfill
+            return []
+
+        # Some endpoints (e.g. 종목기본정보) have no BAS_DD field
+        for item in items:
+            item.setdefault("BAS_DD", basDd)
+
+        return items
+
+    with ThreadPoolExecutor(max_workers=max(numWorkers, 1)) as executor:
+        records = [item for items in executor.map(fetch, missing_days) for item in items]
+
+    if len(failed_days) > 0:
+        failed_days.sort()
+        print(f"Fail: {getter.__name__} ({len(failed_days)} days: {', '.join(failed_days[:10])}{' ...' if len(failed_days) > 10 else ''})")
+
+    # Typed Columns (Schema of the getter: get_<endpoint>)
+    schema = API_SCHEMAS.get(getter.__name__[len("get_"):], None)
+    df     = decode_items(records, schema) if decode and schema is not None else pd.DataFrame.from_records(records)
+
+    df.attrs["failedDd"] = failed_days
+    return df
+
 def get_corp_outline(serviceKey:str, pageNo=1, numOfRows=1, resultType="json", basDt="", crno="", corpNm=""):
     """
     금융위원회_기업기본정보_기업개요조회 검색 결과를 반환한다.
@@ -904,12 +1091,12 @@ def get_corp_outline(serviceKey:str, pageNo=1, numOfRows=1, resultType="json", b
     }
 
     # Request
-    response_corp_outline = requests.get(set_query_url(service_url=URL_CORP_OUTLINE, params=query_params_corp_outline))
+    response_corp_outline = http_get(set_query_url(service_url=URL_CORP_OUTLINE, params=query_params_corp_outline))
 
     # Parsing
     try:
-        header = json.loads(response_corp_outline.text)["response"]["header"]
-        body = json.loads(response_corp_outline.text)["response"]["body"]
+        header = json.loads(response_corp_outline)["response"]["header"]
+        body = json.loads(response_corp_outline)["response"]["body"]
         item = body["items"]["item"] # Information of each corporation
     except:
         return None
@@ -964,12 +1151,12 @@ def get_stoc_issu_stat(serviceKey:str, pageNo=1, numOfRows=1, resultType="json",
     }
 
     # Request
-    response_stoc_issu_stat = requests.get(set_query_url(service_url=URL_STOC_ISSU_STAT, params=query_params_stoc_issu_stat))
+    response_stoc_issu_stat = http_get(set_query_url(service_url=URL_STOC_ISSU_STAT, params=query_params_stoc_issu_stat))
 
     # Parsing
     try:
-        header = json.loads(response_stoc_issu_stat.text)["response"]["header"]
-        body = json.loads(response_stoc_issu_stat.text)["response"]["body"]
+        header = json.loads(response_stoc_issu_stat)["response"]["header"]
+        body = json.loads(response_stoc_issu_stat)["response"]["body"]
         item = body["items"]["item"] # Information of each stock items
     except:
         return None
@@ -1045,12 +1232,12 @@ def get_krx_listed_info(serviceKey:str, pageNo=1, numOfRows=1, resultType="json"
     }
 
     # Request
-    response_krx_listed_info = requests.get(set_query_url(service_url=URL_KRX_LISTED_INFO, params=query_params_krx_listed_info))
+    response_krx_listed_info = http_get(set_query_url(service_url=URL_KRX_LISTED_INFO, params=query_params_krx_listed_info))
 
     # Parsing
     try:
-        header = json.loads(response_krx_listed_info.text)["response"]["header"]
-        body = json.loads(response_krx_listed_info.text)["response"]["body"]
+        header = json.loads(response_krx_listed_info)["response"]["header"]
+        body = json.loads(response_krx_listed_info)["response"]["body"]
         item = body["items"]["item"] # Information of each stock items
     except:
         return None
@@ -1141,12 +1328,12 @@ def get_item_basi_info(serviceKey:str, pageNo=1, numOfRows=1, resultType="json",
     }
 
     # Request
-    response_item_basi_info = requests.get(set_query_url(service_url=URL_ITEM_BASI_INFO, params=query_params_item_basi_info))
+    response_item_basi_info = http_get(set_query_url(service_url=URL_ITEM_BASI_INFO, params=query_params_item_basi_info))
 
     # Parsing
     try:
-        header = json.loads(response_item_basi_info.text)["response"]["header"]
-        body = json.loads(response_item_basi_info.text)["response"]["body"]
+        header = json.loads(response_item_basi_info)["response"]["header"]
+        body = json.loads(response_item_basi_info)["response"]["body"]
         item = body["items"]["item"] # Information of each corporation
     except:
         return None
@@ -1214,12 +1401,12 @@ def get_summ_fina_stat(serviceKey:str, pageNo=1, numOfRows=2, resultType="json",
     }
     
     # Request
-    response_summ_fina_stat = requests.get(set_query_url(service_url=URL_SUMM_FINA_STAT, params=query_params_summ_fina_stat))
+    response_summ_fina_stat = http_get(set_query_url(service_url=URL_SUMM_FINA_STAT, params=query_params_summ_fina_stat))
 
     # Parsing
     try:
-        header = json.loads(response_summ_fina_stat.text)["response"]["header"]
-        body = json.loads(response_summ_fina_stat.text)["response"]["body"]
+        header = json.loads(response_summ_fina_stat)["response"]["header"]
+        body = json.loads(response_summ_fina_stat)["response"]["body"]
         item = body["items"]["item"] # Information of each corporation
     except:
         return None
@@ -1295,11 +1482,11 @@ def get_issuco_basic_info(serviceKey:str, issucoCustno=""):
     }
 
     # Request
-    response_issuco_basic_info = requests.get(set_query_url(service_url=URL_ISSUCO_BASIC_INFO, params=query_params_issuco_basic_info))
+    response_issuco_basic_info = http_get(set_query_url(service_url=URL_ISSUCO_BASIC_INFO, params=query_params_issuco_basic_info))
 
     # Parsing
     try:
-        root = ET.fromstring(response_issuco_basic_info.text)
+        root = ET.fromstring(response_issuco_basic_info)
         header = root.find("header")
         body = root.find("body")
     except:
@@ -1346,11 +1533,11 @@ def get_issuco_custno_by_short_isin(serviceKey:str, shortIsin:str):
     }
 
     # Request
-    response_issuco_custno_by_short_isin = requests.get(set_query_url(service_url=URL_ISSUCO_CUSTNO_BY_SHORT_ISIN, params=query_params_issuco_custno_by_short_isin))
+    response_issuco_custno_by_short_isin = http_get(set_query_url(service_url=URL_ISSUCO_CUSTNO_BY_SHORT_ISIN, params=query_params_issuco_custno_by_short_isin))
 
     # Parsing
     try:
-        root = ET.fromstring(response_issuco_custno_by_short_isin.text)
+        root = ET.fromstring(response_issuco_custno_by_short_isin)
         header = root.find("header")
         body = root.find("body")
         items = body.find("item") # Information of each index item
@@ -1373,74 +1560,295 @@ def get_issuco_custno_by_short_isin(serviceKey:str, shortIsin:str):
 
     return item
 
-def get_financials_kr(serviceKey:str, numOfRow:int=ALL_STOCKS_KR):
-    list_financial_data = []
+def resolve_issuco_custno(serviceKey:str, shortIsin:str):
+    """
+    shortIsin(종목코드)의 발행회사번호 정보를 IdCrosswalk에서 찾고, 없으면 get_issuco_custno_by_short_isin으로 조회하여 기록한다.
+    Crosswalk에 기록된 종목은 네트워크 요청 없이 반환된다.
+
+    [Returns]
+    item : get_issuco_custno_by_short_isin의 item과 같음 (dict, 조회 결과가 없으면 None)
+    """
+
+    crosswalk = get_id_crosswalk()
+
+    item = crosswalk.get_issuco_custno(shortIsin)
+    if item is not None:
+        return item
+
+    item = get_issuco_custno_by_short_isin(serviceKey=serviceKey, shortIsin=shortIsin)
+    if item is not None and item.get("issucoCustno", None) is not None:
+        crosswalk.put_issuco_custno(shortIsin, item)
+
+    return item
+
+def update_id_crosswalk(serviceKey:str, basDt:str=PREVIOUS_BUSINESS_DAY, resolveIssuco:bool=True, numWorkers:int=MAX_WORKERS_API_CALL):
+    """
+    basDt의 KRX상장종목정보로 IdCrosswalk를 갱신한다. (이미 basDt 이후로 갱신했으면 요청하지 않는다.)
+    resolveIssuco이면 발행회사번호가 기록되지 않은 종목만 get_issuco_custno_by_short_isin으로 조회한다.
 
-    # 금융위원회_KRX상장종목정보
-    # list_financial_data = get_krx_listed_info(serviceKey=serviceKey, numOfRows=ALL_STOCKS_KR)
-    list_financial_data = get_krx_listed_info(serviceKey=serviceKey, numOfRows=numOfRow)
-    list_financial_data = filter_params(list_financial_data, ["srtnCd", "isinCd", "mrktCtg", "itmsNm", "crno", "corpNm", "shotnIsin"])
+    [Parameters]
+    serviceKey    (str)  : 공공데이터 포털에서 받은 인증키 (Mandatory)
+    basDt         (str)  : KRX상장종목정보의 기준일자 (YYYYMMDD) (Default: PREVIOUS_BUSINESS_DAY)
+    resolveIssuco (bool) : 발행회사번호를 조회할지 여부 (Default: True)
+    numWorkers    (int)  : 동시에 조회할 페이지 (발행회사번호는 종목) 수 (Default: MAX_WORKERS_API_CALL)
 
-    item_id = 1
-    for financial_data in list_financial_data:
-        # Logging
-        print("Collecting data for %s" % financial_data["corpNm"])
+    [Returns]
+    crosswalk : 갱신된 Crosswalk (IdCrosswalk)
+    """
 
-        # Give Index
-        financial_data['id'] = item_id
-        item_id += 1
-        
+    crosswalk = get_id_crosswalk()
+
+    # 금융위원회_KRX상장종목정보 (New or changed securities only)
+    refreshed_date = crosswalk.get_refreshed_date()
+    if refreshed_date is None or refreshed_date < basDt:
+        inserted, updated = crosswalk.refresh(iter_krx_listed_info(serviceKey=serviceKey, numWorkers=numWorkers, basDt=basDt), basDt=basDt)
+        print(f"Crosswalk: {inserted} inserted, {updated} updated ({basDt})")
+
+    # 한국예탁결제원_기업정보서비스: 단축번호로 발행회사번호 조회 (Unresolved securities only)
+    if resolveIssuco:
+        df = crosswalk.to_frame()
+        unresolved = df.loc[df["issucoCustno"].isna() & df["shotnIsin"].notna(), "shotnIsin"].unique()
+        with ThreadPoolExecutor(max_workers=max(numWorkers, 1)) as executor:
+            list(executor.map(lambda shortIsin: resolve_issuco_custno(serviceKey, shortIsin), unresolved))
+
+    return crosswalk
+
+def _enrich_financial_data(serviceKey:str, financial_data:dict, journal:CrawlJournal=None):
+    """
+    KRX상장종목정보 한 건(financial_data)에 기업개요, 발행회사정보, 주식발행현황, 종목기본정보, 요약재무제표, 주식시세를 병합한다.
+    같은 종목에 대한 조회는 순서대로 수행되며 (발행회사번호 -> 발행회사 기본정보), 호스트별 호출 속도는 http_get이 제한한다.
+    데이터셋별 검색 조건(기준일자, 사업연도)은 BULK_ENRICHMENT_PARAMS를 사용하므로 _enrich_financial_data_bulk와 같은 결과를 만든다.
+    journal이 주어지면 완료된 조회의 결과를 기록하고, 이미 기록된 조회는 다시 요청하지 않는다.
+    모든 조회가 끝난 종목만 완료로 기록되므로, 오류로 중단된 종목은 다음 실행에서 중단된 조회부터 이어서 수집한다.
+
+    [Returns]
+    completed : 모든 조회가 오류 없이 끝났는지 여부 (bool)
+    """
+
+    company = financial_data.get("isinCd", None) or financial_data.get("srtnCd", None)
+
+    def step(name, call):
+        if journal is not None:
+            found, result = journal.get_step(company, name)
+            if found:
+                return result
+
+        result = call()
+
+        if journal is not None:
+            journal.put_step(company, name, result)
+
+        return result
+
+    # Logging
+    print("Collecting data for %s" % financial_data["corpNm"])
+
+    try:
+        # 금융위원회_기업기본정보: 기업개요조회
+        if financial_data.get("crno", None) is not None:
+            corp_outline = step("corp_outline", lambda: get_corp_outline(serviceKey=serviceKey, crno=financial_data["crno"], **BULK_ENRICHMENT_PARAMS["corp_outline"]))
+            if corp_outline is not None:
+                financial_data.update(corp_outline[0])
+
+        # 한국예탁결제원_기업정보서비스: 기업기본정보 기업개요 조회
+        if financial_data.get("shotnIsin", None) is not None:
+            issucoCustno = step("issuco_custno", lambda: resolve_issuco_custno(serviceKey, financial_data["shotnIsin"]))
+            if issucoCustno is not None and issucoCustno.get("issucoCustno", None) is not None:
+                issuco_basic_info = step("issuco_basic_info", lambda: get_issuco_basic_info(serviceKey=serviceKey, issucoCustno=issucoCustno["issucoCustno"]))
+                if issuco_basic_info is not None:
+                    financial_data.update(issuco_basic_info)
+
+        # 금융위원회_주식발행정보: 주식발행현황조회
+        if financial_data.get("crno", None) is not None:
+            stoc_issu_stat = step("stoc_issu_stat", lambda: get_stoc_issu_stat(serviceKey=serviceKey, crno=financial_data["crno"], **BULK_ENRICHMENT_PARAMS["stoc_issu_stat"]))
+            if stoc_issu_stat is not None:
+                financial_data.update(stoc_issu_stat[0])
+
+        # 금융위원회_주식발행정보: 종목기본정보조회
+        if financial_data.get("crno", None) is not None:
+            item_basi_info = step("item_basi_info", lambda: get_item_basi_info(serviceKey=serviceKey, crno=financial_data["crno"], **BULK_ENRICHMENT_PARAMS["item_basi_info"]))
+            if item_basi_info is not None:
+                financial_data.update(item_basi_info[0])
+
+        # 금융위윈회_기업 재무정보: 요약재무제표조회
+        if financial_data.get("crno", None) is not None:
+            summ_fina_stat = step("summ_fina_stat", lambda: get_summ_fina_stat(serviceKey=serviceKey, numOfRows="", crno=financial_data["crno"], type="ALL", **BULK_ENRICHMENT_PARAMS["summ_fina_stat"]))
+            if summ_fina_stat is not None:
+                financial_data.update(summ_fina_stat[0])
+
+        # 금융위원회_주식시세정보: 주식시세
+        if financial_data.get("isinCd", None) is not None:
+            stock_price_info = step("stock_price_info", lambda: get_stock_price_info(serviceKey=serviceKey, isinCd=financial_data["isinCd"], **BULK_ENRICHMENT_PARAMS["stock_price_info"]))
+            if stock_price_info is not None:
+                financial_data.update(stock_price_info)
+    except Exception as err_msg:
+        print("Error Detected:", err_msg)
+        return False
+
+    if journal is not None:
+        journal.put_company(company, financial_data)
+
+    return True
+
+def _enrich_financial_data_bulk(serviceKey:str, list_financial_data:list, numWorkers:int=MAX_WORKERS_API_CALL, bulkParams:dict=None):
+    """
+    KRX상장종목정보 전체(list_financial_data)에 기업개요, 주식발행현황, 종목기본정보, 요약재무제표, 주식시세를 목록 단위로 병합한다.
+    각 데이터셋을 종목 조건(crno, isinCd) 없이 페이지 단위(DATA_GO_KR_PAGE_SIZE)로 한꺼번에 조회한 뒤 crno/isinCd로 병합하므로,
+    종목마다 5번씩 요청하던 조회가 데이터셋별 (전체 건수 / 페이지 크기)번으로 줄어든다.
+    종목별 조회와 같은 검색 조건을 사용하고 페이지 순서대로 첫 번째 결과를 병합하므로(keep="first"), _enrich_financial_data와 같은 결과를 만든다.
+    한국예탁결제원_기업정보서비스(발행회사정보)는 목록 조회가 없으므로 종목별로 조회한다.
+
+    [Parameters]
+    bulkParams (dict) : 데이터셋 이름 -> 검색 조건 (Default: None; BULK_ENRICHMENT_PARAMS, 주어진 데이터셋의 조건만 대체)
+                        (예: {"corp_outline": {"basDt": "20220930"}}로 다른 기준일자의 기업개요를 병합할 수 있다.)
+
+    [Returns]
+    list_financial_data : 종목별 병합 결과 (list of dict, 입력 순서 유지)
+    """
+
+    bulkParams = dict(BULK_ENRICHMENT_PARAMS, **(bulkParams or dict()))
+
+    def fetch(iterator, name):
+        print(f"Running: Bulk {name}")
+        items = list(iterator(serviceKey=serviceKey, numWorkers=numWorkers, ordered=True, **bulkParams.get(name, dict())))
+        if len(items) == 0:
+            print(f"Fail: Bulk {name} has no result ({bulkParams.get(name, dict())})") # e.g. No snapshot on basDt
+        return items
+
+    # 금융위원회_기업기본정보: 기업개요조회
+    list_financial_data = join_by_key(list_financial_data, fetch(iter_corp_outline, "corp_outline"), "crno", keep="first")
+
+    # 한국예탁결제원_기업정보서비스: 기업기본정보 기업개요 조회 (Per company)
+    def enrich_issuco(financial_data):
+        if financial_data.get("shotnIsin", None) is None:
+            return
         try:
-            # 금융위원회_기업기본정보: 기업개요조회
-            if financial_data.get("crno", None) is not None:
-                corp_outline = get_corp_outline(serviceKey=serviceKey, crno=financial_data["crno"])
-                if corp_outline is not None:
-                    financial_data.update(corp_outline[0])
-            time.sleep(INTERVAL_API_CALL)
-
-            # 한국예탁결제원_기업정보서비스: 기업기본정보 기업개요 조회
-            if financial_data.get("shotnIsin", None) is not None:
-                issucoCustno = get_issuco_custno_by_short_isin(serviceKey=serviceKey, shortIsin=financial_data["shotnIsin"])
-                if getattr(issucoCustno, "issucoCustno", None) is not None:
-                    issuco_basic_info = get_issuco_basic_info(serviceKey=serviceKey, issucoCustno=issucoCustno["issucoCustno"])
-                    if issuco_basic_info is not None:
-                        financial_data.update(issuco_basic_info)
-            time.sleep(INTERVAL_API_CALL)
-
-            # 금융위원회_주식발행정보: 주식발행현황조회
-            if financial_data.get("crno", None) is not None:
-                stoc_issu_stat = get_stoc_issu_stat(serviceKey=serviceKey, crno=financial_data["crno"])
-                if stoc_issu_stat is not None:
-                    financial_data.update(stoc_issu_stat[0])
-            time.sleep(INTERVAL_API_CALL)
-
-            # 금융위원회_주식발행정보: 종목기본정보조회
-            if financial_data.get("crno", None) is not None:
-                item_basi_info = get_item_basi_info(serviceKey=serviceKey, crno=financial_data["crno"])
-                if item_basi_info is not None:
-                    financial_data.update(item_basi_info[0])
-            time.sleep(INTERVAL_API_CALL)
-
-            # 금융위윈회_기업 재무정보: 요약재무제표조회
-            if financial_data.get("crno", None) is not None:
-                summ_fina_stat = get_summ_fina_stat(serviceKey=serviceKey, numOfRows="", crno=financial_data["crno"], type="ALL")
-                if summ_fina_stat is not None:
-                    financial_data.update(summ_fina_stat[0])
-            time.sleep(INTERVAL_API_CALL)
-
-            # 금융위원회_주식시세정보: 주식시세
-            if financial_data.get("isinCd", None) is not None:
-                stock_price_info = get_stock_price_info(serviceKey=serviceKey, isinCd=financial_data["isinCd"])
-                if stock_price_info is not None:
-                    financial_data.update(stock_price_info)
-            time.sleep(INTERVAL_API_CALL)
+            issucoCustno = resolve_issuco_custno(serviceKey, financial_data["shotnIsin"])
+            if issucoCustno is not None and issucoCustno.get("issucoCustno", None) is not None:
+                issuco_basic_info = get_issuco_basic_info(serviceKey=serviceKey, issucoCustno=issucoCustno["issucoCustno"])
+                if issuco_basic_info is not None:
+                    financial_data.update(issuco_basic_info)
         except Exception as err_msg:
             print("Error Detected:", err_msg)
-            continue
+
+    with ThreadPoolExecutor(max_workers=max(numWorkers, 1)) as executor:
+        list(executor.map(enrich_issuco, list_financial_data))
+
+    # 금융위원회_주식발행정보: 주식발행현황조회, 종목기본정보조회
+    list_financial_data = join_by_key(list_financial_data, fetch(iter_stoc_issu_stat, "stoc_issu_stat"), "crno", keep="first")
+    list_financial_data = join_by_key(list_financial_data, fetch(iter_item_basi_info, "item_basi_info"), "crno", keep="first")
+
+    # 금융위윈회_기업 재무정보: 요약재무제표조회
+    list_financial_data = join_by_key(list_financial_data, fetch(iter_summ_fina_stat, "summ_fina_stat"), "crno", keep="first")
+
+    # 금융위원회_주식시세정보: 주식시세 (Formatting on Field 'fltRt', Same as get_stock_price_info)
+    stock_price_info = fetch(iter_stock_price_info, "stock_price_info")
+    stock_price_info = [dict(item, fltRt=format_flt_rt(decode_value(item["fltRt"], "float"))) for item in stock_price_info]
+    list_financial_data = join_by_key(list_financial_data, stock_price_info, "isinCd", keep="first")
 
     return list_financial_data
 
-def get_stock_price_info(serviceKey:str, pageNo=1, numOfRows=1, resultType="json", basDt=PREVIOUS_BUSINESS_DAY, beginBasDt="", endBasDt="", likeBasDt="", likeSrtnCd="", isinCd="", likeIsinCd="", itmsNm="", likeItmsNm="", mrktCls="", beginVs="", endVs="", beginFltRt="", endFltRt="", beginTrqu="", endTrqu="", beginTrPrc="", endTrPrc="", beginLstgStCnt="", endLstgStCnt="", beginMrktTotAmt="", endMrktTotAmt=""):
+def _get_listing(serviceKey:str, numOfRow:int):
+    # 금융위원회_KRX상장종목정보 (First numOfRow items in listing order; other fields are dropped while parsing)
+    fields = ["srtnCd", "isinCd", "mrktCtg", "itmsNm", "crno", "corpNm", "shotnIsin"]
+    items  = iter_krx_listed_info(serviceKey=serviceKey, numOfRows=min(numOfRow, DATA_GO_KR_PAGE_SIZE), ordered=True, fields=fields)
+    return list(islice(items, numOfRow))
+
+def get_financials_kr(serviceKey:str, numOfRow:int=ALL_STOCKS_KR, numWorkers:int=1, journalPath:str=None, mode:str="company", bulkParams:dict=None, asFrame:bool=False):
+    """
+    KRX 상장종목별 기업개요, 발행회사정보, 주식발행현황, 종목기본정보, 요약재무제표, 주식시세를 병합하여 반환한다.
+
+    [Parameters]
+    serviceKey  (str) : 공공데이터 포털에서 받은 인증키 (Mandatory)
+    numOfRow    (int) : 조회할 상장종목 수 (Default: ALL_STOCKS_KR (한국시장 전체 종목 수))
+    numWorkers  (int) : 동시에 조회할 종목 수 (Default: 1; 순차 조회, 권장: MAX_WORKERS_API_CALL)
+                        종목 내 조회 순서는 유지되며, 호스트별 호출 속도는 http_get이 제한한다.
+    journalPath (str) : 진행 상황을 기록할 CrawlJournal 파일 경로 (Default: None; 기록하지 않음)
+                        같은 경로로 다시 호출하면 완료된 종목과 조회는 건너뛰고 중단된 지점부터 이어서 수집한다.
+                        (예: get_financials_kr(serviceKey, numWorkers=MAX_WORKERS_API_CALL, journalPath="../Data/financials_kr.journal"))
+    mode        (str) : 병합 방식 (Default: "company")
+                        "company" : 종목마다 데이터셋별로 조회 (journalPath 사용 가능)
+                        "bulk"    : 데이터셋별 전체 목록을 페이지 단위로 조회하여 crno/isinCd로 병합 (_enrich_financial_data_bulk)
+    bulkParams  (dict) : mode="bulk"일 때 데이터셋별 검색 조건 (Default: None; BULK_ENRICHMENT_PARAMS, "company"와 같은 조건)
+    asFrame     (bool) : SCHEMA_FINANCIALS_KR 타입의 pandas.DataFrame으로 반환할지 여부 (Default: False)
+                         종목별 병합이 끝나는 대로 RecordAccumulator의 행에 기록하고 병합에 사용한 dict는 비우므로,
+                         모든 종목의 dict를 끝까지 유지하지 않는다.
+
+    [Returns]
+    list_financial_data : 종목별 병합 결과 (list of dict, KRX상장종목정보 순서 유지, asFrame이면 pandas.DataFrame)
+    """
+
+    if mode not in ("company", "bulk"):
+        raise ValueError(f"Invalid enrichment mode: {mode}")
+
+    # Bulk Mode
+    if mode == "bulk":
+        list_financial_data = _get_listing(serviceKey, numOfRow)
+        get_id_crosswalk().refresh(list_financial_data) # Known securities skip the issucoCustno lookup
+
+        # Give Index
+        for item_id, financial_data in enumerate(list_financial_data, start=1):
+            financial_data['id'] = item_id
+
+        list_financial_data = _enrich_financial_data_bulk(serviceKey, list_financial_data, numWorkers=max(numWorkers, MAX_WORKERS_API_CALL), bulkParams=bulkParams)
+        return RecordAccumulator.from_items(list_financial_data, SCHEMA_FINANCIALS_KR).to_frame() if asFrame else list_financial_data
+
+    journal = CrawlJournal(journalPath) if journalPath is not None else None
+
+    # 금융위원회_KRX상장종목정보 (Resumed crawls keep the listing of the first run)
+    found, list_financial_data = journal.get_step("__listing__", "krx_listed_info") if journal is not None else (False, None)
+    if not found:
+        list_financial_data = _get_listing(serviceKey, numOfRow)
+        get_id_crosswalk().refresh(list_financial_data) # Known securities skip the issucoCustno lookup
+
+        # Give Index
+        for item_id, financial_data in enumerate(list_financial_data, start=1):
+            financial_data['id'] = item_id
+
+        if journal is not None:
+            journal.put_step("__listing__", "krx_listed_info", list_financial_data)
+
+    # Typed Columns (Filled in place by the row of each company)
+    records = RecordAccumulator(SCHEMA_FINANCIALS_KR, len(list_financial_data)) if asFrame else None
+
+    def collect(row, financial_data):
+        if records is not None:
+            records.set(row, financial_data)
+            financial_data.clear()
+
+    # Completed Companies
+    pending_data = []
+    for row, financial_data in enumerate(list_financial_data):
+        completed_data = journal.get_company(financial_data.get("isinCd", None) or financial_data.get("srtnCd", None)) if journal is not None else None
+        if completed_data is not None:
+            financial_data.update(completed_data)
+            collect(row, financial_data)
+        else:
+            pending_data.append((row, financial_data))
+
+    if journal is not None:
+        print("Resuming: %d of %d companies completed" % (len(list_financial_data) - len(pending_data), len(list_financial_data)))
+
+    def enrich(row, financial_data):
+        _enrich_financial_data(serviceKey, financial_data, journal)
+        collect(row, financial_data)
+
+    # Sequential Mode
+    if numWorkers <= 1:
+        for row, financial_data in pending_data:
+            enrich(row, financial_data)
+
+    # Concurrent Mode (Each record is enriched in place, so the order of the list is preserved)
+    else:
+        with ThreadPoolExecutor(max_workers=numWorkers) as executor:
+            list(executor.map(lambda pending: enrich(*pending), pending_data))
+
+    if journal is not None:
+        journal.close()
+
+    return records.to_frame() if records is not None else list_financial_data
+
+def get_stock_price_info(serviceKey:str, pageNo=1, numOfRows=1, resultType="json", basDt=PREVIOUS_BUSINESS_DAY, beginBasDt="", endBasDt="", likeBasDt="", likeSrtnCd="", isinCd="", likeIsinCd="", itmsNm="", likeItmsNm="", mrktCls="", beginVs="", endVs="", beginFltRt="", endFltRt="", beginTrqu="", endTrqu="", beginTrPrc="", endTrPrc="", beginLstgStCnt="", endLstgStCnt="", beginMrktTotAmt="", endMrktTotAmt="", allRows:bool=False):
     """
     금융위원회_주식시세정보: 주식시세 검색 결과를 반환한다.
     * 금융위원회_주식시세정보: 주식시세 (https://www.data.go.kr/tcs/dss/selectApiDataDetailView.do?publicDataPk=15094808)
@@ -1472,6 +1880,9 @@ def get_stock_price_info(serviceKey:str, pageNo=1, numOfRows=1, resultType="json
     endLstgStCnt    (str) : 상장주식수가 검색값보다 작은 데이터를 검색 (Default: "")
     beginMrktTotAmt (str) : 시가총액이 검색값보다 크거나 같은 데이터를 검색 (Default: "")
     endMrktTotAmt   (str) : 시가총액이 검색값보다 작은 데이터를 검색 (Default: "")
+    allRows         (bool): 검색 결과 전체를 pandas.DataFrame으로 반환할지 여부 (Default: False; 첫 번째 결과만 dict로 반환)
+                            True이면 fltRt 등 숫자 필드를 float/Int64로 유지하며, 표시용 문자열은 format_flt_rt로 만든다.
+                            (예: get_stock_price_info(serviceKey, numOfRows=ALL_STOCKS_KR, allRows=True))
 
     [Returns]
     basDt      (string) : 기준일자
@@ -1522,62 +1933,15 @@ def get_stock_price_info(serviceKey:str, pageNo=1, numOfRows=1, resultType="json
     }
 
     # Request
-    response_stock_price_info = requests.get(set_query_url(service_url=URL_STOCK_PRICE_INFO, params=query_params_stock_price_info))
+    response_stock_price_info = http_get(set_query_url(service_url=URL_STOCK_PRICE_INFO, params=query_params_stock_price_info))
 
     # Parsing
-    header = json.loads(response_stock_price_info.text)["response"]["header"]
-    body = json.loads(response_stock_price_info.text)["response"]["body"]
-    item = body["items"]["item"] # Information of each stock item
+    header, body, item = parse_data_go_kr_response(response_stock_price_info) # Information of each stock item
 
     # Assertion
-    if len(item) == 0 or item is None:
+    if len(item) == 0:
         return None
 
-    # Formatting on Field 'fltRt' (전일 대비 등락에 따른 비율)
-    item = item[0]
-    item['fltRt'] = str(item['fltRt'])
-
-    # Case: -d.dd% (Already Complete)
-    if (len(item['fltRt']) == 5):
-        pass
-
-    # Case: -.dd || d.dd || -d.d
-    elif(len(item['fltRt']) == 4):
-        # Case: -.dd
-        if (item['fltRt'][0:2] == "-."):
-            item['fltRt'] = "-0" + item['fltRt'][1:]
-        # Case: d.dd
-        elif (item['fltRt'][0] != "-"):
-            item['fltRt'] = "+" + item['fltRt'][:]
-        # Case: -d.d
-        elif (item['fltRt'][0] == "-"):
-            item['fltRt'] += "0"
-
-    # Case: .dd || -.d || d.d
-    elif(len(item['fltRt']) == 3):
-        # Case: .dd
-        if (item['fltRt'][0] == "."):
-            item['fltRt'] = "+0" + item['fltRt'][:]
-        # Case: -.d
-        elif (item['fltRt'][0:2] == "-."):
-            item['fltRt'] = "-0" + item['fltRt'][1:] + "0"
-        # Case: d.d
-        elif (item['fltRt'][1] == "."):
-            item['fltRt'] = "+" + item['fltRt'][:] + "0"
-                    
-    # Case: .d
-    elif(len(item['fltRt']) == 2):
-        # Case: .d
-        if (item['fltRt'][0] == "."):
-            item['fltRt'] = "+0" + item['fltRt'][:] + "0"
-
-    # Case: 0
-    elif (item['fltRt'] == "0"):
-        item['fltRt'] = "0.00"
-
-    # Add Percentage Symbol
-    item['fltRt'] += "%"
-
     # Print Result to Console (Logging)
     print("Running: Get Stock Price Info")
     print("Result Code : %s" % header["resultCode"])   # 결과코드
@@ -1587,6 +1951,14 @@ def get_stock_price_info(serviceKey:str, pageNo=1, numOfRows=1, resultType="json
     print("totalCount : %d" % body["totalCount"])      # 전체 결과 수
     print() # Newline
 
+    # Multi-row Mode: Numeric fields (fltRt, clpr, trqu, ...) as numbers across the whole result set
+    if allRows:
+        return decode_response("stock_price_info", item)
+
+    # Formatting on Field 'fltRt' (전일 대비 등락에 따른 비율, +d.dd%, 빈 값이나 "-"는 "")
+    item = item[0]
+    item['fltRt'] = format_flt_rt(decode_value(item['fltRt'], "float"))
+
     return item
 
 def get_stock_market_index(serviceKey:str, pageNo=1, numOfRows=1, resultType="json", basDt="", beginBasDt="", endBasDt="", likeBasDt="", idxNm="", likeIdxNm="", beginEpyItmsCnt="", endEpyItmsCnt="", beginFltRt="", endFltRt="", beginTrqu="", endTrqu="", beginTrPrc="", endTrPrc="", beginLstgMrktTotAmt="", endLstgMrktTotAmt="", beginLsYrEdVsFltRg="", endLsYrEdVsFltRg="", beginLsYrEdVsFltRt="", endLsYrEdVsFltRt=""):
@@ -1674,11 +2046,11 @@ def get_stock_market_index(serviceKey:str, pageNo=1, numOfRows=1, resultType="js
     }
 
     # Request
-    response_stock_market_index = requests.get(set_query_url(service_url=URL_STOCK_MARKET_INDEX, params=query_params_stock_market_index))
+    response_stock_market_index = http_get(set_query_url(service_url=URL_STOCK_MARKET_INDEX, params=query_params_stock_market_index))
 
     # Parsing
-    header = json.loads(response_stock_market_index.text)["response"]["header"]
-    body = json.loads(response_stock_market_index.text)["response"]["body"]
+    header = json.loads(response_stock_market_index)["response"]["header"]
+    body = json.loads(response_stock_market_index)["response"]["body"]
     item = body["items"]["item"] # Information of each index item
 
     # Assertion
@@ -1694,4 +2066,224 @@ def get_stock_market_index(serviceKey:str, pageNo=1, numOfRows=1, resultType="js
     print("totalCount : %d" % body["totalCount"])      # 전체 결과 수
     print() # Newline
 
-    return item
\ No newline at end of file
+    return item
+
+def iter_krx_listed_info(serviceKey:str, numOfRows:int=DATA_GO_KR_PAGE_SIZE, numWorkers:int=MAX_WORKERS_API_CALL, ordered:bool=False, fields:list=None, **queryParams):
+    """
+    금융위원회_KRX상장종목정보 전체 검색 결과를 페이지 단위로 조회하며 item을 하나씩 반환한다. (Generator)
+    * 금융위원회_KRX상장종목정보 (https://www.data.go.kr/data/15094775/openapi.do)
+
+    [Parameters]
+    serviceKey  (str)  : 공공데이터 포털에서 받은 인증키 (Mandatory)
+    numOfRows   (int)  : 한 페이지 결과 수 (Default: DATA_GO_KR_PAGE_SIZE)
+    numWorkers  (int)  : 동시에 조회할 페이지 수 (Default: MAX_WORKERS_API_CALL)
+    ordered     (bool) : 페이지 번호 순서대로 반환할지 여부 (Default: False; 도착 순서)
+    fields      (list) : item에 남길 필드 목록 (Default: None; 전체 필드, 나머지 필드는 응답을 읽을 때 버린다.)
+    queryParams        : get_krx_listed_info의 검색 조건 (basDt, likeSrtnCd, crno, ...)
+
+    [Returns]
+    item : get_krx_listed_info의 item과 같음 (Generator of dict)
+    """
+
+    # shotnIsin is not in the response; it is made from srtnCd
+    projection = (set(fields) - {"shotnIsin"}) | ({"srtnCd"} if "shotnIsin" in fields else set()) if fields is not None else None
+
+    for item in iter_data_go_kr_items(URL_KRX_LISTED_INFO, dict(queryParams, serviceKey=serviceKey), numOfRows=numOfRows, numWorkers=numWorkers, ordered=ordered, fields=projection):
+        # Make new pair (Short ISIN Code made by srtnCd)
+        if "srtnCd" in item:
+            item["shotnIsin"] = item["srtnCd"][1:]
+        if fields is not None and "srtnCd" not in fields:
+            item.pop("srtnCd", None)
+        yield item
+
+def iter_corp_outline(serviceKey:str, numOfRows:int=DATA_GO_KR_PAGE_SIZE, numWorkers:int=MAX_WORKERS_API_CALL, ordered:bool=False, fields:list=None, **queryParams):
+    """
+    금융위원회_기업기본정보_기업개요조회 전체 검색 결과를 페이지 단위로 조회하며 item을 하나씩 반환한다. (Generator)
+    * 금융위원회_기업기본정보_기업개요조회 (https://www.data.go.kr/data/15043184/openapi.do)
+
+    [Parameters]
+    serviceKey  (str)  : 공공데이터 포털에서 받은 인증키 (Mandatory)
+    numOfRows   (int)  : 한 페이지 결과 수 (Default: DATA_GO_KR_PAGE_SIZE)
+    numWorkers  (int)  : 동시에 조회할 페이지 수 (Default: MAX_WORKERS_API_CALL)
+    ordered     (bool) : 페이지 번호 순서대로 반환할지 여부 (Default: False; 도착 순서)
+    fields      (list) : item에 남길 필드 목록 (Default: None; 전체 필드, 나머지 필드는 응답을 읽을 때 버린다.)
+    queryParams        : get_corp_outline의 검색 조건 (basDt, crno, corpNm)
+
+    [Returns]
+    item : get_corp_outline의 item과 같음 (Generator of dict)
+    """
+
+    yield from iter_data_go_kr_items(URL_CORP_OUTLINE, dict(queryParams, serviceKey=serviceKey), numOfRows=numOfRows, numWorkers=numWorkers, ordered=ordered, fields=fields)
+
+def iter_stoc_issu_stat(serviceKey:str, numOfRows:int=DATA_GO_KR_PAGE_SIZE, numWorkers:int=MAX_WORKERS_API_CALL, ordered:bool=False, fields:list=None, **queryParams):
+    """
+    금융위원회_주식발행정보: 주식발행현황조회 전체 검색 결과를 페이지 단위로 조회하며 item을 하나씩 반환한다. (Generator)
+    * 금융위원회_주식발행정보: 주식발행현황조회 (https://www.data.go.kr/tcs/dss/selectApiDataDetailView.do?publicDataPk=15043423)
+
+    [Parameters]
+    serviceKey  (str)  : 공공데이터 포털에서 받은 인증키 (Mandatory)
+    numOfRows   (int)  : 한 페이지 결과 수 (Default: DATA_GO_KR_PAGE_SIZE)
+    numWorkers  (int)  : 동시에 조회할 페이지 수 (Default: MAX_WORKERS_API_CALL)
+    ordered     (bool) : 페이지 번호 순서대로 반환할지 여부 (Default: False; 도착 순서)
+    fields      (list) : item에 남길 필드 목록 (Default: None; 전체 필드, 나머지 필드는 응답을 읽을 때 버린다.)
+    queryParams        : get_stoc_issu_stat의 검색 조건 (basDt, crno, stckIssuCmpyNm)
+
+    [Returns]
+    item : get_stoc_issu_stat의 item과 같음 (Generator of dict)
+    """
+
+    yield from iter_data_go_kr_items(URL_STOC_ISSU_STAT, dict(queryParams, serviceKey=serviceKey), numOfRows=numOfRows, numWorkers=numWorkers, ordered=ordered, fields=fields)
+
+def iter_item_basi_info(serviceKey:str, numOfRows:int=DATA_GO_KR_PAGE_SIZE, numWorkers:int=MAX_WORKERS_API_CALL, ordered:bool=False, fields:list=None, **queryParams):
+    """
+    금융위원회_주식발행정보: 종목기본정보조회 전체 검색 결과를 페이지 단위로 조회하며 item을 하나씩 반환한다. (Generator)
+
+    [Parameters]
+    serviceKey  (str)  : 공공데이터 포털에서 받은 인증키 (Mandatory)
+    numOfRows   (int)  : 한 페이지 결과 수 (Default: DATA_GO_KR_PAGE_SIZE)
+    numWorkers  (int)  : 동시에 조회할 페이지 수 (Default: MAX_WORKERS_API_CALL)
+    ordered     (bool) : 페이지 번호 순서대로 반환할지 여부 (Default: False; 도착 순서)
+    fields      (list) : item에 남길 필드 목록 (Default: None; 전체 필드, 나머지 필드는 응답을 읽을 때 버린다.)
+    queryParams        : get_item_basi_info의 검색 조건 (basDt, crno, corpNm, stckIssuCmpyNm)
+
+    [Returns]
+    item : get_item_basi_info의 item과 같음 (Generator of dict)
+    """
+
+    yield from iter_data_go_kr_items(URL_ITEM_BASI_INFO, dict(queryParams, serviceKey=serviceKey), numOfRows=numOfRows, numWorkers=numWorkers, ordered=ordered, fields=fields)
+
+def iter_summ_fina_stat(serviceKey:str, numOfRows:int=DATA_GO_KR_PAGE_SIZE, numWorkers:int=MAX_WORKERS_API_CALL, ordered:bool=False, fields:list=None, **queryParams):
+    """
+    금융위원회_기업 재무정보: 요약재무제표조회 전체 검색 결과를 페이지 단위로 조회하며 item을 하나씩 반환한다. (Generator)
+    * 금융위원회_기업 재무정보: 요약재무제표조회 (https://www.data.go.kr/tcs/dss/selectApiDataDetailView.do?publicDataPk=15043459)
+
+    [Parameters]
+    serviceKey  (str)  : 공공데이터 포털에서 받은 인증키 (Mandatory)
+    numOfRows   (int)  : 한 페이지 결과 수 (Default: DATA_GO_KR_PAGE_SIZE)
+    numWorkers  (int)  : 동시에 조회할 페이지 수 (Default: MAX_WORKERS_API_CALL)
+    ordered     (bool) : 페이지 번호 순서대로 반환할지 여부 (Default: False; 도착 순서)
+    fields      (list) : item에 남길 필드 목록 (Default: None; 전체 필드, 나머지 필드는 응답을 읽을 때 버린다.)
+    queryParams        : get_summ_fina_stat의 검색 조건 (bizYear, crno)
+
+    [Returns]
+    item : get_summ_fina_stat의 item과 같음 (Generator of dict)
+    """
+
+    yield from iter_data_go_kr_items(URL_SUMM_FINA_STAT, dict(queryParams, serviceKey=serviceKey), numOfRows=numOfRows, numWorkers=numWorkers, ordered=ordered, fields=fields)
+
+def iter_stock_price_info(serviceKey:str, numOfRows:int=DATA_GO_KR_PAGE_SIZE, numWorkers:int=MAX_WORKERS_API_CALL, ordered:bool=False, fields:list=None, **queryParams):
+    """
+    금융위원회_주식시세정보: 주식시세 전체 검색 결과를 페이지 단위로 조회하며 item을 하나씩 반환한다. (Generator)
+    * 금융위원회_주식시세정보: 주식시세 (https://www.data.go.kr/tcs/dss/selectApiDataDetailView.do?publicDataPk=15094808)
+
+    [Parameters]
+    serviceKey  (str)  : 공공데이터 포털에서 받은 인증키 (Mandatory)
+    numOfRows   (int)  : 한 페이지 결과 수 (Default: DATA_GO_KR_PAGE_SIZE)
+    numWorkers  (int)  : 동시에 조회할 페이지 수 (Default: MAX_WORKERS_API_CALL)
+    ordered     (bool) : 페이지 번호 순서대로 반환할지 여부 (Default: False; 도착 순서)
+    fields      (list) : item에 남길 필드 목록 (Default: None; 전체 필드, 나머지 필드는 응답을 읽을 때 버린다.)
+    queryParams        : get_stock_price_info의 검색 조건 (basDt, beginBasDt, endBasDt, isinCd, ...)
+
+    [Returns]
+    item : get_stock_price_info의 item과 같음 (fltRt 서식 변환 없음) (Generator of dict)
+    """
+
+    yield from iter_data_go_kr_items(URL_STOCK_PRICE_INFO, dict(queryParams, serviceKey=serviceKey), numOfRows=numOfRows, numWorkers=numWorkers, ordered=ordered, fields=fields)
+
+def iter_stock_market_index(serviceKey:str, numOfRows:int=DATA_GO_KR_PAGE_SIZE, numWorkers:int=MAX_WORKERS_API_CALL, ordered:bool=False, fields:list=None, **queryParams):
+    """
+    금융위원회_지수시세정보: 주가지수시세 전체 검색 결과를 페이지 단위로 조회하며 item을 하나씩 반환한다. (Generator)
+    * 금융위원회_지수시세정보: 주가지수시세 (https://www.data.go.kr/tcs/dss/selectApiDataDetailView.do?publicDataPk=15094807)
+
+    [Parameters]
+    serviceKey  (str)  : 공공데이터 포털에서 받은 인증키 (Mandatory)
+    numOfRows   (int)  : 한 페이지 결과 수 (Default: DATA_GO_KR_PAGE_SIZE)
+    numWorkers  (int)  : 동시에 조회할 페이지 수 (Default: MAX_WORKERS_API_CALL)
+    ordered     (bool) : 페이지 번호 순서대로 반환할지 여부 (Default: False; 도착 순서)
+    fields      (list) : item에 남길 필드 목록 (Default: None; 전체 필드, 나머지 필드는 응답을 읽을 때 버린다.)
+    queryParams        : get_stock_market_index의 검색 조건 (basDt, beginBasDt, endBasDt, idxNm, ...)
+
+    [Returns]
+    item : get_stock_market_index의 item과 같음 (Generator of dict)
+    """
+
+    yield from iter_data_go_kr_items(URL_STOCK_MARKET_INDEX, dict(queryParams, serviceKey=serviceKey), numOfRows=numOfRows, numWorkers=numWorkers, ordered=ordered, fields=fields)
+
+def _decode_history(endpoint:str, items:list, columns:list=None):
+    # Typed DataFrame indexed by basDt (Ascending, Stable within the same date)
+    schema  = API_SCHEMAS[endpoint]
+    columns = list(columns) if columns is not None else (None if len(items) > 0 else list(schema))
+    if columns is not None and "basDt" not in columns:
+        columns = ["basDt"] + columns
+
+    df = decode_response(endpoint, items, columns=columns)
+    df = df.sort_values("basDt", kind="stable").set_index("basDt")
+
+    return df
+
+def get_stock_price_history(serviceKey:str, isinCd, startDt:str=COLLECTOR_START_DATE, endDt:str=TODAY, columns:list=None, numOfRows:int=DATA_GO_KR_PAGE_SIZE, numWorkers:int=MAX_WORKERS_API_CALL):
+    """
+    금융위원회_주식시세정보: 주식시세에서 종목의 기간별 일별 시세를 조회하여 기준일자를 Index로 하는 DataFrame으로 반환한다.
+    기간 조건(beginBasDt, endBasDt)을 서버에 전달하고 페이지 단위(numOfRows)로 나누어 조회하므로, 20년치 일별 시세도 몇 번의 요청으로 조회된다.
+    (예: get_stock_price_history(serviceKey, "KR7005930003")["clpr"], get_stock_price_history(serviceKey, list_isin_cd, startDt="20200101"))
+
+    [Parameters]
+    serviceKey (str)         : 공공데이터 포털에서 받은 인증키 (Mandatory)
+    isinCd     (str, list)   : 종목의 ISIN코드 또는 ISIN코드 목록 (Mandatory)
+    startDt    (str)         : 조회할 데이터의 시작 일자 (YYYYMMDD, 포함) (Default: COLLECTOR_START_DATE)
+    endDt      (str)         : 조회할 데이터의 종료 일자 (YYYYMMDD, 포함) (Default: TODAY)
+    columns    (list)        : 반환할 필드 목록 (Default: None; 전체 필드, 나머지 필드는 응답을 읽을 때 버린다.)
+    numOfRows  (int)         : 한 페이지 결과 수 (Default: DATA_GO_KR_PAGE_SIZE)
+    numWorkers (int)         : 동시에 조회할 페이지 (ISIN코드 목록이면 종목) 수 (Default: MAX_WORKERS_API_CALL)
+
+    [Returns]
+    df : 일별 시세 (pandas.DataFrame, Index: basDt, SCHEMA_STOCK_PRICE_INFO의 dtype, fltRt는 float64)
+         ISIN코드 목록이면 종목별 시세를 이어 붙인 결과 (columns와 관계없이 isinCd 필드 포함, 같은 기준일자 안에서는 isinCd 목록 순서)
+    """
+
+    endBasDt = datetime.strftime(datetime.strptime(endDt, "%Y%m%d") + timedelta(1), "%Y%m%d") # endBasDt is exclusive
+    fields   = ["basDt"] + list(columns) if columns is not None else None # Projection pushdown
+
+    # Multiple Stocks (Concurrently, isinCd is always kept to tell the stocks apart)
+    if not isinstance(isinCd, str):
+        if columns is not None and "isinCd" not in columns:
+            columns = ["isinCd"] + list(columns)
+            fields  = ["basDt"] + columns
+
+        with ThreadPoolExecutor(max_workers=max(numWorkers, 1)) as executor:
+            items = list(executor.map(lambda code: list(iter_stock_price_info(serviceKey=serviceKey, numOfRows=numOfRows, numWorkers=1, ordered=True, fields=fields, isinCd=code, beginBasDt=startDt, endBasDt=endBasDt)), isinCd))
+        return _decode_history("stock_price_info", [item for stock_items in items for item in stock_items], columns)
+
+    if len(isinCd) == 0:
+        raise ValueError("Fail: isinCd is required (An empty isinCd matches every stock)")
+
+    items = list(iter_stock_price_info(serviceKey=serviceKey, numOfRows=numOfRows, numWorkers=numWorkers, ordered=True, fields=fields, isinCd=isinCd, beginBasDt=startDt, endBasDt=endBasDt))
+    return _decode_history("stock_price_info", items, columns)
+
+def get_stock_market_index_history(serviceKey:str, idxNm:str, startDt:str=COLLECTOR_START_DATE, endDt:str=TODAY, columns:list=None, numOfRows:int=DATA_GO_KR_PAGE_SIZE, numWorkers:int=MAX_WORKERS_API_CALL):
+    """
+    금융위원회_지수시세정보: 주가지수시세에서 지수의 기간별 일별 시세를 조회하여 기준일자를 Index로 하는 DataFrame으로 반환한다.
+    기간 조건(beginBasDt, endBasDt)을 서버에 전달하고 페이지 단위(numOfRows)로 나누어 조회한다.
+    (예: get_stock_market_index_history(serviceKey, "코스피")["clpr"])
+
+    [Parameters]
+    serviceKey (str)  : 공공데이터 포털에서 받은 인증키 (Mandatory)
+    idxNm      (str)  : 지수의 명칭 (예: "코스피", "코스닥", "코스피 200") (Mandatory)
+    startDt    (str)  : 조회할 데이터의 시작 일자 (YYYYMMDD, 포함) (Default: COLLECTOR_START_DATE)
+    endDt      (str)  : 조회할 데이터의 종료 일자 (YYYYMMDD, 포함) (Default: TODAY)
+    columns    (list) : 반환할 필드 목록 (Default: None; 전체 필드, 나머지 필드는 응답을 읽을 때 버린다.)
+    numOfRows  (int)  : 한 페이지 결과 수 (Default: DATA_GO_KR_PAGE_SIZE)
+    numWorkers (int)  : 동시에 조회할 페이지 수 (Default: MAX_WORKERS_API_CALL)
+
+    [Returns]
+    df : 일별 지수 시세 (pandas.DataFrame, Index: basDt, SCHEMA_STOCK_MARKET_INDEX의 dtype)
+    """
+
+    if idxNm is None or len(idxNm) == 0:
+        raise ValueError("Fail: idxNm is required (An empty idxNm matches every index)")
+
+    endBasDt = datetime.strftime(datetime.strptime(endDt, "%Y%m%d") + timedelta(1), "%Y%m%d") # endBasDt is exclusive
+    fields   = ["basDt"] + list(columns) if columns is not None else None # Projection pushdown
+
+    items = list(iter_stock_market_index(serviceKey=serviceKey, numOfRows=numOfRows, numWorkers=numWorkers, ordered=True, fields=fields, idxNm=idxNm, beginBasDt=startDt, endBasDt=endBasDt))
+    return _decode_history("stock_market_index", items, columns)
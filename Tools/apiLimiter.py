@@ -0,0 +1,187 @@
+# apiLimiter.py
+
+# Author  : Byeong Heon Lee
+# Contact : lww7438@gmail.com
+
+# Required Modules
+import random
+import threading
+import time
+
+from urllib.parse import urlsplit
+
+from apiConfig import *
+
+
+
+# * * *   Classes   * * *
+class HostRateLimiter:
+    """
+    API 호스트(apis.data.go.kr, api.seibro.or.kr, ...)별 Token Bucket Rate Limiter
+    호스트별로 초당 rate개의 토큰이 burst개까지 쌓이며, 요청 하나가 토큰 하나를 사용한다.
+    동시에 진행 중인 요청 수는 호스트별로 concurrency개로 제한된다.
+    rate는 요청이 성공하면 increase만큼 늘고, 서버가 과부하(429, 5xx, 공공데이터포털 초당 호출 제한 등)를 알리면 decrease배로 줄어든다. (AIMD)
+
+    [Parameters]
+    rate        (float) : 초기 초당 요청 수 (Default: RATE_LIMIT_RPS)
+    burst       (int)   : 연속으로 보낼 수 있는 최대 요청 수 (Default: RATE_LIMIT_BURST)
+    concurrency (int)   : 호스트별 최대 동시 요청 수 (Default: RATE_LIMIT_CONCURRENCY)
+    minRate     (float) : 초당 요청 수의 하한 (Default: RATE_LIMIT_MIN_RPS)
+    maxRate     (float) : 초당 요청 수의 상한 (Default: RATE_LIMIT_MAX_RPS)
+    increase    (float) : 요청 성공 시 증가하는 초당 요청 수 (Default: RATE_LIMIT_INCREASE)
+    decrease    (float) : 과부하 응답 시 곱하는 비율 (Default: RATE_LIMIT_DECREASE)
+    """
+
+    def __init__(self, rate:float=RATE_LIMIT_RPS, burst:int=RATE_LIMIT_BURST, concurrency:int=RATE_LIMIT_CONCURRENCY,
+                 minRate:float=RATE_LIMIT_MIN_RPS, maxRate:float=RATE_LIMIT_MAX_RPS, increase:float=RATE_LIMIT_INCREASE, decrease:float=RATE_LIMIT_DECREASE):
+        self.rate        = rate
+        self.burst       = burst
+        self.concurrency = concurrency
+        self.minRate     = minRate
+        self.maxRate     = maxRate
+        self.increase    = increase
+        self.decrease    = decrease
+
+        self._hosts = dict() # Host -> State of the token bucket
+        self._lock  = threading.Lock()
+
+    def _get_host(self, serviceUrl:str):
+        # Must be called with self._lock held
+        host  = urlsplit(serviceUrl).netloc
+        state = self._hosts.get(host, None)
+
+        if state is None:
+            state = {
+                "rate"      : self.rate,
+                "tokens"    : float(self.burst),
+                "updated"   : time.monotonic(),
+                "semaphore" : threading.BoundedSemaphore(self.concurrency),
+                "started"   : None, # The first request (time.monotonic)
+                "requests"  : 0,    # Requests sent (Including retries)
+                "successes" : 0,
+                "retries"   : 0,
+                "throttled" : 0,
+                "failures"  : 0,    # Requests given up after RETRY_MAX retries
+            }
+            self._hosts[host] = state
+
+        return state
+
+    def acquire(self, serviceUrl:str):
+        """
+        serviceUrl의 호스트에 요청을 보낼 수 있을 때까지 대기한다. (동시 요청 수 제한 + 토큰 1개 사용)
+        요청이 끝나면 반드시 release()를 호출해야 한다.
+        """
+
+        with self._lock:
+            state = self._get_host(serviceUrl)
+        state["semaphore"].acquire()
+
+        # Reserve a token (Tokens may go negative; the reservation is paid by sleeping)
+        with self._lock:
+            now    = time.monotonic()
+            tokens = min(float(self.burst), state["tokens"] + (now - state["updated"]) * state["rate"]) - 1.0
+
+            state["tokens"]   = tokens
+            state["updated"]  = now
+            state["requests"] += 1
+            if state["started"] is None:
+                state["started"] = now
+
+            delay = -tokens / state["rate"] if tokens < 0 else 0.0
+
+        # Sleep outside of the lock (Other hosts are not blocked)
+        if delay > 0:
+            time.sleep(delay)
+
+    def release(self, serviceUrl:str, throttled:bool=False):
+        """
+        요청 결과를 반영하고 동시 요청 슬롯을 반환한다.
+
+        [Parameters]
+        serviceUrl (str)  : 요청한 URL (Mandatory)
+        throttled  (bool) : 서버가 과부하를 알렸는지 여부 (True: 감소, False: 증가) (Default: False)
+        """
+
+        with self._lock:
+            state = self._get_host(serviceUrl)
+
+            if throttled:
+                state["rate"]       = max(self.minRate, state["rate"] * self.decrease)
+                state["tokens"]     = min(state["tokens"], 0.0) # Drop the burst
+                state["throttled"] += 1
+            else:
+                state["rate"]       = min(self.maxRate, state["rate"] + self.increase)
+                state["successes"] += 1
+
+        state["semaphore"].release()
+
+    def record_retry(self, serviceUrl:str):
+        with self._lock:
+            self._get_host(serviceUrl)["retries"] += 1
+
+    def record_failure(self, serviceUrl:str):
+        with self._lock:
+            self._get_host(serviceUrl)["failures"] += 1
+
+    def stats(self):
+        """
+        호스트별 요청 통계를 반환한다.
+
+        [Returns]
+        stats : 호스트 -> 통계 (dict of dict)
+            rate         (float) : 현재 허용된 초당 요청 수
+            achieved_rps (float) : 첫 요청 이후 실제 초당 요청 수
+            requests     (int)   : 보낸 요청 수 (재시도 포함)
+            successes    (int)   : 성공한 요청 수
+            retries      (int)   : 재시도 횟수
+            throttled    (int)   : 과부하 응답 수
+            failures     (int)   : 재시도 후에도 실패한 요청 수
+        """
+
+        now   = time.monotonic()
+        stats = dict()
+
+        with self._lock:
+            for host, state in self._hosts.items():
+                elapsed = (now - state["started"]) if state["started"] is not None else 0.0
+                stats[host] = {
+                    "rate"         : state["rate"],
+                    "achieved_rps" : state["requests"] / elapsed if elapsed > 0 else 0.0,
+                    "requests"     : state["requests"],
+                    "successes"    : state["successes"],
+                    "retries"      : state["retries"],
+                    "throttled"    : state["throttled"],
+                    "failures"     : state["failures"],
+                }
+
+        return stats
+
+
+
+# * * *   Functions   * * *
+def get_backoff_delay(attempt:int, base:float=RETRY_BACKOFF_BASE, maxDelay:float=RETRY_BACKOFF_MAX):
+    """
+    attempt번째 재시도 전 대기 시간(초)을 반환한다. (Full Jitter: uniform(0, min(maxDelay, base * 2^attempt)))
+    """
+
+    return random.uniform(0, min(maxDelay, base * (2 ** attempt)))
+
+def is_throttled_response(statusCode:int, text:str):
+    """
+    응답이 재시도해야 하는 과부하/일시적 오류인지 여부를 반환한다.
+    (RETRY_STATUS_CODES, 또는 HTTP 200이지만 본문이 공공데이터포털의 초당 호출 제한 등의 오류인 경우)
+    """
+
+    if statusCode in RETRY_STATUS_CODES:
+        return True
+
+    if "OpenAPI_ServiceResponse" in text or "HTTP ROUTING ERROR" in text:
+        return any(marker in text for marker in RETRY_THROTTLE_MARKERS)
+
+    return False
+
+
+
+# * * *   Global Instance   * * *
+API_LIMITER = HostRateLimiter()
@@ -0,0 +1,140 @@
+# apiSession.py
+
+# Author  : Byeong Heon Lee
+# Contact : lww7438@gmail.com
+
+# Required Modules
+import requests
+import threading
+import time
+
+from urllib.parse     import urlsplit
+from requests.adapters import HTTPAdapter
+
+from apiConfig  import *
+from apiCache   import *
+from apiLimiter import *
+
+
+
+# * * *   Sessions   * * *
+_sessions      = dict() # Host -> requests.Session (Keep-Alive Connection Pool)
+_sessions_lock = threading.Lock()
+
+# Transient failures worth retrying (The request may succeed on the next attempt)
+RETRYABLE_EXCEPTIONS = (
+    requests.exceptions.ConnectionError,
+    requests.exceptions.Timeout,
+    requests.exceptions.ChunkedEncodingError,
+    requests.exceptions.ContentDecodingError,
+)
+
+
+
+# * * *   Functions   * * *
+def get_session(serviceUrl:str):
+    """
+    serviceUrl의 호스트에 대한 공용 requests.Session을 반환한다.
+    호스트별로 하나의 Session이 생성되며, Session은 Keep-Alive 연결을 HTTP_POOL_SIZE개까지 재사용한다.
+
+    [Parameters]
+    serviceUrl (str) : 요청할 API의 URL (Mandatory)
+
+    [Returns]
+    session : 호스트 전용 Session (requests.Session)
+    """
+
+    parsed_url = urlsplit(serviceUrl)
+    host       = parsed_url.netloc
+
+    with _sessions_lock:
+        session = _sessions.get(host, None)
+
+        if session is None:
+            adapter = HTTPAdapter(pool_connections=1, pool_maxsize=HTTP_POOL_SIZE, pool_block=True)
+
+            session = requests.Session()
+            session.mount(parsed_url.scheme + "://" + host, adapter)
+            session.headers.update({
+                "Accept-Encoding" : "gzip, deflate", # Compressed Response
+                "Connection"      : "keep-alive",    # Reuse TCP Connection
+            })
+            _sessions[host] = session
+
+    return session
+
+def close_sessions():
+    """
+    공용 Session들을 모두 닫는다. (다음 요청 시 새로 생성된다.)
+    """
+
+    with _sessions_lock:
+        for session in _sessions.values():
+            session.close()
+        _sessions.clear()
+
+def http_get(url:str, timeout=HTTP_TIMEOUT, useCache:bool=CACHE_ENABLED, maxRetries:int=RETRY_MAX):
+    """
+    공용 Session으로 GET 요청을 보내고 응답 본문을 반환한다.
+    같은 호스트에 대한 요청 속도와 동시 요청 수는 API_LIMITER가 제한하며, 캐시된 응답이 있으면 네트워크 요청 없이 반환한다.
+    연결 오류, 제한 시간 초과, 응답 본문 수신/압축 해제 오류, 과부하 응답(429, 5xx, 공공데이터포털 초당 호출 제한 등)은 지수 백오프(Jitter 포함) 후 재시도한다.
+    그 밖의 requests 예외(TooManyRedirects, InvalidURL 등)는 재시도하지 않고 그대로 발생한다.
+
+    [Parameters]
+    url        (str)   : 쿼리 파라미터가 포함된 요청 URL (Mandatory)
+    timeout    (tuple) : (연결 제한 시간, 읽기 제한 시간) (초) (Default: HTTP_TIMEOUT)
+    useCache   (bool)  : 디스크 캐시 사용 여부 (Default: CACHE_ENABLED)
+    maxRetries (int)   : 최대 재시도 횟수 (Default: RETRY_MAX)
+
+    [Returns]
+    text : 응답 본문 (str)
+
+    [Raises]
+    requests.exceptions.RetryError : maxRetries번 재시도한 후에도 실패한 경우 (응답을 None으로 삼키지 않는다.)
+    """
+
+    # Cache
+    if useCache:
+        text = get_response_cache().get(url)
+        if text is not None:
+            return text
+
+    # Request (with Retries)
+    for attempt in range(maxRetries + 1):
+        API_LIMITER.acquire(url)
+
+        # throttled: The host signalled overload (Slows down the host's rate), retry: Send the request again
+        throttled, retry = False, False
+        try:
+            response  = get_session(url).get(url, timeout=timeout)
+            throttled = is_throttled_response(response.status_code, response.text)
+            retry     = throttled
+        except requests.exceptions.Timeout as err_msg: # The host is too slow to answer
+            throttled, retry, reason = True, True, repr(err_msg)
+        except RETRYABLE_EXCEPTIONS as err_msg:        # Connection or body error (Not a signal from the host)
+            retry, reason = True, repr(err_msg)
+        else:
+            reason = f"HTTP {response.status_code}"
+        finally:
+            # Always give the host's slot back (Other exceptions propagate after the release, without throttling)
+            API_LIMITER.release(url, throttled=throttled)
+
+        if not retry:
+            if useCache and response.status_code == 200 and is_cacheable_response(response.text):
+                get_response_cache().put(url, response.text)
+
+            return response.text
+
+        if attempt < maxRetries:
+            API_LIMITER.record_retry(url)
+            time.sleep(get_backoff_delay(attempt))
+
+    API_LIMITER.record_failure(url)
+    raise requests.exceptions.RetryError(f"Fail: {urlsplit(url).netloc}{urlsplit(url).path} ({maxRetries} retries, {reason})")
+
+def get_api_stats():
+    """
+    호스트별 요청 통계(API_LIMITER)와 캐시 통계를 반환한다.
+    """
+
+    return {"hosts": API_LIMITER.stats(), "cache": get_cache_stats()}
@@ -1,7 +1,8 @@
+import os
 from urllib.request import urlopen
-from bs4 import BeautifulSoup
-from html_table_parser import parser_functions as parser
-import pymysql
+from concurrent.futures import ThreadPoolExecutor
+import lxml.html
+import numpy as np
 import pandas as pd
 import time
 
@@ -9,65 +10,151 @@ import time
 # 외국금리
 # https://www.global-rates.com/interest-rates/central-banks/central-bank-japan/boj-interest-rate.aspx
 
-def get_for_rate(nation,to="2019-12-31"):
+BASE_URL="https://www.global-rates.com/interest-rates/central-banks{}"
 
-    nation_list={"KOR":"/central-bank-south-korea/bank-of-korea-interest-rate.aspx",
-                 "JPN":"/central-bank-japan/boj-interest-rate.aspx",
-                 "USA":"/central-bank-america/fed-interest-rate.aspx",
-                 "CHI":"/central-bank-china/pbc-interest-rate.aspx",
-                 "EUR":"/european-central-bank/ecb-interest-rate.aspx"
-                 }
+NATION_LIST={"KOR":"/central-bank-south-korea/bank-of-korea-interest-rate.aspx",
+             "JPN":"/central-bank-japan/boj-interest-rate.aspx",
+             "USA":"/central-bank-america/fed-interest-rate.aspx",
+             "CHI":"/central-bank-china/pbc-interest-rate.aspx",
+             "EUR":"/european-central-bank/ecb-interest-rate.aspx"
+             }
 
-    url=nation_list.get(nation, "-1")
+# 국가별 금리 변경 이력 캐시 (<nation>.csv)
+CACHE_DIR=os.path.join(os.path.dirname(os.path.abspath(__file__)), os.pardir, "Data", "cache", "base_rate")
+CACHE_TTL=60*60*24 # 하루 이내에 받은 이력은 다시 요청하지 않습니다.
+TIMEOUT=30
+
+
+def parse_rate_changes(html):
+    # 'change date' 칸이 있는 표(가장 안쪽 표)만 찾아서 읽습니다.
+    doc=lxml.html.fromstring(html)
+    tables=doc.xpath("//table[.//td[normalize-space(.)='change date'] and not(.//table)]")
+
+    if len(tables)==0:
+        raise ValueError("Fail: No 'change date' table")
+
+    rows=[[td.text_content().replace("\xa0"," ").strip() for td in tr.xpath("./td|./th")] for tr in tables[0].xpath(".//tr")]
+    header=next(idx for idx,row in enumerate(rows) if len(row)>0 and row[0]=="change date")
+
+    df=pd.DataFrame([row[:2] for row in rows[header+1:] if len(row)>=2 and row[0]!=""], columns=["change date","percentage"])
+    df["dt"]=pd.to_datetime(df["change date"])
+    df["base_rate"]=df["percentage"].str.replace("%","").str.strip().astype(float)
+
+    return df[["dt","base_rate"]].sort_values("dt").reset_index(drop=True)
+
+
+def fetch_rate_changes(nation):
+    url=NATION_LIST.get(nation, "-1")
 
     if url=="-1":
-        print("국가명을 확인해주세요.")
-        return -1
+        raise ValueError("국가명을 확인해주세요. ({})".format(nation))
+
+    return parse_rate_changes(urlopen(BASE_URL.format(url), timeout=TIMEOUT).read())
+
+
+def get_rate_changes(nation, html=None, use_cache=True, cache_dir=CACHE_DIR, cache_ttl=CACHE_TTL):
+    # 국가별 금리 변경 이력(dt, base_rate)을 반환합니다.
+    # 캐시가 cache_ttl보다 최근이면 요청하지 않고, 새로 받은 이력은 캐시된 이력과 합쳐 저장합니다. (페이지에서 빠진 과거 이력도 유지)
+    # html이 주어지면 요청하지 않고 html을 읽습니다. (저장해 둔 페이지로 테스트할 때)
+    # 이때는 캐시된 이력과 합친 결과만 반환하고 캐시 파일은 바꾸지 않습니다.
+    path=os.path.join(cache_dir, "{}.csv".format(nation))
+    cached=None
+
+    if use_cache and os.path.exists(path):
+        cached=pd.read_csv(path, parse_dates=["dt"])
+        if html is None and time.time()-os.path.getmtime(path)<cache_ttl:
+            return cached
+
+    df=parse_rate_changes(html) if html is not None else fetch_rate_changes(nation)
+
+    if cached is not None:
+        df=pd.concat([cached,df]).drop_duplicates("dt", keep="last").sort_values("dt").reset_index(drop=True)
+
+    if use_cache and html is None:
+        os.makedirs(cache_dir, exist_ok=True)
+        df.to_csv(path+".tmp", index=False)
+        os.replace(path+".tmp", path)
+
+    return df
+
+
+class RateSteps:
+    # 금리 변경 시점(dt)과 변경 후 금리(base_rate)만 저장하는 계단 함수입니다.
+    # 일별로 펼치지 않고, 특정 일자의 금리는 변경 시점을 이진 탐색(np.searchsorted)하여 구합니다.
+    # 첫 변경 시점 이전 일자의 금리는 NaN입니다.
+
+    def __init__(self, dates, rates, nation=None):
+        dates=np.asarray(dates, dtype="datetime64[D]")
+        order=np.argsort(dates, kind="stable")
+
+        self.dates=dates[order]
+        self.rates=np.asarray(rates, dtype=np.float64)[order]
+        self.nation=nation
+
+    @classmethod
+    def from_changes(cls, df, nation=None):
+        return cls(df["dt"].to_numpy(), df["base_rate"].to_numpy(), nation)
+
+    def __len__(self):
+        return len(self.dates)
+
+    @property
+    def nbytes(self):
+        return self.dates.nbytes+self.rates.nbytes
+
+    def at(self, dates):
+        # dates(일자 하나 또는 배열)의 금리를 반환합니다.
+        scalar=np.ndim(dates)==0
+        dates=np.atleast_1d(np.asarray(dates, dtype="datetime64[D]"))
+
+        idx=np.searchsorted(self.dates, dates, side="right")-1
+        rates=np.where(idx>=0, self.rates[np.maximum(idx,0)], np.nan)
+
+        return rates[0] if scalar else rates
+
+    def align(self, calendar):
+        # 임의의 달력(KOSPI 영업일, 월말 등)에 맞춘 금리를 반환합니다. (pd.Series, index: calendar)
+        calendar=pd.DatetimeIndex(calendar)
+        return pd.Series(self.at(calendar.values), index=calendar, name=self.nation)
+
+    def to_daily(self, to="2019-12-31"):
+        # 첫 변경 시점부터 to까지 일별로 펼친 DataFrame(dt, base_rate, nation)을 반환합니다.
+        calendar=pd.date_range(self.dates[0], to)
+        return pd.DataFrame({"dt":calendar, "base_rate":self.at(calendar.values), "nation":self.nation})
+
+
+def get_rate_steps(nation, html=None, use_cache=True):
+    return RateSteps.from_changes(get_rate_changes(nation, html=html, use_cache=use_cache), nation)
 
-    url="https://www.global-rates.com/interest-rates/central-banks{}".format(url)
-    result=urlopen(url).read()
-    soup=BeautifulSoup(result,"html.parser")
-    table_tags=soup.find_all("table")
 
-    # for idx,t in enumerate(table_tags):
-    #     try:
-    #         print("{}: ".format(idx),end="")
-    #         print(t.find_all("h3")[0].text)
-    #     except:
-    #         pass
+def align_rates(steps, calendar):
+    # 여러 국가의 RateSteps를 같은 달력에 맞춘 DataFrame(index: calendar, columns: nation)을 반환합니다.
+    return pd.DataFrame({rate_steps.nation: rate_steps.align(calendar) for rate_steps in steps}, index=pd.DatetimeIndex(calendar))
 
-    table = parser.make2d(table_tags[18])
-    df = pd.DataFrame(table[2:], columns=table[1])
-    df.head()
 
-    df["dt"]=df["change date"].astype("datetime64")
-    df_range=pd.DataFrame({"dt":pd.date_range(df["dt"].min(),to)})
+def get_for_rate(nation,to="2019-12-31",html=None,use_cache=True):
+    # 금리 변경 이력을 일별 기준금리(dt, base_rate, nation)로 펼칩니다.
+    # 일자별 조회나 다른 달력에 맞출 때는 펼치지 않고 get_rate_steps를 사용합니다.
+    return get_rate_steps(nation, html=html, use_cache=use_cache).to_daily(to)
 
-    df_1=pd.merge(df_range,df,how="left")
-    df_1["percentage"]=df_1["percentage"].fillna(method="ffill")
-    df_1["percentage"]=df_1["percentage"].str.replace("\xa0%","").astype(float)
 
-    df_1["nation"]=nation
-    df_1=df_1.drop("change date",1)
-    df_1=df_1.rename(columns={"percentage":"base_rate"})
+def get_for_rates(nations=tuple(NATION_LIST),to="2019-12-31",use_cache=True):
+    # 여러 국가의 기준금리를 동시에 수집하여 하나의 DataFrame으로 반환합니다.
+    with ThreadPoolExecutor(max_workers=len(nations)) as executor:
+        dfs=list(executor.map(lambda nation: get_for_rate(nation, to=to, use_cache=use_cache), nations))
 
-    time.sleep(3)
+    return pd.concat(dfs, ignore_index=True)
 
-    return df_1
 
+if __name__=="__main__":
+    import seaborn as sns
 
-# 국가별 기준 금리 정보를 수집합니다.
-df_kor=get_for_rate("KOR")
-df_jpn=get_for_rate("JPN")
-df_usa=get_for_rate("USA")
-df_chi=get_for_rate("CHI")
-df_eur=get_for_rate("EUR")
-df=pd.concat([df_kor,df_jpn,df_usa,df_chi,df_eur],0)
+    # 국가별 기준 금리 정보를 수집합니다.
+    df=get_for_rates(["KOR","JPN","USA","CHI","EUR"])
 
-# 모든 국가에 포함된 시작일자를 구합니다.
-df_min_dt=df.groupby('nation')["dt"].min()
-df_min_dt=max(df_min_dt)
-df_graph=df.loc[df["dt"]>=df_min_dt]
+    # 모든 국가에 포함된 시작일자를 구합니다.
+    df_min_dt=df.groupby('nation')["dt"].min()
+    df_min_dt=max(df_min_dt)
+    df_graph=df.loc[df["dt"]>=df_min_dt]
 
-import seaborn as sns
-sns.lineplot(data=df_graph,x="dt",y="base_rate",hue="nation", alpha=0.7)
\ No newline at end of file
+    sns.lineplot(data=df_graph,x="dt",y="base_rate",hue="nation", alpha=0.7)
@@ -0,0 +1,97 @@
+# bench_http_session.py
+# Per-call latency of requests.get (New connection per call) and http_get (Pooled keep-alive Session) against a local stub server
+# Usage: python bench/bench_http_session.py [numCalls]
+
+# Author  : Byeong Heon Lee
+# Contact : lww7438@gmail.com
+
+# Required Modules
+import os
+import sys
+import json
+import time
+import threading
+import statistics
+import requests
+
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__)))) # Tools
+
+import apiSession
+from apiSession import http_get
+from apiLimiter import HostRateLimiter
+
+
+
+# * * *   Stub Server   * * *
+# About 2 KB JSON body in the 공공데이터포털 response layout
+BODY = json.dumps({"response": {
+    "header": {"resultCode": "00", "resultMsg": "NORMAL SERVICE."},
+    "body"  : {"numOfRows": 12, "pageNo": 1, "totalCount": 12, "items": {"item": [
+        {"basDt": "20240102", "srtnCd": f"A{i:06d}", "isinCd": f"KR7{i:06d}003", "mrktCtg": "KOSPI", "itmsNm": f"종목{i}", "crno": f"{i:013d}", "corpNm": f"회사{i}(주)"}
+        for i in range(12)
+    ]}},
+}}, ensure_ascii=False).encode("utf-8")
+
+class StubHandler(BaseHTTPRequestHandler):
+    protocol_version        = "HTTP/1.1" # Keep-Alive
+    disable_nagle_algorithm = True       # Headers and body are separate writes (Avoid the delayed ACK stall)
+    connections             = 0
+
+    def setup(self):
+        super().setup()
+        StubHandler.connections += 1
+
+    def do_GET(self):
+        self.send_response(200)
+        self.send_header("Content-Type", "application/json;charset=UTF-8")
+        self.send_header("Content-Length", str(len(BODY)))
+        self.end_headers()
+        self.wfile.write(BODY)
+
+    def log_message(self, format, *args):
+        pass
+
+
+
+# * * *   Functions   * * *
+def measure(get, url:str, numCalls:int):
+    # Sequential calls; returns per-call latencies (ms) and connections opened during the run (After the warm-up)
+    StubHandler.connections = 0
+    latencies = []
+    for pageNo in range(1, numCalls + 1):
+        start = time.perf_counter()
+        get(f"{url}?pageNo={pageNo}")
+        latencies.append((time.perf_counter() - start) * 1000.0)
+
+    return latencies, StubHandler.connections
+
+def report(name:str, latencies:list, connections:int):
+    latencies = sorted(latencies)
+    print(f"{name:<14} total {sum(latencies):8.1f} ms | mean {statistics.mean(latencies):6.3f} ms | "
+          f"p50 {latencies[len(latencies) // 2]:6.3f} ms | p99 {latencies[int(len(latencies) * 0.99)]:6.3f} ms | connections {connections}")
+    return statistics.mean(latencies)
+
+def main(numCalls:int=500):
+    server = ThreadingHTTPServer(("127.0.0.1", 0), StubHandler)
+    threading.Thread(target=server.serve_forever, daemon=True).start()
+    url = f"http://127.0.0.1:{server.server_address[1]}/getItemInfo"
+
+    # Transport only: the per-host limiter would pace both clients to RATE_LIMIT_RPS
+    apiSession.API_LIMITER = HostRateLimiter(rate=1e9, burst=10**9, concurrency=1, maxRate=1e9)
+
+    # Warm-up (Imports, first connection)
+    requests.get(url).text
+    http_get(url, useCache=False)
+
+    print(f"{numCalls} sequential GETs, {len(BODY)} bytes JSON body")
+    bare   = report("requests.get", *measure(lambda url: requests.get(url).text, url, numCalls))
+    pooled = report("http_get",     *measure(lambda url: http_get(url, useCache=False), url, numCalls))
+    print(f"Per-call latency reduction: {(1.0 - pooled / bare) * 100.0:.1f} %")
+
+    server.shutdown()
+    server.server_close()
+
+if __name__ == "__main__":
+    main(int(sys.argv[1]) if len(sys.argv) > 1 else 500)
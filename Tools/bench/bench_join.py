@@ -0,0 +1,69 @@
+# bench_join.py
+# Scaling of join_by_key (Hash index, O(n + m)) and the former nested-loop left_join_by_key (O(n * m))
+# n rows on each side, string keys, about 50% of the keys overlap
+# Usage: python bench/bench_join.py [maxNestedRows]
+
+# Author  : Byeong Heon Lee
+# Contact : lww7438@gmail.com
+
+# Required Modules
+import os
+import sys
+import time
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__)))) # Tools
+
+from dataManipulator import join_by_key
+
+
+
+# * * *   Functions   * * *
+def nested_loop_join(ldata:list, rdata:list, key:str):
+    # Former left_join_by_key (Mutates ldata in place)
+    merged_list = []
+
+    for data in ldata:
+        merged_list.append(data)
+
+    for item in merged_list:
+        for data in rdata:
+            if item[key] == data[key]:
+                for k, v in data.items():
+                    item[k] = v
+
+    return merged_list
+
+def make_data(n:int):
+    # ldata keys: 0 .. n-1, rdata keys: n/2 .. 3n/2-1 (KRX listing x 기업개요 shaped rows)
+    ldata = [{"crno": f"{i:013d}", "srtnCd": f"A{i:06d}", "itmsNm": f"종목{i}"} for i in range(n)]
+    rdata = [{"crno": f"{i:013d}", "corpNm": f"회사{i}(주)", "enpEmpeCnt": str(i % 5000)} for i in range(n // 2, n + n // 2)]
+    return ldata, rdata
+
+def timed(join, ldata:list, rdata:list):
+    start  = time.perf_counter()
+    result = join(ldata, rdata, "crno")
+    return time.perf_counter() - start, result
+
+def main(maxNestedRows:int=10**4):
+    print(f"{'n':>9} | {'join_by_key':>12} | {'nested loop':>14} | speedup  (~: extrapolated)")
+
+    nested_base = None # (n, seconds) of the largest measured nested-loop run
+    for n in (10**3, 10**4, 10**5, 10**6):
+        ldata, rdata = make_data(n)
+
+        hashed, result = timed(lambda l, r, key: join_by_key(l, r, key, how="left", keep="last"), ldata, rdata)
+        assert len(result) == n and sum("corpNm" in item for item in result) == n - n // 2
+
+        if n <= maxNestedRows or nested_base is None:
+            nested, _   = timed(nested_loop_join, [dict(item) for item in ldata], rdata)
+            nested_base = (n, nested)
+            nested_text = f"{nested:.3f} s"
+        else:
+            # Quadratic extrapolation from the largest measured run
+            nested      = nested_base[1] * (n / nested_base[0]) ** 2
+            nested_text = f"~{nested:,.0f} s"
+
+        print(f"{n:>9} | {hashed:10.4f} s | {nested_text:>14} | {nested / hashed:,.0f}x")
+
+if __name__ == "__main__":
+    main(int(sys.argv[1]) if len(sys.argv) > 1 else 10**4)
@@ -0,0 +1,109 @@
+# crawlJournal.py
+
+# Author  : Byeong Heon Lee
+# Contact : lww7438@gmail.com
+
+# Required Modules
+import json
+import os
+import sqlite3
+import threading
+import time
+
+from apiConfig import *
+
+
+
+# * * *   Classes   * * *
+class CrawlJournal:
+    """
+    장시간 수집(get_financials_kr 등)의 진행 상황을 SQLite 파일에 기록하는 Journal
+    종목(company)별로 완료된 조회(step)의 결과와 병합이 끝난 종목의 결과를 저장하며, 기록할 때마다 Commit하므로
+    프로세스가 언제 종료되더라도 다음 실행에서 마지막으로 완료된 종목과 조회부터 이어서 수집할 수 있다.
+
+    [Parameters]
+    path (str) : Journal 파일 경로 (Mandatory)
+    """
+
+    def __init__(self, path:str):
+        self.path = path
+
+        os.makedirs(os.path.dirname(os.path.abspath(path)), exist_ok=True)
+
+        self._lock = threading.Lock()
+        self._conn = sqlite3.connect(path, check_same_thread=False, timeout=30)
+        self._conn.execute("PRAGMA journal_mode=WAL") # Safe against interruption, cheap commits
+        self._conn.execute("""
+            CREATE TABLE IF NOT EXISTS step (
+                company TEXT NOT NULL,
+                step    TEXT NOT NULL,
+                result  TEXT,
+                updated REAL NOT NULL,
+                PRIMARY KEY (company, step)
+            )
+        """)
+        self._conn.execute("""
+            CREATE TABLE IF NOT EXISTS company (
+                company TEXT PRIMARY KEY,
+                data    TEXT NOT NULL,
+                updated REAL NOT NULL
+            )
+        """)
+        self._conn.commit()
+
+    def get_step(self, company:str, step:str):
+        """
+        (기록 여부, 조회 결과)를 반환한다. 결과가 None으로 기록된 조회(검색 결과 없음)도 기록된 것으로 본다.
+        """
+
+        with self._lock:
+            row = self._conn.execute("SELECT result FROM step WHERE company = ? AND step = ?", (company, step)).fetchone()
+
+        if row is None:
+            return False, None
+
+        return True, (json.loads(row[0]) if row[0] is not None else None)
+
+    def put_step(self, company:str, step:str, result):
+        with self._lock:
+            self._conn.execute(
+                "INSERT OR REPLACE INTO step (company, step, result, updated) VALUES (?, ?, ?, ?)",
+                (company, step, json.dumps(result, ensure_ascii=False) if result is not None else None, time.time())
+            )
+            self._conn.commit()
+
+    def get_company(self, company:str):
+        """
+        병합이 끝난 종목의 결과를 반환한다. (완료되지 않았으면 None)
+        """
+
+        with self._lock:
+            row = self._conn.execute("SELECT data FROM company WHERE company = ?", (company,)).fetchone()
+
+        return json.loads(row[0]) if row is not None else None
+
+    def put_company(self, company:str, data:dict):
+        with self._lock:
+            self._conn.execute(
+                "INSERT OR REPLACE INTO company (company, data, updated) VALUES (?, ?, ?)",
+                (company, json.dumps(data, ensure_ascii=False), time.time())
+            )
+            self._conn.execute("DELETE FROM step WHERE company = ?", (company,)) # Merged into the company row
+            self._conn.commit()
+
+    def clear(self):
+        with self._lock:
+            self._conn.execute("DELETE FROM step")
+            self._conn.execute("DELETE FROM company")
+            self._conn.commit()
+
+    def stats(self):
+        with self._lock:
+            companies = self._conn.execute("SELECT COUNT(*) FROM company").fetchone()[0]
+            steps     = self._conn.execute("SELECT COUNT(*) FROM step").fetchone()[0]
+
+        return {"companies": companies, "steps": steps}
+
+    def close(self):
+        with self._lock:
+            self._conn.close()
@@ -0,0 +1,106 @@
+# dataCollector.py
+# 저장된 KRX 일별 데이터셋(dataStorage)을 이전 영업일까지 갱신한다.
+# Usage: python dataCollector.py <AUTH_KEY> [endpoint ...]
+
+# Author  : Byeong Heon Lee
+# Contact : lww7438@gmail.com
+
+# Required Modules
+import os
+import sys
+
+from apiConfig   import *
+from apiHandler  import *
+from dataStorage import *
+
+
+
+# * * *   Endpoints   * * *
+# Endpoint Name -> KRX Daily Getter (basDd)
+COLLECTOR_ENDPOINTS = {
+    "krx_series_daily_price"             : get_krx_series_daily_price,
+    "kospi_series_daily_price"           : get_kospi_series_daily_price,
+    "kosdaq_series_daily_price"          : get_kosdaq_series_daily_price,
+    "bond_index_daily_price"             : get_bond_index_daily_price,
+    "derivative_index_daily_price"       : get_derivative_index_daily_price,
+    "kospi_daily_trading"                : get_kospi_daily_trading,
+    "kosdaq_daily_trading"               : get_kosdaq_daily_trading,
+    "konex_daily_trading"                : get_konex_daily_trading,
+    "etf_daily_trading"                  : get_etf_daily_trading,
+    "etn_daily_trading"                  : get_etn_daily_trading,
+    "elw_daily_trading"                  : get_elw_daily_trading,
+    "petroleum_market_daily_trading"     : get_petroleum_market_daily_trading,
+    "gold_market_daily_trading"          : get_gold_market_daily_trading,
+    "carbon_credit_market_daily_trading" : get_carbon_credit_market_daily_trading,
+}
+
+
+
+# * * *   Functions   * * *
+def update_dataset(endpoint:str, serviceKey:str, startDd:str=COLLECTOR_START_DATE, endDd:str=PREVIOUS_BUSINESS_DAY, lakePath:str=LAKE_PATH):
+    """
+    endpoint 데이터셋에 없는 영업일만 조회하여 추가한다. (저장된 첫 기준일자 ~ endDd, 데이터셋이 없으면 startDd ~ endDd)
+    저장된 기준일자 목록으로 빠진 일자를 구하므로, 이전 실행에서 실패했거나 중간에 중단되어 빠진 일자도 다음 실행에서 다시 조회한다.
+    조회 결과는 기준일자 순으로 연도별 파일에 원자적으로 추가된다.
+
+    [Parameters]
+    endpoint   (str) : COLLECTOR_ENDPOINTS의 데이터셋 이름 (Mandatory)
+    serviceKey (str) : 한국거래소 정보데이터시스템 Open API에서 인가받은 인증키 (Mandatory)
+    startDd    (str) : 데이터셋이 없을 때의 시작일자 (YYYYMMDD) (Default: COLLECTOR_START_DATE)
+    endDd      (str) : 종료일자 (YYYYMMDD, 포함) (Default: PREVIOUS_BUSINESS_DAY)
+    lakePath   (str) : 데이터 레이크 경로 (Default: LAKE_PATH)
+
+    [Returns]
+    rows : 추가된 행 수 (int)
+    """
+
+    # Stored Dates (Days before the first stored date are not requested again)
+    stored      = load_dataset(endpoint, columns=["BAS_DD"], lakePath=lakePath)
+    existing_dd = set(stored["BAS_DD"].dt.strftime("%Y%m%d")) if stored is not None and len(stored) > 0 else set()
+    if len(existing_dd) > 0:
+        startDd = min(existing_dd)
+
+    if startDd > endDd:
+        print(f"Up to date: {endpoint} ({endDd})")
+        return 0
+
+    df = get_krx_daily_backfill(COLLECTOR_ENDPOINTS[endpoint], serviceKey, startDd, endDd, existingDd=existing_dd)
+    if "BAS_DD" in df.columns and df["BAS_DD"].dtype == object: # Endpoints without a schema
+        df["BAS_DD"] = pd.to_datetime(df["BAS_DD"], format="%Y%m%d")
+
+    append_dataset(endpoint, df, lakePath=lakePath)
+
+    failed_days = df.attrs.get("failedDd", [])
+    print(f"Updated: {endpoint} ({startDd} ~ {endDd}, {len(df)} rows{f', {len(failed_days)} failed days' if len(failed_days) > 0 else ''})")
+    return len(df)
+
+def update_all(serviceKey:str, endpoints:list=None, endDd:str=PREVIOUS_BUSINESS_DAY, lakePath:str=LAKE_PATH):
+    """
+    endpoints(Default: COLLECTOR_ENDPOINTS 전체)의 데이터셋을 차례로 갱신한다.
+    한 데이터셋의 갱신이 실패해도 나머지 데이터셋은 갱신한다.
+
+    [Returns]
+    result : 데이터셋 이름 -> 추가된 행 수 (실패 시 None) (dict)
+    """
+
+    result = dict()
+
+    for endpoint in (endpoints if endpoints is not None else COLLECTOR_ENDPOINTS.keys()):
+        try:
+            result[endpoint] = update_dataset(endpoint, serviceKey, endDd=endDd, lakePath=lakePath)
+        except Exception as err_msg:
+            print(f"Error Detected: {endpoint}", err_msg)
+            result[endpoint] = None
+
+    return result
+
+
+
+# * * *   Entry Point   * * *
+if __name__ == "__main__":
+    if len(sys.argv) < 2:
+        print("Usage: python dataCollector.py <AUTH_KEY> [endpoint ...]")
+        sys.exit(1)
+
+    result = update_all(sys.argv[1], endpoints=(sys.argv[2:] if len(sys.argv) > 2 else None))
+    sys.exit(0 if None not in result.values() else 1)
@@ -0,0 +1,308 @@
+# dataIndicator.py
+# 2차원 배열(일자 x 종목/섹터)에 대한 기술적 지표 (RSI, SMA, EMA, Drawdown, MDD)
+# 모든 함수는 열(종목/섹터)을 한 번에 계산하며, 열마다 시작 일자가 달라 앞부분이 NaN이어도 된다.
+
+# Author  : Byeong Heon Lee
+# Contact : lww7438@gmail.com
+
+# Required Modules
+import numpy as np
+
+
+
+# * * *   Functions   * * *
+def _as_2d(values):
+    # 1-D input is treated as a single column
+    values = np.asarray(values, dtype=np.float64)
+    return (values[:, np.newaxis], True) if values.ndim == 1 else (values, False)
+
+def _restore(result, isVector:bool):
+    return result[:, 0] if isVector else result
+
+def sma(values, window:int):
+    """
+    단순이동평균(SMA)을 반환한다. window 안에 NaN이 있으면 NaN이다.
+
+    [Parameters]
+    values (numpy.ndarray) : 일자 x 종목 배열 (또는 1차원 배열) (Mandatory)
+    window (int)           : 이동평균 기간 (Mandatory)
+
+    [Returns]
+    numpy.ndarray : values와 같은 모양의 SMA (처음 window-1개 일자는 NaN)
+    """
+
+    values, is_vector = _as_2d(values)
+    result = np.full(values.shape, np.nan)
+
+    if window <= 0 or window > len(values):
+        return _restore(result, is_vector)
+
+    # Cumulative sums (NaN counted separately, so a NaN only affects the windows containing it)
+    is_nan = np.isnan(values)
+    csum   = np.vstack([np.zeros((1, values.shape[1])), np.cumsum(np.where(is_nan, 0.0, values), axis=0)])
+    cnan   = np.vstack([np.zeros((1, values.shape[1]), dtype=np.int64), np.cumsum(is_nan, axis=0)])
+
+    sums  = csum[window:] - csum[:-window]
+    nans  = cnan[window:] - cnan[:-window]
+    result[window - 1:] = np.where(nans == 0, sums / window, np.nan)
+
+    return _restore(result, is_vector)
+
+def ema(values, span:int=None, alpha:float=None):
+    """
+    지수이동평균(EMA)을 반환한다. (pandas.DataFrame.ewm(span=span, adjust=False).mean()과 같다.)
+    각 열의 첫 유효값에서 시작하며, 중간의 NaN 일자는 직전 EMA를 유지한다.
+
+    [Parameters]
+    values (numpy.ndarray) : 일자 x 종목 배열 (또는 1차원 배열) (Mandatory)
+    span   (int)           : 기간 (alpha = 2 / (span + 1)) (span, alpha 중 하나는 Mandatory)
+    alpha  (float)         : 평활 계수 (0 < alpha <= 1)
+
+    [Returns]
+    numpy.ndarray : values와 같은 모양의 EMA
+    """
+
+    if alpha is None:
+        alpha = 2.0 / (span + 1.0)
+
+    values, is_vector = _as_2d(values)
+    result = np.full(values.shape, np.nan)
+    state  = np.full(values.shape[1], np.nan)
+
+    # One pass over dates, vectorized over columns
+    for t in range(len(values)):
+        row   = values[t]
+        state = np.where(np.isnan(state), row, np.where(np.isnan(row), state, state + alpha * (row - state)))
+        result[t] = state
+
+    return _restore(result, is_vector)
+
+def rsi(values, window:int=14):
+    """
+    Wilder의 상대강도지수(RSI)를 반환한다. (TA-Lib RSI와 같은 방식)
+    첫 window개 변화량의 평균으로 시작하여, 이후 평균 상승폭/하락폭을 (이전 평균 * (window - 1) + 변화량) / window로 갱신한다.
+
+    [Parameters]
+    values (numpy.ndarray) : 일자 x 종목 종가 배열 (또는 1차원 배열) (Mandatory)
+    window (int)           : 기간 (Default: 14)
+
+    [Returns]
+    numpy.ndarray : values와 같은 모양의 RSI (0 ~ 100, 각 열의 처음 window개 일자는 NaN)
+    """
+
+    values, is_vector = _as_2d(values)
+    result = np.full(values.shape, np.nan)
+
+    diff   = np.diff(values, axis=0)
+    gains  = np.where(diff > 0, diff, 0.0)
+    losses = np.where(diff < 0, -diff, 0.0)
+
+    valid = ~np.isnan(diff)
+    count = np.cumsum(valid, axis=0) # Valid changes seen so far per column
+
+    # Seed: Simple average of the first window changes
+    seeding  = valid & (count <= window)
+    avg_gain = np.where(seeding, gains, 0.0).sum(axis=0) / window
+    avg_loss = np.where(seeding, losses, 0.0).sum(axis=0) / window
+
+    # Wilder's smoothing (One pass over dates, vectorized over columns)
+    smoothing = valid & (count > window)
+    avg_gains  = np.empty(diff.shape)
+    avg_losses = np.empty(diff.shape)
+    for t in range(len(diff)):
+        avg_gain = np.where(smoothing[t], avg_gain + (gains[t] - avg_gain) / window, avg_gain)
+        avg_loss = np.where(smoothing[t], avg_loss + (losses[t] - avg_loss) / window, avg_loss)
+        avg_gains[t]  = avg_gain
+        avg_losses[t] = avg_loss
+
+    with np.errstate(divide="ignore", invalid="ignore"):
+        total = avg_gains + avg_losses
+        result[1:] = np.where(valid & (count >= window), np.where(total > 0, 100.0 * avg_gains / total, 50.0), np.nan)
+
+    return _restore(result, is_vector)
+
+def drawdown(values, window:int=None):
+    """
+    고점 대비 하락률(Drawdown)을 반환한다. (values / 고점 - 1, 0 이하)
+
+    [Parameters]
+    values (numpy.ndarray) : 일자 x 종목 가격 배열 (또는 1차원 배열) (Mandatory)
+    window (int)           : 고점을 찾을 기간 (Default: None; 처음부터의 고점 (Expanding))
+                             기간 안의 NaN은 무시한다. (모두 NaN이면 NaN)
+
+    [Returns]
+    numpy.ndarray : values와 같은 모양의 Drawdown (window가 주어지면 처음 window-1개 일자는 NaN)
+    """
+
+    values, is_vector = _as_2d(values)
+
+    # Expanding peak (np.fmax ignores NaN)
+    if window is None:
+        peak = np.fmax.accumulate(values, axis=0)
+
+    # Rolling peak (van Herk/Gil-Werman: Block prefix/suffix maxima, O(T x N) regardless of window)
+    else:
+        peak = np.full(values.shape, np.nan)
+        if 0 < window <= len(values):
+            blocks = -(-len(values) // window)
+            padded = np.full((blocks * window, values.shape[1]), np.nan)
+            padded[:len(values)] = values
+            padded = padded.reshape(blocks, window, values.shape[1])
+
+            prefix = np.fmax.accumulate(padded, axis=1).reshape(-1, values.shape[1])
+            suffix = np.fmax.accumulate(padded[:, ::-1], axis=1)[:, ::-1].reshape(-1, values.shape[1])
+
+            # Window [t - window + 1, t] = (Suffix of one block) + (Prefix of the next block)
+            peak[window - 1:] = np.fmax(suffix[:len(values) - window + 1], prefix[window - 1:len(values)])
+
+    with np.errstate(divide="ignore", invalid="ignore"):
+        result = values / peak - 1.0
+
+    return _restore(result, is_vector)
+
+def max_drawdown(values, period:int=None):
+    """
+    최대 낙폭(MDD)을 반환한다. (기간 내 Drawdown의 최솟값, 0 이하)
+    (예: 5년 MDD -> max_drawdown(daily_close, period=5 * 252), max_drawdown(monthly_close, period=60))
+
+    [Parameters]
+    values (numpy.ndarray) : 일자 x 종목 가격 배열 (또는 1차원 배열) (Mandatory)
+    period (int)           : 마지막 period개 일자만 대상으로 한다. (Default: None; 전체 기간)
+
+    [Returns]
+    numpy.ndarray : 종목별 MDD (1차원 배열, 1차원 입력이면 float)
+    """
+
+    values, is_vector = _as_2d(values)
+    if period is not None:
+        values = values[-period:]
+
+    result = np.fmin.reduce(drawdown(values), axis=0) # np.fmin ignores NaN (All NaN -> NaN)
+
+    return result[0] if is_vector else result
+
+def simple_returns(values):
+    """
+    수익률(values[t] / values[t-1] - 1)을 반환한다. (첫 일자는 NaN)
+    """
+
+    values, is_vector = _as_2d(values)
+    result = np.full(values.shape, np.nan)
+
+    with np.errstate(divide="ignore", invalid="ignore"):
+        result[1:] = values[1:] / values[:-1] - 1.0
+
+    return _restore(result, is_vector)
+
+def _corr_from_sums(n, sx, sxx, sxy):
+    # sx[i, j] : Sum of x_i over the dates where both x_i and x_j are valid (sx.T: Sum of x_j)
+    with np.errstate(divide="ignore", invalid="ignore"):
+        cov   = n * sxy - sx * sx.T
+        var_x = n * sxx - sx * sx
+        var_y = var_x.T
+        denom = np.sqrt(np.where(var_x > 0, var_x, np.nan) * np.where(var_y > 0, var_y, np.nan))
+        return np.clip(cov / denom, -1.0, 1.0)
+
+def rolling_corr(values, window:int, minPeriods:int=None):
+    """
+    window개 일자의 이동 상관계수 행렬을 반환한다. (종목 쌍마다 둘 다 값이 있는 일자만 사용, pandas rolling().corr()와 같다.)
+    종목 쌍별 합계(개수, 합, 제곱합, 곱의 합)를 일자마다 더하고 window개 이전 일자를 빼서 갱신하므로, 일자당 종목 쌍마다 O(1)이다.
+    (예: rolling_corr(simple_returns(load_sector_panel().field("Close")), 12) -> 월별 섹터 수익률의 12개월 상관계수)
+
+    [Parameters]
+    values     (numpy.ndarray) : 일자 x 종목 배열 (보통 수익률) (Mandatory)
+    window     (int)           : 기간 (예: 60, 120, 250) (Mandatory)
+    minPeriods (int)           : 상관계수를 계산할 최소 관측 수 (Default: None; window)
+
+    [Returns]
+    numpy.ndarray : 일자 x 종목 x 종목 상관계수 (float32, 관측 수가 부족하면 NaN)
+    """
+
+    values, _ = _as_2d(values)
+    minPeriods = window if minPeriods is None else minPeriods
+
+    # Centered by column means (Correlation is shift-invariant; smaller sums lose less precision)
+    with np.errstate(invalid="ignore"):
+        centered = values - np.nanmean(values, axis=0)
+    valid    = ~np.isnan(centered)
+    masked   = np.where(valid, centered, 0.0)
+    weights  = valid.astype(np.float64)
+
+    num_dates, num_columns = values.shape
+    result = np.full((num_dates, num_columns, num_columns), np.nan, dtype=np.float32)
+
+    n   = np.zeros((num_columns, num_columns))
+    sx  = np.zeros((num_columns, num_columns))
+    sxx = np.zeros((num_columns, num_columns))
+    sxy = np.zeros((num_columns, num_columns))
+
+    for t in range(num_dates):
+        # Add date t
+        x, m = masked[t], weights[t]
+        n   += np.outer(m, m)
+        sx  += np.outer(x, m)
+        sxx += np.outer(x * x, m)
+        sxy += np.outer(x, x)
+
+        # Remove date t - window
+        if t >= window:
+            x, m = masked[t - window], weights[t - window]
+            n   -= np.outer(m, m)
+            sx  -= np.outer(x, m)
+            sxx -= np.outer(x * x, m)
+            sxy -= np.outer(x, x)
+
+        if t >= minPeriods - 1:
+            result[t] = np.where(n >= minPeriods, _corr_from_sums(n, sx, sxx, sxy), np.nan)
+
+    return result
+
+def ewm_corr(values, span:int=None, alpha:float=None, minPeriods:int=1):
+    """
+    지수가중 상관계수 행렬을 반환한다. (pandas ewm(adjust=True, ignore_na=False).corr()와 같다; 종목 쌍마다 둘 다 값이 있는 일자만 더한다.)
+    종목 쌍별 가중 합계를 값이 없는 일자에도 (1 - alpha)배 하므로 가중치는 일자 간격을 따르며, 일자당 종목 쌍마다 O(1)이다.
+
+    [Parameters]
+    values     (numpy.ndarray) : 일자 x 종목 배열 (보통 수익률) (Mandatory)
+    span       (int)           : 기간 (alpha = 2 / (span + 1)) (span, alpha 중 하나는 Mandatory)
+    alpha      (float)         : 평활 계수 (0 < alpha <= 1)
+    minPeriods (int)           : 상관계수를 계산할 최소 관측 수 (Default: 1)
+
+    [Returns]
+    numpy.ndarray : 일자 x 종목 x 종목 상관계수 (float32)
+    """
+
+    if alpha is None:
+        alpha = 2.0 / (span + 1.0)
+
+    values, _ = _as_2d(values)
+
+    with np.errstate(invalid="ignore"):
+        centered = values - np.nanmean(values, axis=0)
+    valid    = ~np.isnan(centered)
+    masked   = np.where(valid, centered, 0.0)
+    weights  = valid.astype(np.float64)
+
+    num_dates, num_columns = values.shape
+    result = np.full((num_dates, num_columns, num_columns), np.nan, dtype=np.float32)
+
+    count = np.zeros((num_columns, num_columns)) # Observations (Not decayed)
+    w     = np.zeros((num_columns, num_columns)) # Decayed weights
+    sx    = np.zeros((num_columns, num_columns))
+    sxx   = np.zeros((num_columns, num_columns))
+    sxy   = np.zeros((num_columns, num_columns))
+
+    decay = 1.0 - alpha # Every date (Including dates without an observation) decays the sums
+    for t in range(num_dates):
+        x, m = masked[t], weights[t]
+        pair = np.outer(m, m)
+
+        count += pair
+        w      = w   * decay + pair
+        sx     = sx  * decay + np.outer(x, m)
+        sxx    = sxx * decay + np.outer(x * x, m)
+        sxy    = sxy * decay + np.outer(x, x)
+
+        result[t] = np.where(count >= minPeriods, _corr_from_sums(w, sx, sxx, sxy), np.nan)
+
+    return result
@@ -0,0 +1,260 @@
+# dataLoader.py
+
+# Author  : Byeong Heon Lee
+# Contact : lww7438@gmail.com
+
+# Required Modules
+import os
+import re
+import functools
+import numpy  as np
+import pandas as pd
+
+from apiConfig import *
+
+
+
+# * * *   Patterns   * * *
+# One CSV field and its terminator (Quoted fields may contain ',', '\n' and escaped '""')
+CSV_FIELD_PATTERN = re.compile(r'"((?:[^"]|"")*)"(,|\r?\n)|([^,"\r\n]*)(,|\r?\n)')
+
+# ECOS period columns: 2000/01/04 (Daily), 2000/01 (Monthly), 2000Q1 (Quarterly), 2000 (Annual)
+ECOS_PERIOD_PATTERN = re.compile(r"(\d{4})(?:[/.-](\d{2}))?(?:[/.-](\d{2}))?|(\d{4})Q([1-4])")
+
+
+
+# * * *   Classes   * * *
+class SectorPanel:
+    """
+    섹터별 OHLCV를 (필드 x 일자 x 섹터) 3차원 배열로 보관하는 Panel
+    필드별 2차원 배열(일자 x 섹터)은 values의 View이므로 복사 없이 상관계수, 가중치, MDD 등을 바로 계산할 수 있다.
+
+    [Attributes]
+    values  (numpy.ndarray)       : 필드 x 일자 x 섹터 배열 (float64, 값이 없으면 NaN)
+    fields  (list of str)         : 필드명 (SECTOR_FIELDS 순서)
+    dates   (pandas.DatetimeIndex) : 일자 (오름차순)
+    tickers (pandas.Index)         : 섹터 Ticker (sector_ticker, 오름차순)
+    names   (pandas.Categorical)   : tickers 순서의 섹터명 (sector_name)
+    """
+
+    def __init__(self, values:np.ndarray, fields:list, dates:pd.DatetimeIndex, tickers:pd.Index, names:pd.Categorical):
+        self.values  = values
+        self.fields  = list(fields)
+        self.dates   = dates
+        self.tickers = tickers
+        self.names   = names
+
+        self.values.flags.writeable = False # Shared by lru_cache; views must not modify the panel
+
+    @property
+    def shape(self):
+        return self.values.shape
+
+    def field(self, field:str):
+        """
+        field의 일자 x 섹터 배열을 반환한다. (values의 View, 복사 없음)
+        """
+
+        return self.values[self.fields.index(field)]
+
+    def to_frame(self, field:str="Close", useNames:bool=False):
+        """
+        field의 일자 x 섹터 DataFrame을 반환한다. (열: sector_ticker, useNames이면 sector_name)
+        """
+
+        columns = pd.Index(self.names, name="sector_name") if useNames else self.tickers
+        return pd.DataFrame(self.field(field), index=self.dates, columns=columns, copy=False)
+
+    def to_multiindex(self):
+        """
+        (필드, sector_ticker) MultiIndex 열을 갖는 일자 x (필드 x 섹터) DataFrame을 반환한다.
+        """
+
+        columns = pd.MultiIndex.from_product([self.fields, self.tickers], names=["field", "sector_ticker"])
+        data    = self.values.transpose(1, 0, 2).reshape(len(self.dates), -1)
+        return pd.DataFrame(data, index=self.dates, columns=columns)
+
+
+
+# * * *   Functions   * * *
+def iter_csv_fields(file, chunkSize:int=ECOS_CHUNK_SIZE):
+    """
+    텍스트 파일을 chunkSize 글자씩 읽으며 CSV 필드를 하나씩 반환한다. (한 행 전체를 메모리에 올리지 않는다.)
+
+    [Parameters]
+    file      (file) : 텍스트 모드로 연 파일 (Mandatory)
+    chunkSize (int)  : 한 번에 읽을 글자 수 (Default: ECOS_CHUNK_SIZE)
+
+    [Returns]
+    generator of (field, endOfRow) : 필드 값 (str), 행의 마지막 필드인지 여부 (bool)
+    """
+
+    leftover = ""
+
+    while True:
+        chunk = file.read(chunkSize)
+        data  = leftover + chunk
+        pos   = 0
+
+        # Complete fields only (A field without its terminator waits for the next chunk)
+        while True:
+            match = CSV_FIELD_PATTERN.match(data, pos)
+            if match is None or match.end() == pos:
+                break
+
+            if match.group(2) is not None:
+                yield match.group(1).replace('""', '"'), match.group(2) != ","
+            else:
+                yield match.group(3), match.group(4) != ","
+            pos = match.end()
+
+        leftover = data[pos:]
+
+        # End of File
+        if len(chunk) == 0:
+            if len(leftover) > 0:
+                field = leftover[1:-1].replace('""', '"') if leftover.startswith('"') and leftover.endswith('"') else leftover
+                yield field, True
+            return
+
+def parse_ecos_period(period:str):
+    """
+    ECOS 시점 문자열(2000/01/04, 2000/01, 2000Q1, 2000)을 numpy.datetime64[D]로 변환한다. (시점이 아니면 None)
+    """
+
+    match = ECOS_PERIOD_PATTERN.fullmatch(period.strip())
+    if match is None:
+        return None
+
+    # Quarterly: The first day of the quarter
+    if match.group(4) is not None:
+        return np.datetime64(f"{match.group(4)}-{(int(match.group(5)) - 1) * 3 + 1:02d}-01", "D")
+
+    return np.datetime64(f"{match.group(1)}-{match.group(2) or '01'}-{match.group(3) or '01'}", "D")
+
+def load_ecos_wide_csv(path:str, encoding:str="utf-8-sig", dropna:bool=True, chunkSize:int=ECOS_CHUNK_SIZE):
+    """
+    한국은행 경제통계시스템(ECOS)에서 내려받은 가로형 CSV를 (시점, 값)의 세로형 DataFrame으로 읽는다.
+    ECOS CSV는 (통계표, 계정항목, 단위, 변환, 시점1, 시점2, ...) 헤더와 통계 항목별 한 행으로 이루어지며,
+    파일을 chunkSize 글자씩 읽어 필드 단위로 변환하므로 수천 개의 열을 갖는 한 행짜리 DataFrame을 만들지 않는다.
+    (예: load_ecos_wide_csv("../Data/Korea_basemoney_rate.csv"))
+
+    [Parameters]
+    path      (str)  : CSV 파일 경로 (Mandatory)
+    encoding  (str)  : 파일 인코딩 (Default: "utf-8-sig"; BOM 제거)
+    dropna    (bool) : 값이 비어 있는 시점을 제외할지 여부 (Default: True)
+    chunkSize (int)  : 한 번에 읽을 글자 수 (Default: ECOS_CHUNK_SIZE)
+
+    [Returns]
+    df : 세로형 통계 (pandas.DataFrame)
+        통계표, 계정항목, 단위, 변환 (category) : 헤더의 항목 필드 (시점이 아닌 앞쪽 필드)
+        date                         (datetime64) : 시점
+        value                        (float64)    : 값
+    """
+
+    meta_names = []   # Fields before the first period column
+    periods    = []   # numpy.datetime64 of each period column
+
+    meta_columns  = []  # Per row metadata
+    row_lengths   = []  # The number of values of each data row
+    date_indices  = []  # Index of the period of each value
+    values        = []
+
+    with open(path, "r", encoding=encoding, newline="") as file:
+        fields = iter_csv_fields(file, chunkSize)
+
+        # Header
+        for field, end_of_row in fields:
+            period = parse_ecos_period(field) if len(meta_names) > 0 else None
+            if period is None and len(periods) == 0:
+                meta_names.append(field)
+            else:
+                periods.append(period if period is not None else np.datetime64("NaT"))
+            if end_of_row:
+                break
+
+        # Data Rows
+        column = 0
+        meta   = []
+        count  = 0
+        for field, end_of_row in fields:
+            if column < len(meta_names):
+                meta.append(field)
+            elif column - len(meta_names) < len(periods) and field.strip() != "":
+                values.append(float(field.replace(",", "")))
+                date_indices.append(column - len(meta_names))
+                count += 1
+            elif column - len(meta_names) < len(periods) and not dropna:
+                values.append(np.nan)
+                date_indices.append(column - len(meta_names))
+                count += 1
+            column += 1
+
+            if end_of_row:
+                if column > 1 or field != "": # Skip blank lines
+                    meta_columns.append(meta)
+                    row_lengths.append(count)
+                column, meta, count = 0, [], 0
+
+    # Typed Columns
+    periods = np.array(periods, dtype="datetime64[D]")
+    lengths = np.array(row_lengths, dtype=np.int64)
+
+    df = pd.DataFrame()
+    for index, name in enumerate(meta_names):
+        categories = np.array([meta[index] if index < len(meta) else "" for meta in meta_columns], dtype=object)
+        df[name]   = pd.Categorical(np.repeat(categories, lengths))
+    df["date"]  = periods[np.array(date_indices, dtype=np.int64)]
+    df["value"] = np.array(values, dtype=np.float64)
+
+    return df
+
+def load_ecos_series(path:str, encoding:str="utf-8-sig", dropna:bool=True):
+    """
+    통계 항목이 하나인 ECOS 가로형 CSV를 시점을 Index로 하는 pandas.Series로 읽는다. (이름: 계정항목)
+    (예: load_ecos_series("../Data/Korea_basemoney_rate.csv") -> 일별 한국은행 기준금리)
+    """
+
+    df = load_ecos_wide_csv(path, encoding=encoding, dropna=dropna)
+
+    name = str(df[df.columns[1]].iloc[0]) if len(df.columns) > 3 and len(df) > 0 else None
+    return pd.Series(df["value"].to_numpy(), index=pd.DatetimeIndex(df["date"], name="date"), name=name)
+
+@functools.lru_cache(maxsize=8)
+def _load_sector_panel(path:str, mtime:float, encoding:str):
+    # Long rows -> (Field x Date x Sector) without pivot/groupby
+    df = pd.read_csv(
+        path,
+        encoding = encoding,
+        usecols  = ["date", "sector_name", "sector_ticker"] + SECTOR_FIELDS, # Drop the leftover index column
+        dtype    = {"sector_name": "category", "sector_ticker": np.int64, **{field: np.float64 for field in SECTOR_FIELDS}},
+    )
+
+    date_codes, dates     = pd.factorize(pd.to_datetime(df["date"]), sort=True)
+    sector_codes, tickers = pd.factorize(df["sector_ticker"], sort=True)
+
+    values = np.full((len(SECTOR_FIELDS), len(dates), len(tickers)), np.nan)
+    values[:, date_codes, sector_codes] = df[SECTOR_FIELDS].to_numpy(dtype=np.float64).T
+
+    # Sector name of each ticker (The last name in the file wins)
+    names = np.empty(len(tickers), dtype=object)
+    names[sector_codes] = df["sector_name"].astype(str).to_numpy()
+
+    return SectorPanel(values, SECTOR_FIELDS, pd.DatetimeIndex(dates, name="date"), pd.Index(tickers, name="sector_ticker"), pd.Categorical(names))
+
+def load_sector_panel(path:str=SECTOR_MONTHLY_PATH, encoding:str="cp949"):
+    """
+    섹터별 월별/연별 CSV(date, OHLCV, sector_name, sector_ticker)를 읽어 SectorPanel로 반환한다.
+    같은 파일은 한 번만 읽으며 (파일이 바뀌지 않으면 같은 SectorPanel을 반환한다.), 반환된 배열은 읽기 전용이다.
+    (예: load_sector_panel().to_frame("Close").pct_change().corr(), max_drawdown(load_sector_panel().field("Close"), period=60))
+
+    [Parameters]
+    path     (str) : CSV 파일 경로 (Default: SECTOR_MONTHLY_PATH; 월별, 연별은 SECTOR_YEARLY_PATH)
+    encoding (str) : 파일 인코딩 (Default: "cp949")
+
+    [Returns]
+    panel : 필드 x 일자 x 섹터 Panel (SectorPanel)
+    """
+
+    path = os.path.abspath(path)
+    return _load_sector_panel(path, os.path.getmtime(path), encoding)
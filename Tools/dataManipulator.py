@@ -5,10 +5,18 @@
 # Contact : lww7438@gmail.com
 
 # Required Modules
-import requests
+import numpy  as np
+import pandas as pd
 import json                        # JSON Parser
 import xml.etree.ElementTree as ET # XML Parser      
 
+from collections        import deque
+from concurrent.futures import ThreadPoolExecutor, wait, as_completed, FIRST_COMPLETED
+
+from apiConfig  import *
+from apiSession import *
+from dataSchema import *
+
 
 
 # * * *   Functions   * * *
@@ -22,41 +30,123 @@ def set_query_url(service_url : str, params : dict):
     return request_url[:-1] # Eliminate last '&' character 
 
 def filter_params(data_list:list, params:list):
-    filtered_list=[]
+    # Set membership instead of scanning the params list for every key
+    params = set(params)
 
-    for data in data_list:
-        new_dict = dict()
+    return [{k: v for k, v in data.items() if k in params} for data in data_list]
 
-        for k, v in data.items():
-            if k in params:
-                new_dict[k] = v
-            else:
-                continue
-        
-        filtered_list.append(new_dict)
+def format_flt_rt(fltRt):
+    """
+    등락률(fltRt)을 표시용 문자열(+d.dd%, -d.dd%, 0.00%)로 변환한다.
+    숫자 하나, 또는 pandas.Series/배열 전체를 한 번에(vectorized) 변환한다.
 
-    return filtered_list
+    [Parameters]
+    fltRt (float, pandas.Series, array-like) : 등락률 (Mandatory)
 
-def left_join_by_key(ldata:list, rdata:list, key:str):
-    merged_list = []
+    [Returns]
+    fltRt : 표시용 문자열 (str, 또는 입력과 같은 index의 pandas.Series, 결측값은 "")
+    """
+
+    values = np.asarray(fltRt, dtype="float64")
+    texts  = np.char.mod("%+.2f%%", np.round(values, 2))
+    texts  = np.where(np.round(values, 2) == 0, "0.00%", texts)
+    texts  = np.where(np.isnan(values), "", texts)
+
+    if isinstance(fltRt, pd.Series):
+        return pd.Series(texts, index=fltRt.index, name=fltRt.name)
+    if texts.ndim == 0:
+        return str(texts)
+
+    return texts
+
+def index_by_key(data:list, key:str):
+    """
+    data를 key 값 기준의 해시 인덱스로 만든다. (key 값 -> 해당 값을 가진 dict 목록, 입력 순서 유지)
+    key가 없거나 값이 None인 dict는 인덱스에 포함하지 않는다.
+    """
+
+    index = dict()
+
+    for item in data:
+        value = item.get(key, None)
+        if value is not None:
+            index.setdefault(value, []).append(item)
+
+    return index
 
-    for data in ldata:
-        merged_list.append(data)
+def join_by_key(ldata:list, rdata:list, key:str, how:str="left", keep:str="all", asFrame:bool=False):
+    """
+    ldata와 rdata를 key 값 기준으로 병합한다. (rdata의 해시 인덱스를 사용하므로 O(n + m))
+    입력 dict는 변경하지 않으며, 같은 필드가 있으면 rdata의 값을 사용한다.
 
-    for item in merged_list:
-        for data in rdata:
-            if item[key] == data[key]:
-                for k, v in data.items():
-                    item[k] = v
+    [Parameters]
+    ldata   (list of dict) : 왼쪽 데이터 (Mandatory)
+    rdata   (list of dict) : 오른쪽 데이터 (Mandatory)
+    key     (str)          : 병합 기준 필드명 (Mandatory)
+    how     (str)          : 병합 방식 ("left", "inner", "outer") (Default: "left")
+    keep    (str)          : key 값이 같은 rdata가 여러 개일 때 사용할 dict
+                             "all"  : 모두 사용 (one-to-many, 왼쪽 dict 하나가 여러 결과로 나뉨)
+                             "first": 첫 번째 dict만 사용 (many-to-one)
+                             "last" : 마지막 dict만 사용 (many-to-one) (Default: "all")
+    asFrame (bool)         : pandas.DataFrame으로 반환할지 여부 (Default: False)
+
+    [Returns]
+    merged_list : 병합 결과 (list of dict 또는 pandas.DataFrame)
+        how="left"  : ldata 순서, 일치하는 rdata가 없으면 ldata의 dict 그대로
+        how="inner" : ldata 순서, 일치하는 rdata가 있는 경우만
+        how="outer" : how="left" 결과 뒤에 ldata와 일치하지 않은 rdata를 추가 (key 값이 없는 rdata는 제외)
+    """
+
+    if how not in ("left", "inner", "outer"):
+        raise ValueError(f"Invalid join type: {how}")
+    if keep not in ("all", "first", "last"):
+        raise ValueError(f"Invalid keep option: {keep}")
+
+    # Hash Index on rdata
+    rindex = index_by_key(rdata, key)
+    if keep == "first":
+        rindex = {value: items[:1] for value, items in rindex.items()}
+    elif keep == "last":
+        rindex = {value: items[-1:] for value, items in rindex.items()}
+
+    merged_list  = []
+    matched_keys = set()
+
+    for litem in ldata:
+        ritems = rindex.get(litem.get(key, None), None)
+
+        if ritems is None:
+            if how != "inner":
+                merged_list.append(dict(litem))
+            continue
+
+        matched_keys.add(litem[key])
+        for ritem in ritems:
+            merged_item = dict(litem)
+            merged_item.update(ritem)
+            merged_list.append(merged_item)
+
+    # Unmatched rdata
+    if how == "outer":
+        for value, ritems in rindex.items():
+            if value not in matched_keys:
+                merged_list.extend(dict(ritem) for ritem in ritems)
+
+    if asFrame:
+        return pd.DataFrame.from_records(merged_list)
 
     return merged_list
 
+def left_join_by_key(ldata:list, rdata:list, key:str):
+    # Many-to-one left join; the last matching rdata wins (Same as the former nested-loop implementation)
+    return join_by_key(ldata, rdata, key, how="left", keep="last")
+
 def request_data_to_api(serviceUrl:str, queryParams:dict):
-    response = requests.get(set_query_url(service_url=serviceUrl, params=queryParams))
+    response = http_get(set_query_url(service_url=serviceUrl, params=queryParams))
 
     # Parsing
     try:
-        items = json.loads(response.text)['OutBlock_1']
+        items = json.loads(response)['OutBlock_1']
     except:
         return None
 
@@ -66,4 +156,103 @@ def request_data_to_api(serviceUrl:str, queryParams:dict):
         return items
     else:
         print(f"Fail: {serviceUrl[4:]}")
-        return None
\ No newline at end of file
+        return None
+
+def parse_data_go_kr_response(text:str, fields:list=None, schema:dict=None):
+    """
+    공공데이터포털(apis.data.go.kr) JSON 응답을 header, body, item 목록으로 분리한다.
+    검색 결과가 없으면 빈 item 목록을 반환하며, 응답 형식이 올바르지 않으면 ValueError를 발생시킨다.
+    fields가 주어지면 JSON 객체를 만드는 단계(object_pairs_hook)에서 fields에 없는 필드를 버리므로,
+    필드가 많은 응답(예: 기업개요조회)도 필요한 필드의 dict만 만들어진다.
+
+    [Parameters]
+    text   (str)  : JSON 응답 (Mandatory)
+    fields (list) : item에 남길 필드 목록 (Default: None; 전체 필드)
+    schema (dict) : 필드명 -> 필드 타입 (Default: None; 변환 없이 문자열 그대로)
+                    주어지면 남긴 필드의 값을 decode_value로 변환한다. (예: API_SCHEMAS["corp_outline"])
+    """
+
+    object_pairs_hook = None
+    if fields is not None or schema:
+        keep       = set(fields) | DATA_GO_KR_ENVELOPE_KEYS if fields is not None else None
+        converters = {field: fieldType for field, fieldType in (schema or dict()).items() if keep is None or field in keep}
+
+        def object_pairs_hook(pairs):
+            # Called for every JSON object (Innermost first); envelope keys are kept so header/body survive
+            if len(converters) == 0:
+                return dict(pairs) if keep is None else {key: value for key, value in pairs if key in keep}
+            return {key: decode_value(value, converters[key]) if key in converters else value for key, value in pairs if keep is None or key in keep}
+
+    try:
+        response = json.loads(text, object_pairs_hook=object_pairs_hook)["response"]
+        header   = response["header"]
+        body     = response["body"]
+    except (ValueError, KeyError, TypeError):
+        raise ValueError(f"Invalid response: {text[:200]}")
+
+    items = body.get("items", None)
+    items = items.get("item", []) if isinstance(items, dict) else [] # "items" is "" when there is no result
+    items = [items] if isinstance(items, dict) else items
+
+    return header, body, items
+
+def iter_data_go_kr_items(serviceUrl:str, queryParams:dict, numOfRows:int=DATA_GO_KR_PAGE_SIZE, numWorkers:int=MAX_WORKERS_API_CALL, ordered:bool=False, fields:list=None, schema:dict=None):
+    """
+    공공데이터포털 목록 API의 전체 검색 결과를 페이지 단위로 나누어 조회하며 item을 하나씩 반환한다. (Generator)
+    첫 페이지의 totalCount로 전체 페이지 수를 구하고, 나머지 페이지는 numWorkers개씩 동시에 조회한다.
+    동시에 메모리에 올라가는 페이지는 최대 numWorkers개이며, item은 도착한 페이지 순서대로 반환된다. (ordered이면 페이지 번호 순서)
+
+    [Parameters]
+    serviceUrl  (str)  : 공공데이터포털 API URL (Mandatory)
+    queryParams (dict) : 쿼리 파라미터 (pageNo, numOfRows, resultType 제외) (Mandatory)
+    numOfRows   (int)  : 한 페이지 결과 수 (Default: DATA_GO_KR_PAGE_SIZE)
+    numWorkers  (int)  : 동시에 조회할 페이지 수 (Default: MAX_WORKERS_API_CALL)
+    ordered     (bool) : 페이지 번호 순서대로 반환할지 여부 (Default: False; 도착 순서)
+    fields      (list) : item에 남길 필드 목록 (Default: None; 전체 필드, parse_data_go_kr_response 참고)
+    schema      (dict) : 남긴 필드의 타입 변환에 사용할 스키마 (Default: None; 문자열 그대로)
+
+    [Returns]
+    item : 검색 결과 (Generator of dict)
+    """
+
+    def fetch(pageNo):
+        page_params = dict(queryParams, pageNo=pageNo, numOfRows=numOfRows, resultType="json")
+        try:
+            return parse_data_go_kr_response(http_get(set_query_url(service_url=serviceUrl, params=page_params)), fields=fields, schema=schema)
+        except ValueError as err_msg:
+            raise ValueError(f"Fail: {serviceUrl[7:]} (pageNo={pageNo}) {err_msg}")
+
+    # First Page
+    header, body, items = fetch(1)
+    yield from items
+
+    total_pages = (int(body.get("totalCount", 0)) + numOfRows - 1) // numOfRows
+    next_pages  = iter(range(2, total_pages + 1))
+
+    # Remaining Pages in Page Order (At most numWorkers pages in flight)
+    if ordered:
+        with ThreadPoolExecutor(max_workers=max(numWorkers, 1)) as executor:
+            in_flight = deque()
+            for pageNo in next_pages:
+                in_flight.append(executor.submit(fetch, pageNo))
+                if len(in_flight) >= numWorkers:
+                    yield from in_flight.popleft().result()[2]
+
+            while len(in_flight) > 0:
+                yield from in_flight.popleft().result()[2]
+        return
+
+    # Remaining Pages (At most numWorkers pages in flight)
+    with ThreadPoolExecutor(max_workers=max(numWorkers, 1)) as executor:
+        in_flight = set()
+        for pageNo in next_pages:
+            in_flight.add(executor.submit(fetch, pageNo))
+            if len(in_flight) < numWorkers:
+                continue
+
+            done, in_flight = wait(in_flight, return_when=FIRST_COMPLETED)
+            for future in done:
+                yield from future.result()[2]
+
+        for future in as_completed(in_flight):
+            yield from future.result()[2]
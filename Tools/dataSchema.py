@@ -0,0 +1,642 @@
+# dataSchema.py
+
+# Author  : Byeong Heon Lee
+# Contact : lww7438@gmail.com
+
+# Required Modules
+import re
+import threading
+import numpy  as np
+import pandas as pd
+
+
+
+# * * *   Field Types   * * *
+# "date"     : YYYYMMDD string          -> datetime64[ns]
+# "int"      : Number (comma separated) -> Int64 (Nullable) / float64 (if not integral)
+# "float"    : Number (comma separated) -> float64
+# "category" : Repeated label           -> category
+# "str"      : Identifier, Name         -> object (str)
+
+NUMBER_PATTERN = r"[+-]?(\d+\.?\d*|\.\d+)([eE][+-]?\d+)?" # Number without comma (Others are decoded as NaN)
+NUMBER_REGEX   = re.compile(NUMBER_PATTERN)
+BLANK_LABELS   = {"", "-"} # "category" values decoded as missing (decode_column, RecordAccumulator)
+
+
+
+# * * *   Schemas (KRX Open API)   * * *
+SCHEMA_INDEX_DAILY_PRICE = { # KRX/KOSPI/KOSDAQ 시리즈 일별시세정보, 파생상품지수 시세정보
+    "BAS_DD"        : "date",     # 기준일자
+    "IDX_CLSS"      : "category", # 계열구분
+    "IDX_NM"        : "category", # 지수명
+    "CLSPRC_IDX"    : "float",    # 종가
+    "CMPPREVDD_IDX" : "float",    # 대비
+    "FLUC_RT"       : "float",    # 등락률
+    "OPNPRC_IDX"    : "float",    # 시가
+    "HGPRC_IDX"     : "float",    # 고가
+    "LWPRC_IDX"     : "float",    # 저가
+    "ACC_TRDVOL"    : "int",      # 거래량
+    "ACC_TRDVAL"    : "int",      # 거래대금
+    "MKTCAP"        : "int",      # 상장시가총액
+}
+
+SCHEMA_BOND_INDEX_DAILY_PRICE = { # 채권지수 시세정보
+    "BAS_DD"                     : "date",     # 기준일자
+    "BND_IDX_GRP_NM"             : "category", # 지수명
+    "TOT_EARNG_IDX"              : "float",    # 총수익지수_종가
+    "TOT_EARNG_IDX_CMPPREVDD"    : "float",    # 총수익지수_대비
+    "NETPRC_IDX"                 : "float",    # 순가격지수_종가
+    "NETPRC_IDX_CMPPREVDD"       : "float",    # 순가격지수_대비
+    "ZERO_REINVST_IDX"           : "float",    # 제로재투자지수_종가
+    "ZERO_REINVST_IDX_CMPPREVDD" : "float",    # 제로재투자지수_대비
+    "CALL_REINVST_IDX"           : "float",    # 콜재투자지수_종가
+    "CALL_REINVST_IDX_CMPPREVDD" : "float",    # 콜재투자지수_대비
+    "MKT_PRC_IDX"                : "float",    # 시장가격지수_종가
+    "MKT_PRC_IDX_CMPPREVDD"      : "float",    # 시장가격지수_대비
+    "AVG_DURATION"               : "float",    # 듀레이션
+    "AVG_CONVEXITY_PRC"          : "float",    # 컨벡시티
+    "BND_IDX_AVG_YD"             : "float",    # YTM
+}
+
+SCHEMA_STOCK_DAILY_TRADING = { # 유가증권/코스닥/코넥스 일별매매정보
+    "BAS_DD"        : "date",     # 기준일자
+    "ISU_CD"        : "str",      # 종목코드
+    "ISU_NM"        : "str",      # 종목명
+    "MKT_NM"        : "category", # 시장구분
+    "SECT_TP_NM"    : "category", # 소속부
+    "TDD_CLSPRC"    : "float",    # 종가
+    "CMPPREVDD_PRC" : "float",    # 대비
+    "FLUC_RT"       : "float",    # 등락률
+    "TDD_OPNPRC"    : "float",    # 시가
+    "TDD_HGPRC"     : "float",    # 고가
+    "TDD_LWPRC"     : "float",    # 저가
+    "ACC_TRDVOL"    : "int",      # 거래량
+    "ACC_TRDVAL"    : "int",      # 거래대금
+    "MKTCAP"        : "int",      # 시가총액
+    "LIST_SHRS"     : "int",      # 상장주식수
+}
+
+SCHEMA_SW_DAILY_TRADING = { # 신주인수권증권 일별매매정보
+    **{field: SCHEMA_STOCK_DAILY_TRADING[field] for field in ["BAS_DD", "MKT_NM", "ISU_CD", "ISU_NM", "TDD_CLSPRC", "CMPPREVDD_PRC", "FLUC_RT", "TDD_OPNPRC", "TDD_HGPRC", "TDD_LWPRC", "ACC_TRDVOL", "ACC_TRDVAL", "MKTCAP", "LIST_SHRS"]},
+    "EXER_PRC"             : "float", # 행사가격
+    "EXST_STRT_DD"         : "date",  # 존속기간_시작일
+    "EXST_END_DD"          : "date",  # 존속기간_종료일
+    "TARSTK_ISU_SRT_CD"    : "str",   # 목적주권_종목코드
+    "TARSTK_ISU_NM"        : "str",   # 목적주권_종목명
+    "TARSTK_ISU_PRSNT_PRC" : "float", # 목적주권_종가
+}
+
+SCHEMA_SR_DAILY_TRADING = { # 신주인수권증서 일별매매정보
+    **{field: SCHEMA_STOCK_DAILY_TRADING[field] for field in ["BAS_DD", "MKT_NM", "ISU_CD", "ISU_NM", "TDD_CLSPRC", "CMPPREVDD_PRC", "FLUC_RT", "TDD_OPNPRC", "TDD_HGPRC", "TDD_LWPRC", "ACC_TRDVOL", "ACC_TRDVAL", "MKTCAP", "LIST_SHRS"]},
+    "ISU_PRC"              : "float", # 신주발행가
+    "DELIST_DD"            : "date",  # 상장폐지일
+    "TARSTK_ISU_SRT_CD"    : "str",   # 목적주권_종목코드
+    "TARSTK_ISU_NM"        : "str",   # 목적주권_종목명
+    "TARSTK_ISU_PRSNT_PRC" : "float", # 목적주권_종가
+}
+
+SCHEMA_STOCK_BASE_INFO = { # 유가증권/코스닥/코넥스 종목기본정보
+    "ISU_CD"             : "str",      # 표준코드
+    "ISU_SRT_CD"         : "str",      # 단축코드
+    "ISU_NM"             : "str",      # 한글 종목명
+    "ISU_ABBRV"          : "str",      # 한글 종목약명
+    "ISU_ENG_NM"         : "str",      # 영문 종목명
+    "LIST_DD"            : "date",     # 상장일
+    "MKT_TP_NM"          : "category", # 시장구분
+    "SECUGRP_NM"         : "category", # 증권구분
+    "SECT_TP_NM"         : "category", # 소속부
+    "KIND_STKCERT_TP_NM" : "category", # 주식종류
+    "PARVAL"             : "float",    # 액면가
+    "LIST_SHRS"          : "int",      # 상장주식수
+}
+
+SCHEMA_ETP_DAILY_TRADING = { # ETF/ETN/ELW 일별매매정보
+    "BAS_DD"                   : "date",     # 기준일자
+    "ISU_CD"                   : "str",      # 종목코드
+    "ISU_NM"                   : "str",      # 종목명
+    "TDD_CLSPRC"               : "float",    # 종가
+    "CMPPREVDD_PRC"            : "float",    # 대비
+    "FLUC_RT"                  : "float",    # 등락률
+    "NAV"                      : "float",    # 순자산가치 (NAV)
+    "TDD_OPNPRC"               : "float",    # 시가
+    "TDD_HGPRC"                : "float",    # 고가
+    "TDD_LWPRC"                : "float",    # 저가
+    "ACC_TRDVOL"               : "int",      # 거래량
+    "ACC_TRDVAL"               : "int",      # 거래대금
+    "MKTCAP"                   : "int",      # 시가총액
+    "INVSTASST_NETASST_TOTAMT" : "int",      # 순자산총액
+    "LIST_SHRS"                : "int",      # 상장좌수
+    "IDX_IND_NM"               : "category", # 기초지수_지수명
+    "OBJ_STKPRC_IDX"           : "float",    # 기초지수_종가
+    "CMPPREVDD_IDX"            : "float",    # 기초지수_대비
+    "FLUC_RT_IDX"              : "float",    # 기초지수_등락률
+}
+
+SCHEMA_BOND_DAILY_TRADING = { # 국채전문유통시장/일반채권시장/소액채권시장 일별매매정보
+    "BAS_DD"           : "date",     # 기준일자
+    "MKT_NM"           : "category", # 시장구분
+    "ISU_CD"           : "str",      # 종목코드
+    "ISU_NM"           : "str",      # 종목명
+    "BND_EXP_TP_NM"    : "category", # 만기년수 (국채전문유통시장)
+    "GOVBND_ISU_TP_NM" : "category", # 종목구분 (국채전문유통시장)
+    "CLSPRC"           : "float",    # 종가_가격
+    "CMPPREVDD_PRC"    : "float",    # 종가_대비
+    "CLSPRC_YD"        : "float",    # 종가_수익률
+    "OPNPRC"           : "float",    # 시가_가격
+    "OPNPRC_YD"        : "float",    # 시가_수익률
+    "HGPRC"            : "float",    # 고가_가격
+    "HGPRC_YD"         : "float",    # 고가_수익률
+    "LWPRC"            : "float",    # 저가_가격
+    "LWPRC_YD"         : "float",    # 저가_수익률
+    "ACC_TRDVOL"       : "int",      # 거래량
+    "ACC_TRDVAL"       : "int",      # 거래대금
+}
+
+SCHEMA_PETROLEUM_MARKET_DAILY_TRADING = { # 석유시장 일별매매정보
+    "BAS_DD"         : "date",     # 기준일자
+    "OIL_NM"         : "category", # 유종구분
+    "WT_AVG_PRC"     : "float",    # 가중평균가격_경쟁
+    "WT_DIS_AVG_PRC" : "float",    # 가중평균가격_합의
+    "ACC_TRDVOL"     : "int",      # 거래량
+    "ACC_TRDVAL"     : "int",      # 거래대금
+}
+
+SCHEMA_COMMODITY_DAILY_TRADING = { # 금시장/배출권 시장 일별매매정보
+    "BAS_DD"        : "date",  # 기준일자
+    "ISU_CD"        : "str",   # 종목코드
+    "ISU_NM"        : "str",   # 종목명
+    "TDD_CLSPRC"    : "float", # 종가
+    "CMPPREVDD_PRC" : "float", # 대비
+    "FLUC_RT"       : "float", # 등락률
+    "TDD_OPNPRC"    : "float", # 시가
+    "TDD_HGPRC"     : "float", # 고가
+    "TDD_LWPRC"     : "float", # 저가
+    "ACC_TRDVOL"    : "int",   # 거래량
+    "ACC_TRDVAL"    : "int",   # 거래대금
+}
+
+
+
+# * * *   Schemas (공공데이터포털)   * * *
+SCHEMA_CORP_OUTLINE = { # 금융위원회_기업기본정보: 기업개요조회
+    "basDt"               : "date",     # 기준일자
+    "crno"                : "str",      # 법인등록번호
+    "corpNm"              : "str",      # 법인명
+    "corpEnsnNm"          : "str",      # 법인영문명
+    "enpPbanCmpyNm"       : "str",      # 기업공시회사명
+    "enpRprFnm"           : "str",      # 기업대표자성명
+    "corpRegMrktDcd"      : "category", # 법인등록시장구분코드
+    "corpRegMrktDcdNm"    : "category", # 법인등록시장구분코드명
+    "corpDcd"             : "category", # 법인구분코드
+    "corpDcdNm"           : "category", # 법인구분코드명
+    "bzno"                : "str",      # 사업자등록번호
+    "enpOzpno"            : "str",      # 기업구우편번호
+    "enpBsadr"            : "str",      # 기업기본주소
+    "enpDtadr"            : "str",      # 기업상세주소
+    "enpHmpgUrl"          : "str",      # 기업홈페이지URL
+    "enpTlno"             : "str",      # 기업전화번호
+    "enpFxno"             : "str",      # 기업팩스번호
+    "sicNm"               : "category", # 표준산업분류명
+    "enpEstbDt"           : "date",     # 기업설립일자
+    "enpStacMm"           : "category", # 기업결산월
+    "enpXchgLstgDt"       : "date",     # 기업거래소상장일자
+    "enpXchgLstgAbolDt"   : "date",     # 기업거래소상장폐지일자
+    "enpKosdaqLstgDt"     : "date",     # 기업코스닥상장일자
+    "enpKosdaqLstgAbolDt" : "date",     # 기업코스닥상장폐지일자
+    "enpKrxLstgDt"        : "date",     # 기업KONEX상장일자
+    "enpKrxLstgAbolDt"    : "date",     # 기업KONEX상장폐지일자
+    "smenpYn"             : "category", # 중소기업여부
+    "enpMntrBnkNm"        : "category", # 기업주거래은행명
+    "enpEmpeCnt"          : "int",      # 기업종업원수
+    "empeAvgCnwkTermCtt"  : "str",      # 종업원평균근속기간내용
+    "enpPn1AvgSlryAmt"    : "int",      # 기업1인평균급여금액
+    "actnAudpnNm"         : "category", # 회계감사인명
+    "audtRptOpnnCtt"      : "category", # 감사보고서의견내용
+    "enpMainBizNm"        : "str",      # 기업주요사업명
+    "fssCorpUnqNo"        : "str",      # 금융감독원법인고유번호
+    "fssCorpChgDtm"       : "str",      # 금융감독원법인변경일시
+}
+
+SCHEMA_STOC_ISSU_STAT = { # 금융위원회_주식발행정보: 주식발행현황조회
+    "basDt"          : "date", # 기준일자
+    "crno"           : "str",  # 법인등록번호
+    "stckIssuCmpyNm" : "str",  # 주식 발행 회사명
+    "onskTisuCnt"    : "int",  # 보통주 총 발행수
+    "pfstTisuCnt"    : "int",  # 우선주 총 발행수
+}
+
+SCHEMA_KRX_LISTED_INFO = { # 금융위원회_KRX상장종목정보
+    "basDt"     : "date",     # 기준일자
+    "srtnCd"    : "str",      # 단축코드
+    "isinCd"    : "str",      # ISIN코드
+    "mrktCtg"   : "category", # 시장 구분 (KOSPI/KOSDAQ/KONEX 등)
+    "itmsNm"    : "str",      # 종목명
+    "crno"      : "str",      # 법인등록번호
+    "corpNm"    : "str",      # 법인명
+    "shotnIsin" : "str",      # 단축 ISIN 코드 (6자리)
+}
+
+SCHEMA_ITEM_BASI_INFO = { # 금융위원회_주식발행정보: 종목기본정보조회
+    "basDt"          : "date",     # 기준일자
+    "crno"           : "str",      # 법인등록번호
+    "isinCd"         : "str",      # ISIN코드
+    "stckIssuCmpyNm" : "str",      # 주식발행회사명
+    "isinCdNm"       : "str",      # ISIN코드명
+    "scrsItmsKcd"    : "category", # 유가증권종목종류코드
+    "scrsItmsKcdNm"  : "category", # 유가증권종목종류코드명
+    "stckParPrc"     : "float",    # 주식액면가
+    "issuStckCnt"    : "int",      # 발행주식수
+    "lstgDt"         : "date",     # 상장일자
+    "lstgAbolDt"     : "date",     # 상장폐지일자
+    "dpsgRegDt"      : "date",     # 예탁등록일자
+    "dpsgCanDt"      : "date",     # 예탁취소일자
+    "issuFrmtClsfNm" : "category", # 발행형태구분명
+}
+
+SCHEMA_SUMM_FINA_STAT = { # 금융위원회_기업 재무정보: 요약재무제표조회
+    "basDt"         : "date",     # 기준일자
+    "crno"          : "str",      # 법인등록번호
+    "bizYear"       : "category", # 사업연도
+    "fnclDcd"       : "category", # 재무제표구분코드
+    "fnclDcdNm"     : "category", # 재무제표구분코드명
+    "enpSaleAmt"    : "int",      # 기업매출금액
+    "enpBzopPft"    : "int",      # 기업영업이익
+    "iclsPalClcAmt" : "int",      # 포괄손익계산금액
+    "enpCrtmNpf"    : "int",      # 기업당기순이익
+    "enpTastAmt"    : "int",      # 기업총자산금액
+    "enpTdbtAmt"    : "int",      # 기업총부채금액
+    "enpTcptAmt"    : "int",      # 기업총자본금액
+    "enpCptlAmt"    : "int",      # 기업자본금액
+    "fnclDebtRto"   : "float",    # 재무제표부채비율
+}
+
+SCHEMA_STOCK_PRICE_INFO = { # 금융위원회_주식시세정보: 주식시세
+    "basDt"      : "date",     # 기준일자
+    "srtnCd"     : "str",      # 단축코드
+    "isinCd"     : "str",      # ISIN코드
+    "itmsNm"     : "str",      # 종목명
+    "mrktCtg"    : "category", # 시장 구분 (KOSPI/KOSDAQ/KONEX 중 1)
+    "clpr"       : "float",    # 종가
+    "vs"         : "float",    # 대비
+    "fltRt"      : "float",    # 등락률
+    "mkp"        : "float",    # 시가
+    "hipr"       : "float",    # 고가
+    "lopr"       : "float",    # 저가
+    "trqu"       : "int",      # 거래량
+    "trPrc"      : "int",      # 거래대금
+    "lstgStCnt"  : "int",      # 상장주식수
+    "mrktTotAmt" : "int",      # 시가총액
+}
+
+SCHEMA_STOCK_MARKET_INDEX = { # 금융위원회_지수시세정보: 주가지수시세
+    "basDt"          : "date",     # 기준일자
+    "idxCsf"         : "category", # 지수의 분류명칭
+    "idxNm"          : "category", # 지수의 명칭
+    "basPntm"        : "date",     # 기준시점
+    "basIdx"         : "float",    # 기준시점의 지수값
+    "epyItmsCnt"     : "int",      # 채용 종목 수
+    "clpr"           : "float",    # 종가
+    "vs"             : "float",    # 대비
+    "fltRt"          : "float",    # 등락률
+    "mkp"            : "float",    # 시가
+    "hipr"           : "float",    # 고가
+    "lopr"           : "float",    # 저가
+    "trqu"           : "int",      # 거래량 총합
+    "trPrc"          : "int",      # 거래대금 총합
+    "lstgMrktTotAmt" : "int",      # 상장시가총액
+    "lsYrEdVsFltRg"  : "float",    # 전년말대비 등락폭
+    "lsYrEdVsFltRt"  : "float",    # 전년말대비 등락율
+    "yrWRcrdHgst"    : "float",    # 연중최고치
+    "yrWRcrdHgstDt"  : "date",     # 연중최고치 기록일
+    "yrWRcrdLwst"    : "float",    # 연중최저치
+    "yrWRcrdLwstDt"  : "date",     # 연중최저치 기록일
+}
+
+SCHEMA_ISSUCO_BASIC_INFO = { # 한국예탁결제원_기업정보서비스: 기업기본정보 기업개요 조회
+    "agOrgTpcd"        : "category", # 대행기관구분코드
+    "agOrgTpcdNm"      : "category", # 대행기관명
+    "apliDt"           : "date",     # 상장일
+    "apliDtY"          : "date",     # 예탁지정일
+    "bizno"            : "str",      # 사업자번호
+    "caltotMartTpcd"   : "category", # 시장구분코드
+    "caltotMartTpcdNm" : "category", # 시장구분명
+    "custXtinDt"       : "date",     # 회사소멸일
+    "founDt"           : "date",     # 설립일
+    "issucoCustno"     : "str",      # 발행회사번호
+    "pval"             : "float",    # 액면가
+    "pvalStkqty"       : "int",      # 수권자본금
+    "setaccMmdd"       : "category", # 결산월
+    "shotnIsin"        : "str",      # 단축코드
+    "totalStkCnt"      : "int",      # 총발행주식수
+}
+
+# Endpoint Name (get_<name> in apiHandler) -> Schema
+API_SCHEMAS = {
+    "krx_series_daily_price"            : SCHEMA_INDEX_DAILY_PRICE,
+    "kospi_series_daily_price"          : SCHEMA_INDEX_DAILY_PRICE,
+    "kosdaq_series_daily_price"         : SCHEMA_INDEX_DAILY_PRICE,
+    "bond_index_daily_price"            : SCHEMA_BOND_INDEX_DAILY_PRICE,
+    "derivative_index_daily_price"      : SCHEMA_INDEX_DAILY_PRICE,
+    "kospi_daily_trading"               : SCHEMA_STOCK_DAILY_TRADING,
+    "kosdaq_daily_trading"              : SCHEMA_STOCK_DAILY_TRADING,
+    "konex_daily_trading"               : SCHEMA_STOCK_DAILY_TRADING,
+    "sw_daily_trading"                  : SCHEMA_SW_DAILY_TRADING,
+    "sr_daily_trading"                  : SCHEMA_SR_DAILY_TRADING,
+    "kospi_base_info"                   : SCHEMA_STOCK_BASE_INFO,
+    "kosdaq_base_info"                  : SCHEMA_STOCK_BASE_INFO,
+    "konex_base_info"                   : SCHEMA_STOCK_BASE_INFO,
+    "etf_daily_trading"                 : SCHEMA_ETP_DAILY_TRADING,
+    "etn_daily_trading"                 : SCHEMA_ETP_DAILY_TRADING,
+    "elw_daily_trading"                 : SCHEMA_ETP_DAILY_TRADING,
+    "gov_bond_daily_trading"            : SCHEMA_BOND_DAILY_TRADING,
+    "general_bond_daily_trading"        : SCHEMA_BOND_DAILY_TRADING,
+    "small_bond_daily_trading"          : SCHEMA_BOND_DAILY_TRADING,
+    "petroleum_market_daily_trading"    : SCHEMA_PETROLEUM_MARKET_DAILY_TRADING,
+    "gold_market_daily_trading"         : SCHEMA_COMMODITY_DAILY_TRADING,
+    "carbon_credit_market_daily_trading": SCHEMA_COMMODITY_DAILY_TRADING,
+    "corp_outline"                      : SCHEMA_CORP_OUTLINE,
+    "stoc_issu_stat"                    : SCHEMA_STOC_ISSU_STAT,
+    "krx_listed_info"                   : SCHEMA_KRX_LISTED_INFO,
+    "item_basi_info"                    : SCHEMA_ITEM_BASI_INFO,
+    "summ_fina_stat"                    : SCHEMA_SUMM_FINA_STAT,
+    "stock_price_info"                  : SCHEMA_STOCK_PRICE_INFO,
+    "stock_market_index"                : SCHEMA_STOCK_MARKET_INDEX,
+    "issuco_basic_info"                 : SCHEMA_ISSUCO_BASIC_INFO,
+}
+
+# get_financials_kr: KRX상장종목정보에 각 API의 item을 병합한 순서대로 (같은 필드는 나중에 병합한 API의 타입)
+SCHEMA_FINANCIALS_KR = {
+    "id" : "int", # 종목 순번
+    **SCHEMA_KRX_LISTED_INFO,
+    **SCHEMA_CORP_OUTLINE,
+    **SCHEMA_ISSUCO_BASIC_INFO,
+    **SCHEMA_STOC_ISSU_STAT,
+    **SCHEMA_ITEM_BASI_INFO,
+    **SCHEMA_SUMM_FINA_STAT,
+    **SCHEMA_STOCK_PRICE_INFO,
+}
+
+
+
+# * * *   Classes   * * *
+class RecordAccumulator:
+    """
+    고정된 schema의 레코드를 필드별 배열(Column)에 채워 넣는 Accumulator
+    레코드마다 dict를 유지하지 않고, 행 번호(row)의 위치에 필드 타입별 배열로 바로 기록한다.
+        "float"    : float64 (결측값 NaN)
+        "int"      : int64 + 결측 Mask (정수가 아닌 값이 들어오면 float64로 변환)
+        "date"     : datetime64[ns] (결측값 NaT)
+        "category" : int32 Code (결측값 -1) + 범주 목록
+        "str"      : object (결측값 None)
+    schema에 없는 필드는 기록하지 않으며, 숫자 필드의 천 단위 구분 기호(,)와 백분율 기호(%)는 제거한다.
+
+    [Parameters]
+    schema (dict) : 필드명 -> 필드 타입 ("date", "int", "float", "category", "str") (Mandatory)
+    size   (int)  : 레코드 수 (Mandatory)
+    """
+
+    def __init__(self, schema:dict, size:int):
+        self.schema = dict(schema)
+        self.size   = size
+
+        self._values     = dict() # Field -> Column array
+        self._masks      = dict() # "int" Field -> Missing mask
+        self._categories = dict() # "category" Field -> {Category -> Code}
+        self._lock       = threading.Lock() # Rows may be filled from worker threads
+
+        for field, fieldType in self.schema.items():
+            if fieldType == "float":
+                self._values[field] = np.full(size, np.nan, dtype=np.float64)
+            elif fieldType == "int":
+                self._values[field] = np.zeros(size, dtype=np.int64)
+                self._masks[field]  = np.ones(size, dtype=bool)
+            elif fieldType == "date":
+                self._values[field] = np.full(size, np.datetime64("NaT"), dtype="datetime64[ns]")
+            elif fieldType == "category":
+                self._values[field]     = np.full(size, -1, dtype=np.int32)
+                self._categories[field] = dict()
+            else:
+                self._values[field] = np.full(size, None, dtype=object)
+
+    @classmethod
+    def from_items(cls, items:list, schema:dict):
+        """
+        item 목록(list of dict)으로 채운 RecordAccumulator를 반환한다. (item 순서가 행 번호)
+        """
+
+        records = cls(schema, len(items))
+        for row, item in enumerate(items):
+            records.set(row, item)
+
+        return records
+
+    def __len__(self):
+        return self.size
+
+    @property
+    def nbytes(self):
+        # Object columns count the pointers only
+        return sum(values.nbytes for values in self._values.values()) + sum(mask.nbytes for mask in self._masks.values())
+
+    @staticmethod
+    def _parse_number(value):
+        if value is None:
+            return np.nan
+        if isinstance(value, (int, float, np.number)):
+            return float(value)
+
+        value = str(value).replace(",", "").strip().rstrip("%")
+        return float(value) if NUMBER_REGEX.fullmatch(value) else np.nan
+
+    @staticmethod
+    def _parse_date(value):
+        value = re.sub(r"[-/.]", "", str(value)) if value is not None else ""
+        if len(value) != 8 or not value.isdigit():
+            return np.datetime64("NaT")
+
+        try:
+            return np.datetime64(f"{value[:4]}-{value[4:6]}-{value[6:]}", "ns")
+        except ValueError:
+            return np.datetime64("NaT")
+
+    def set(self, row:int, item:dict):
+        """
+        row번째 레코드에 item의 필드를 기록한다. (dict.update와 같이 item에 있는 필드만 덮어쓴다.)
+        """
+
+        with self._lock:
+            self._set(row, item)
+
+    def _set(self, row:int, item:dict):
+        for field, value in item.items():
+            fieldType = self.schema.get(field, None)
+            if fieldType is None:
+                continue
+
+            if fieldType == "float":
+                self._values[field][row] = self._parse_number(value)
+
+            elif fieldType == "int":
+                number = self._parse_number(value)
+                values = self._values[field]
+                if np.isnan(number):
+                    values[row] = 0 if values.dtype == np.int64 else np.nan
+                    self._masks[field][row] = True
+                    continue
+                if values.dtype == np.int64 and number != np.floor(number):
+                    # Not integral: Promote the column to float64 (Same as decode_column)
+                    values = np.where(self._masks[field], np.nan, values.astype(np.float64))
+                    self._values[field] = values
+                values[row] = number
+                self._masks[field][row] = False
+
+            elif fieldType == "date":
+                self._values[field][row] = self._parse_date(value)
+
+            elif fieldType == "category":
+                if value is None or value in BLANK_LABELS:
+                    self._values[field][row] = -1
+                else:
+                    self._values[field][row] = self._categories[field].setdefault(value, len(self._categories[field]))
+
+            else:
+                self._values[field][row] = value
+
+    def column(self, field:str):
+        """
+        field의 pandas 배열을 반환한다. (float, date, str은 복사 없이 배열을 감싼다.)
+        """
+
+        fieldType = self.schema[field]
+        values    = self._values[field]
+
+        if fieldType == "int" and values.dtype == np.int64:
+            return pd.arrays.IntegerArray(values, self._masks[field])
+        if fieldType == "category":
+            return pd.Categorical.from_codes(values, categories=list(self._categories[field]))
+
+        return values
+
+    def to_frame(self, columns:list=None):
+        """
+        pandas.DataFrame으로 반환한다. (행 번호가 Index, 필드 순서는 schema 순서)
+        """
+
+        columns = columns if columns is not None else list(self.schema)
+        return pd.DataFrame({field: self.column(field) for field in columns}, copy=False)
+
+    def to_arrow(self, columns:list=None):
+        """
+        pyarrow.Table로 반환한다. (숫자, 일자 배열은 Arrow 버퍼로 그대로 사용하며, category는 DictionaryArray)
+        """
+
+        import pyarrow as pa # Optional: Only for Arrow output
+
+        columns = columns if columns is not None else list(self.schema)
+        arrays  = []
+        for field in columns:
+            fieldType = self.schema[field]
+            values    = self._values[field]
+
+            if fieldType == "int" and values.dtype == np.int64:
+                arrays.append(pa.array(values, mask=self._masks[field]))
+            elif fieldType == "category":
+                arrays.append(pa.DictionaryArray.from_arrays(pa.array(values, mask=values < 0), pa.array(list(self._categories[field]), type=pa.string())))
+            elif fieldType == "str":
+                arrays.append(pa.array(values, type=pa.string()))
+            else:
+                arrays.append(pa.array(values, from_pandas=True)) # NaN, NaT -> null
+
+        return pa.Table.from_arrays(arrays, names=columns)
+
+
+
+# * * *   Functions   * * *
+def decode_column(column:pd.Series, fieldType:str):
+    """
+    문자열 column을 fieldType에 맞는 dtype으로 한 번에(vectorized) 변환한다.
+    변환할 수 없는 값("", "-", None 등)은 결측값(NaN, NaT, <NA>)이 된다.
+
+    [Parameters]
+    column    (pandas.Series) : 변환할 column (Mandatory)
+    fieldType (str)           : "date", "int", "float", "category", "str" 중 하나 (Mandatory)
+
+    [Returns]
+    column : 변환된 column (pandas.Series)
+    """
+
+    if fieldType in ("int", "float"):
+        column  = column.astype(str).str.replace(",", "", regex=False).str.strip()
+        numbers = column.where(column.str.fullmatch(NUMBER_PATTERN)).astype("float64")
+        if fieldType == "float":
+            return numbers.astype("float64")
+
+        # Nullable Integer (float64 if any value is not integral)
+        integral = numbers.isna() | (numbers == np.floor(numbers))
+        return numbers.astype("Int64") if integral.all() else numbers.astype("float64")
+
+    if fieldType == "date":
+        return pd.to_datetime(column.astype(str).str.replace(r"[-/.]", "", regex=True), format="%Y%m%d", errors="coerce")
+
+    if fieldType == "category":
+        return column.where(~column.isin(BLANK_LABELS)).astype("category")
+
+    return column
+
+def decode_value(value, fieldType:str):
+    """
+    API 응답의 값 하나를 fieldType에 맞는 Python 값으로 변환한다. (decode_column의 값 단위 버전)
+    "float" -> float (결측값 NaN), "int" -> int (정수가 아니면 float, 결측값 None),
+    "date" -> numpy.datetime64 (결측값 None), "category", "str" -> 그대로
+    """
+
+    if fieldType in ("int", "float"):
+        number = RecordAccumulator._parse_number(value)
+        if fieldType == "float":
+            return number
+        if np.isnan(number):
+            return None
+        return int(number) if number == np.floor(number) else number
+
+    if fieldType == "date":
+        date = RecordAccumulator._parse_date(value)
+        return None if np.isnat(date) else date
+
+    return value
+
+def decode_items(items:list, schema:dict, columns:list=None):
+    """
+    API 응답(list of dict)을 schema에 맞는 dtype의 pandas.DataFrame으로 변환한다.
+    schema에 없는 필드는 문자열 그대로 유지한다.
+
+    [Parameters]
+    items   (list of dict) : API 응답 (Mandatory)
+    schema  (dict)         : 필드명 -> 필드 타입 ("date", "int", "float", "category", "str") (Mandatory)
+    columns (list)         : 반환할 필드 목록 (Default: None; 전체 필드)
+
+    [Returns]
+    df : 변환 결과 (pandas.DataFrame)
+    """
+
+    df = pd.DataFrame.from_records(items if items is not None else [], columns=columns)
+
+    for field, fieldType in schema.items():
+        if field in df.columns:
+            df[field] = decode_column(df[field], fieldType)
+
+    return df
+
+def decode_response(endpoint:str, items:list, columns:list=None):
+    """
+    API_SCHEMAS[endpoint] 스키마로 API 응답을 pandas.DataFrame으로 변환한다.
+
+    [Parameters]
+    endpoint (str)          : API 이름 (apiHandler의 get_<endpoint>, 예: "kospi_daily_trading") (Mandatory)
+    items    (list of dict) : API 응답 (Mandatory)
+    columns  (list)         : 반환할 필드 목록 (Default: None; 전체 필드)
+
+    [Returns]
+    df : 변환 결과 (pandas.DataFrame)
+    """
+
+    return decode_items(items, API_SCHEMAS[endpoint], columns=columns)
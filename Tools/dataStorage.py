@@ -0,0 +1,201 @@
+# dataStorage.py
+
+# Author  : Byeong Heon Lee
+# Contact : lww7438@gmail.com
+
+# Required Modules
+import os
+import uuid
+import pandas          as pd
+import pyarrow         as pa
+import pyarrow.compute
+import pyarrow.dataset as ds
+import pyarrow.parquet as pq
+
+from apiConfig  import *
+from dataSchema import *
+
+
+
+# * * *   Lake Field Types   * * *
+# Field Type (dataSchema) -> Arrow type of every part file
+# "int" is stored as float64: decode_column returns float64 when a batch has a non-integral value
+LAKE_FIELD_TYPES = {
+    "date"     : pa.timestamp("ns"),
+    "int"      : pa.float64(),
+    "float"    : pa.float64(),
+    "category" : pa.dictionary(pa.int32(), pa.string()),
+    "str"      : pa.string(),
+}
+
+
+
+# * * *   Functions   * * *
+def get_dataset_path(endpoint:str, lakePath:str=LAKE_PATH):
+    """
+    endpoint 데이터셋의 디렉토리 경로를 반환한다. (lakePath/endpoint=<endpoint>)
+    """
+
+    return os.path.join(lakePath, f"endpoint={endpoint}")
+
+def find_date_column(df:pd.DataFrame):
+    """
+    df의 기준일자 필드명을 반환한다. (BAS_DD, basDt, date 중 먼저 존재하는 필드, 없으면 None)
+    """
+
+    for column in LAKE_DATE_COLUMNS:
+        if column in df.columns:
+            return column
+
+    return None
+
+def get_lake_schema(endpoint:str, columns:list, dateColumn:str=None):
+    """
+    endpoint 데이터셋 파일의 Arrow 스키마를 반환한다. (API_SCHEMAS[endpoint]의 필드 타입, 스키마에 없는 필드는 문자열)
+    배치마다 dtype(범주 수, Int64/float64 등)이 달라도 모든 파일이 같은 스키마로 저장되므로 데이터셋 전체를 함께 읽을 수 있다.
+
+    [Parameters]
+    endpoint   (str)  : 데이터셋 이름 (Mandatory)
+    columns    (list) : 필드 목록 (Mandatory)
+    dateColumn (str)  : 기준일자 필드명 (Default: None; 스키마에 없는 기준일자 필드도 timestamp로 저장)
+
+    [Returns]
+    schema : pyarrow.Schema
+    """
+
+    schema = API_SCHEMAS.get(endpoint, dict())
+    return pa.schema([(column, LAKE_FIELD_TYPES[schema.get(column, "date" if column == dateColumn else "str")]) for column in columns])
+
+def get_latest_date(endpoint:str, dateColumn:str=None, lakePath:str=LAKE_PATH):
+    """
+    endpoint 데이터셋에 저장된 가장 최근 기준일자를 반환한다. (가장 최근 연도 파티션의 기준일자 필드만 읽는다.)
+
+    [Parameters]
+    endpoint   (str) : 데이터셋 이름 (Mandatory)
+    dateColumn (str) : 기준일자 필드명 (Default: None; BAS_DD, basDt, date 순으로 탐색)
+    lakePath   (str) : 데이터 레이크 경로 (Default: LAKE_PATH)
+
+    [Returns]
+    latest_date : 가장 최근 기준일자 (str, YYYYMMDD, 데이터셋이 없으면 None)
+    """
+
+    dataset_path = get_dataset_path(endpoint, lakePath)
+    if not os.path.isdir(dataset_path):
+        return None
+
+    years = sorted(int(name[len("year="):]) for name in os.listdir(dataset_path) if name.startswith("year="))
+
+    # The latest non-empty partition
+    for year in reversed(years):
+        dataset = ds.dataset(os.path.join(dataset_path, f"year={year}"), format="parquet")
+        if dateColumn is None:
+            dateColumn = next((column for column in LAKE_DATE_COLUMNS if column in dataset.schema.names), None)
+
+        dates = dataset.to_table(columns=[dateColumn]).column(0)
+        if len(dates) > 0:
+            return pd.Timestamp(pa.compute.max(dates).as_py()).strftime("%Y%m%d")
+
+    return None
+
+def append_dataset(endpoint:str, df:pd.DataFrame, dateColumn:str=None, lakePath:str=LAKE_PATH):
+    """
+    df를 endpoint 데이터셋에 Parquet 파일로 추가한다.
+    데이터셋은 endpoint와 기준일자의 연도로 분할(partition)되며 (lakePath/endpoint=<endpoint>/year=<YYYY>/),
+    파일 안의 행은 기준일자 순으로 정렬하여 저장하므로 일자 조건은 Row Group 통계로 걸러진다.
+    파일은 임시 이름으로 쓴 뒤 이름을 바꾸므로, 중간에 중단되어도 읽는 쪽에 불완전한 파일이 보이지 않는다.
+
+    [Parameters]
+    endpoint   (str)              : 데이터셋 이름 (예: "kospi_daily_trading") (Mandatory)
+    df         (pandas.DataFrame) : 추가할 데이터 (기준일자 필드는 datetime64) (Mandatory)
+    dateColumn (str)              : 기준일자 필드명 (Default: None; BAS_DD, basDt, date 순으로 탐색)
+    lakePath   (str)              : 데이터 레이크 경로 (Default: LAKE_PATH)
+
+    [Returns]
+    paths : 추가된 파일 경로 목록 (list of str)
+    """
+
+    if df is None or len(df) == 0:
+        return []
+
+    dateColumn = dateColumn if dateColumn is not None else find_date_column(df)
+    if dateColumn is None:
+        raise ValueError(f"Fail: No date column in {endpoint} ({LAKE_DATE_COLUMNS})")
+
+    df     = df.sort_values(dateColumn, kind="stable")
+    years  = pd.to_datetime(df[dateColumn]).dt.year
+    schema = get_lake_schema(endpoint, list(df.columns), dateColumn)
+
+    paths = []
+    for year, df_year in df.groupby(years, sort=True):
+        partition_path = os.path.join(get_dataset_path(endpoint, lakePath), f"year={int(year)}")
+        os.makedirs(partition_path, exist_ok=True)
+
+        file_name = f"part-{uuid.uuid4().hex}.parquet"
+        temp_path = os.path.join(partition_path, "." + file_name) # Hidden from readers until renamed
+        path      = os.path.join(partition_path, file_name)
+
+        table = pa.Table.from_pandas(df_year, preserve_index=False).cast(schema) # One schema for every batch
+        pq.write_table(table, temp_path, row_group_size=LAKE_ROW_GROUP_SIZE)
+        os.replace(temp_path, path)
+        paths.append(path)
+
+    return paths
+
+def load_dataset(endpoint:str, startDt:str=None, endDt:str=None, columns:list=None, filters:dict=None, dateColumn:str=None, lakePath:str=LAKE_PATH):
+    """
+    endpoint 데이터셋에서 조건에 맞는 행만 읽어 반환한다.
+    조건은 Parquet 읽기 단계에서 적용되므로(predicate pushdown) 조건에 맞지 않는 연도 파티션과 Row Group은 읽지 않는다.
+
+    [Parameters]
+    endpoint   (str)  : 데이터셋 이름 (예: "kospi_series_daily_price") (Mandatory)
+    startDt    (str)  : 시작일자 (YYYYMMDD, 포함) (Default: None)
+    endDt      (str)  : 종료일자 (YYYYMMDD, 포함) (Default: None)
+    columns    (list) : 읽을 필드 목록 (Default: None; 전체 필드)
+    filters    (dict) : 필드명 -> 값 또는 값 목록 (예: {"ISU_CD": ["005930"], "IDX_NM": "코스피 200"}) (Default: None)
+    dateColumn (str)  : 기준일자 필드명 (Default: None; BAS_DD, basDt, date 순으로 탐색)
+    lakePath   (str)  : 데이터 레이크 경로 (Default: LAKE_PATH)
+
+    [Returns]
+    df : 조회 결과 (pandas.DataFrame, 데이터셋이 없으면 None)
+    """
+
+    dataset_path = get_dataset_path(endpoint, lakePath)
+    if not os.path.isdir(dataset_path):
+        return None
+
+    dataset = ds.dataset(dataset_path, format="parquet", partitioning="hive")
+
+    if dateColumn is None:
+        dateColumn = next((column for column in LAKE_DATE_COLUMNS if column in dataset.schema.names), None)
+
+    # Unified Schema (Files written with per-batch schemas are cast while reading)
+    columns_all = [name for name in dataset.schema.names if name != "year"]
+    schema      = get_lake_schema(endpoint, columns_all, dateColumn).append(pa.field("year", pa.int32()))
+    dataset     = ds.dataset(dataset_path, schema=schema, format="parquet", partitioning="hive")
+
+    # Predicates
+    expression = None
+    def add(condition):
+        return condition if expression is None else expression & condition
+
+    if startDt is not None:
+        start      = pd.Timestamp(startDt)
+        expression = add((ds.field("year") >= start.year) & (ds.field(dateColumn) >= pa.scalar(start, type=dataset.schema.field(dateColumn).type)))
+    if endDt is not None:
+        end        = pd.Timestamp(endDt)
+        expression = add((ds.field("year") <= end.year) & (ds.field(dateColumn) <= pa.scalar(end, type=dataset.schema.field(dateColumn).type)))
+    for field, values in (filters or dict()).items():
+        values     = values if isinstance(values, (list, tuple, set)) else [values]
+        expression = add(ds.field(field).isin(list(values)))
+
+    # Projection
+    if columns is not None and dateColumn is not None and dateColumn not in columns:
+        columns = [dateColumn] + list(columns)
+
+    table = dataset.to_table(columns=columns, filter=expression)
+    df    = table.to_pandas().drop(columns=["year"], errors="ignore")
+
+    if dateColumn is not None:
+        df = df.sort_values(dateColumn, kind="stable").reset_index(drop=True)
+
+    return df
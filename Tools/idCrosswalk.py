@@ -0,0 +1,271 @@
+# idCrosswalk.py
+
+# Author  : Byeong Heon Lee
+# Contact : lww7438@gmail.com
+
+# Required Modules
+import os
+import sqlite3
+import threading
+import numpy  as np
+import pandas as pd
+
+from apiConfig import *
+
+
+
+# * * *   Classes   * * *
+class IdCrosswalk:
+    """
+    종목 식별자(isinCd, srtnCd, shotnIsin, crno, issucoCustno)의 대응표를 SQLite 파일에 보관하는 Crosswalk
+    종목마다 고정된 정수 id를 부여하며, 식별자별 Index(dict)를 메모리에 두므로 조회는 O(1)이다.
+    KRX상장종목정보(get_krx_listed_info)로 갱신할 때는 새로 상장되었거나 바뀐 종목만 기록하며,
+    한 번 조회한 발행회사번호(issucoCustno)는 보관되므로 다시 요청하지 않는다.
+
+    [Parameters]
+    path (str) : Crosswalk 파일 경로 (Default: ID_CROSSWALK_PATH)
+    """
+
+    KEYS    = ["isinCd", "srtnCd", "shotnIsin", "crno", "issucoCustno"] # Indexed identifiers (isinCd is unique)
+    COLUMNS = ["id", "isinCd", "srtnCd", "shotnIsin", "crno", "itmsNm", "corpNm", "mrktCtg", "issucoCustno", "issucoNm", "listNm"]
+
+    def __init__(self, path:str=ID_CROSSWALK_PATH):
+        self.path = path
+
+        self._lock    = threading.Lock()
+        self._conn    = None
+        self._rows    = dict()                           # id -> row (dict)
+        self._indexes = {key: dict() for key in self.KEYS} # identifier -> list of id
+        self._last_id = 0
+
+    def _connect(self):
+        # Lazy: The table is read into memory on the first lookup
+        if self._conn is not None:
+            return self._conn
+
+        os.makedirs(os.path.dirname(os.path.abspath(self.path)), exist_ok=True)
+
+        conn = sqlite3.connect(self.path, check_same_thread=False, timeout=30)
+        conn.execute("PRAGMA journal_mode=WAL")
+        conn.execute("""
+            CREATE TABLE IF NOT EXISTS security (
+                id           INTEGER PRIMARY KEY,
+                isinCd       TEXT NOT NULL UNIQUE,
+                srtnCd       TEXT,
+                shotnIsin    TEXT,
+                crno         TEXT,
+                itmsNm       TEXT,
+                corpNm       TEXT,
+                mrktCtg      TEXT,
+                issucoCustno TEXT,
+                issucoNm     TEXT,
+                listNm       TEXT
+            )
+        """)
+        conn.execute("CREATE TABLE IF NOT EXISTS meta (key TEXT PRIMARY KEY, value TEXT)")
+        for key in self.KEYS[1:]:
+            conn.execute(f"CREATE INDEX IF NOT EXISTS idx_security_{key} ON security ({key})")
+        conn.commit()
+
+        for values in conn.execute(f"SELECT {', '.join(self.COLUMNS)} FROM security ORDER BY id"):
+            self._index(dict(zip(self.COLUMNS, values)))
+
+        self._conn = conn
+        return conn
+
+    def _index(self, row:dict, previous:dict=None):
+        # Replace the identifiers of previous (The same id) with those of row
+        # Unchanged identifiers keep their position, so the earliest registered id stays first
+        for key in self.KEYS:
+            if previous is not None and previous[key] == row[key]:
+                continue
+            if previous is not None and previous[key] is not None:
+                ids = self._indexes[key].get(previous[key], [])
+                if row["id"] in ids:
+                    ids.remove(row["id"])
+            if row[key] is not None:
+                self._indexes[key].setdefault(row[key], []).append(row["id"])
+
+        self._rows[row["id"]] = row
+        self._last_id         = max(self._last_id, row["id"])
+
+    def _write(self, row:dict):
+        self._conn.execute(
+            f"INSERT OR REPLACE INTO security ({', '.join(self.COLUMNS)}) VALUES ({', '.join('?' * len(self.COLUMNS))})",
+            tuple(row[column] for column in self.COLUMNS)
+        )
+
+    def refresh(self, items:list, basDt:str=None):
+        """
+        KRX상장종목정보 item 목록으로 Crosswalk를 갱신한다. (새 종목은 추가, 식별자나 이름이 바뀐 종목은 수정)
+        상장폐지 등으로 목록에서 빠진 종목도 id를 유지하기 위해 삭제하지 않는다.
+
+        [Parameters]
+        items (list of dict) : get_krx_listed_info, iter_krx_listed_info의 item (Mandatory)
+        basDt (str)          : items의 기준일자 (YYYYMMDD) (Default: None; 기록하지 않음)
+
+        [Returns]
+        (inserted, updated) : 추가된 종목 수, 수정된 종목 수 (tuple of int)
+        """
+
+        inserted, updated = 0, 0
+        fields = self.COLUMNS[1:8] # Fields from KRX상장종목정보
+
+        with self._lock:
+            conn = self._connect()
+
+            for item in items:
+                if item.get("isinCd", None) is None:
+                    continue
+
+                values = {field: item.get(field, None) for field in fields}
+                if values["shotnIsin"] is None and values["srtnCd"] is not None:
+                    values["shotnIsin"] = values["srtnCd"][1:]
+
+                ids = self._indexes["isinCd"].get(values["isinCd"], None)
+
+                # New Security
+                if ids is None:
+                    row = dict({column: None for column in self.COLUMNS}, **values)
+                    row["id"] = self._last_id + 1
+                    self._write(row)
+                    self._index(row)
+                    inserted += 1
+                    continue
+
+                # Changed Security (Keep id and issucoCustno)
+                previous = self._rows[ids[0]]
+                if any(previous[field] != values[field] for field in fields):
+                    row = dict(previous, **values)
+                    self._write(row)
+                    self._index(row, previous)
+                    updated += 1
+
+            if basDt is not None:
+                conn.execute("INSERT OR REPLACE INTO meta VALUES ('basDt', ?)", (basDt,))
+            conn.commit()
+
+        return inserted, updated
+
+    def get_refreshed_date(self):
+        """
+        마지막으로 갱신한 KRX상장종목정보의 기준일자를 반환한다. (YYYYMMDD, 기록이 없으면 None)
+        """
+
+        with self._lock:
+            row = self._connect().execute("SELECT value FROM meta WHERE key = 'basDt'").fetchone()
+
+        return row[0] if row is not None else None
+
+    def get_id(self, value:str, key:str=None):
+        """
+        식별자 value의 정수 id를 반환한다. (없으면 None)
+        key가 없으면 isinCd, srtnCd, shotnIsin(종목코드), crno, issucoCustno 순으로 찾는다.
+        법인등록번호(crno), 발행회사번호(issucoCustno)처럼 여러 종목에 대응하는 식별자는 가장 먼저 등록된 종목의 id를 반환한다.
+        """
+
+        with self._lock:
+            self._connect()
+            for search_key in ([key] if key is not None else self.KEYS):
+                ids = self._indexes[search_key].get(value, None)
+                if ids:
+                    return ids[0]
+
+        return None
+
+    def lookup(self, value:str, key:str=None):
+        """
+        식별자 value에 대응하는 종목의 모든 식별자를 반환한다. (dict, 없으면 None)
+        (예: get_id_crosswalk().lookup("005930") -> {'id': 1, 'isinCd': 'KR7005930003', 'srtnCd': 'A005930', 'crno': '1301110006246', ...})
+        """
+
+        security_id = self.get_id(value, key)
+        if security_id is None:
+            return None
+
+        with self._lock:
+            return dict(self._rows[security_id])
+
+    def map_ids(self, values, key:str="isinCd"):
+        """
+        식별자 목록 values를 정수 id 배열로 변환한다. (없는 식별자는 -1)
+        (예: df["id"] = get_id_crosswalk().map_ids(df["isinCd"]); 데이터셋 간 병합을 정수 key로 수행)
+        """
+
+        with self._lock:
+            self._connect()
+            index = self._indexes[key]
+            return np.fromiter((index[value][0] if value in index and index[value] else -1 for value in values), dtype=np.int64, count=len(values))
+
+    def get_issuco_custno(self, shotnIsin:str):
+        """
+        shotnIsin(종목코드)의 발행회사번호 정보를 반환한다. (get_issuco_custno_by_short_isin의 item과 같은 dict, 기록이 없으면 None)
+        """
+
+        with self._lock:
+            self._connect()
+            ids = self._indexes["shotnIsin"].get(shotnIsin, None)
+            row = self._rows[ids[0]] if ids else None
+
+        if row is None or row["issucoCustno"] is None:
+            return None
+
+        return {"issucoCustno": row["issucoCustno"], "issucoNm": row["issucoNm"], "listNm": row["listNm"]}
+
+    def put_issuco_custno(self, shotnIsin:str, item:dict):
+        """
+        shotnIsin(종목코드)의 발행회사번호 정보(get_issuco_custno_by_short_isin의 item)를 기록한다. (Crosswalk에 없는 종목이면 무시)
+        """
+
+        with self._lock:
+            conn = self._connect()
+            for security_id in list(self._indexes["shotnIsin"].get(shotnIsin, [])):
+                previous = self._rows[security_id]
+                row      = dict(previous, issucoCustno=item.get("issucoCustno", None), issucoNm=item.get("issucoNm", None), listNm=item.get("listNm", None))
+                self._write(row)
+                self._index(row, previous)
+            conn.commit()
+
+    def to_frame(self):
+        """
+        Crosswalk 전체를 id를 Index로 하는 pandas.DataFrame으로 반환한다.
+        """
+
+        with self._lock:
+            self._connect()
+            rows = [self._rows[security_id] for security_id in sorted(self._rows)]
+
+        return pd.DataFrame.from_records(rows, columns=self.COLUMNS).set_index("id")
+
+    def __len__(self):
+        with self._lock:
+            self._connect()
+            return len(self._rows)
+
+    def close(self):
+        with self._lock:
+            if self._conn is not None:
+                self._conn.close()
+                self._conn = None
+                self._rows    = dict()
+                self._indexes = {key: dict() for key in self.KEYS}
+                self._last_id = 0
+
+
+
+# * * *   Functions   * * *
+_id_crosswalk      = None
+_id_crosswalk_lock = threading.Lock()
+
+def get_id_crosswalk():
+    """
+    공용 IdCrosswalk를 반환한다. (ID_CROSSWALK_PATH)
+    """
+
+    global _id_crosswalk
+
+    with _id_crosswalk_lock:
+        if _id_crosswalk is None:
+            _id_crosswalk = IdCrosswalk()
+
+    return _id_crosswalk
@@ -0,0 +1,11 @@
+# conftest.py
+
+# Author  : Byeong Heon Lee
+# Contact : lww7438@gmail.com
+
+# Required Modules
+import os
+import sys
+
+# Tools modules import each other by name (from apiConfig import *)
+sys.path.insert(0, os.path.join(os.path.dirname(os.path.abspath(__file__)), os.pardir))
@@ -0,0 +1,130 @@
+# test_api_cache.py
+# ResponseCache (TTL, LRU eviction), cache keys, and http_get with the cache (tmp_path, fake clock)
+
+# Author  : Byeong Heon Lee
+# Contact : lww7438@gmail.com
+
+# Required Modules
+import random
+import pytest
+
+import apiCache
+import apiSession
+from apiCache   import ResponseCache, make_cache_key, get_cache_ttl
+from apiConfig  import PREVIOUS_BUSINESS_DAY
+from apiLimiter import HostRateLimiter
+
+
+
+BASE_URL = "http://apis.data.go.kr/1160100/service/GetStockSecuritiesInfoService/getStockPriceInfo"
+
+class FakeTime:
+    def __init__(self):
+        self.now = 1_700_000_000.0
+
+    def time(self):
+        return self.now
+
+@pytest.fixture
+def clock(monkeypatch):
+    clock = FakeTime()
+    monkeypatch.setattr(apiCache, "time", clock)
+    return clock
+
+@pytest.fixture
+def cache(tmp_path, clock):
+    return ResponseCache(str(tmp_path / "cache.sqlite"), maxBytes=10 * 1024 * 1024, ttlLatest=60)
+
+def random_text(seed, length=2000):
+    # Hardly compressible body (About length / 2 bytes after zlib)
+    return "".join(random.Random(seed).choice("0123456789abcdef") for _ in range(length))
+
+
+
+# * * *   Tests: Keys and TTL   * * *
+def test_key_ignores_param_order_and_service_key():
+    first  = make_cache_key(f"{BASE_URL}?serviceKey=AAA&basDt=20240102&isinCd=KR7005930003&numOfRows=1")
+    second = make_cache_key(f"{BASE_URL}?numOfRows=1&isinCd=KR7005930003&basDt=20240102&serviceKey=BBB")
+
+    assert first == second
+    assert "serviceKey" not in first
+    assert first != make_cache_key(f"{BASE_URL}?basDt=20240103&isinCd=KR7005930003&numOfRows=1")
+    assert make_cache_key(f"{BASE_URL}?AUTH_KEY=X&basDd=20240102") == make_cache_key(f"{BASE_URL}?basDd=20240102")
+
+def test_ttl():
+    assert get_cache_ttl(f"{BASE_URL}?basDt=20200102", ttlLatest=60) is None                  # Past data never changes
+    assert get_cache_ttl(f"{BASE_URL}?basDt={PREVIOUS_BUSINESS_DAY}", ttlLatest=60) == 60      # Latest data
+    assert get_cache_ttl(f"{BASE_URL}?isinCd=KR7005930003", ttlLatest=60) == 60               # No date
+    assert get_cache_ttl(f"{BASE_URL}?beginBasDt=20200102&endBasDt=", ttlLatest=60) == 60     # Open-ended period
+
+
+
+# * * *   Tests: ResponseCache   * * *
+def test_hit_and_expiry(cache, clock):
+    latest = f"{BASE_URL}?basDt={PREVIOUS_BUSINESS_DAY}"
+    past   = f"{BASE_URL}?basDt=20200102"
+    cache.put(latest, "latest")
+    cache.put(past, "past")
+
+    assert cache.get(latest.replace("?", "?serviceKey=KEY&")) == "latest"
+
+    clock.now += 61
+    assert cache.get(latest) is None # Expired
+    assert cache.get(past) == "past" # Permanent
+    assert cache.stats()["hits"] == 2 and cache.stats()["misses"] == 1
+
+def test_lru_eviction(tmp_path, clock):
+    size  = len(apiCache.zlib.compress(random_text(0).encode("utf-8")))
+    cache = ResponseCache(str(tmp_path / "cache.sqlite"), maxBytes=int(size * 2.5), ttlLatest=60)
+
+    urls = [f"{BASE_URL}?basDt=2020010{i}" for i in range(1, 4)]
+    cache.put(urls[0], random_text(0))
+    clock.now += 1
+    cache.put(urls[1], random_text(1))
+    clock.now += 1
+    assert cache.get(urls[0]) == random_text(0) # urls[1] is now the least recently used
+    clock.now += 1
+    cache.put(urls[2], random_text(2))
+
+    assert cache.get(urls[1]) is None
+    assert cache.get(urls[0]) == random_text(0) and cache.get(urls[2]) == random_text(2)
+    assert cache.stats()["entries"] == 2 and cache.stats()["bytes"] <= cache.maxBytes
+
+
+
+# * * *   Tests: http_get with the Cache   * * *
+class StubSession:
+    def __init__(self):
+        self.calls = 0
+
+    def get(self, url, timeout=None):
+        self.calls += 1
+        response             = type("Response", (), {})()
+        response.status_code = 200
+        response.text        = f'{{"response": {{"call": {self.calls}}}}}'
+        return response
+
+def test_expired_entry_is_refetched(monkeypatch, cache, clock):
+    session = StubSession()
+    monkeypatch.setattr(apiSession, "get_session", lambda url: session)
+    monkeypatch.setattr(apiSession, "get_response_cache", lambda: cache)
+    monkeypatch.setattr(apiSession, "API_LIMITER", HostRateLimiter(rate=1e9, burst=10**9))
+
+    url   = f"{BASE_URL}?serviceKey=KEY&basDt={PREVIOUS_BUSINESS_DAY}&numOfRows=1"
+    first = apiSession.http_get(url)
+    assert apiSession.http_get(f"{BASE_URL}?numOfRows=1&basDt={PREVIOUS_BUSINESS_DAY}&serviceKey=OTHER") == first
+    assert session.calls == 1
+
+    clock.now += 61
+    assert apiSession.http_get(url) != first
+    assert session.calls == 2
+
+def test_error_body_is_not_cached(monkeypatch, cache):
+    session = StubSession()
+    session.get = lambda url, timeout=None: type("Response", (), {"status_code": 200, "text": "<OpenAPI_ServiceResponse>SERVICE_KEY_IS_NOT_REGISTERED_ERROR</OpenAPI_ServiceResponse>"})()
+    monkeypatch.setattr(apiSession, "get_session", lambda url: session)
+    monkeypatch.setattr(apiSession, "get_response_cache", lambda: cache)
+    monkeypatch.setattr(apiSession, "API_LIMITER", HostRateLimiter(rate=1e9, burst=10**9))
+
+    apiSession.http_get(f"{BASE_URL}?basDt=20200102")
+    assert cache.stats()["entries"] == 0
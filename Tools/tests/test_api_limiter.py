@@ -0,0 +1,183 @@
+# test_api_limiter.py
+# HostRateLimiter (Token bucket, AIMD) and http_get retries against a fake clock and a stub Session
+
+# Author  : Byeong Heon Lee
+# Contact : lww7438@gmail.com
+
+# Required Modules
+import threading
+import pytest
+import requests
+
+import apiLimiter
+import apiSession
+from apiLimiter import HostRateLimiter, get_backoff_delay, is_throttled_response
+
+
+
+URL  = "https://apis.data.go.kr/1160100/service/GetKrxListedInfoService/getItemInfo?pageNo=1"
+HOST = "apis.data.go.kr"
+
+class FakeTime:
+    # time.monotonic / time.sleep; sleeping advances the clock
+    def __init__(self):
+        self.now    = 1000.0
+        self.sleeps = []
+
+    def monotonic(self):
+        return self.now
+
+    def sleep(self, seconds):
+        self.sleeps.append(seconds)
+        self.now += seconds
+
+class StubResponse:
+    def __init__(self, statusCode, text):
+        self.status_code = statusCode
+        self.text        = text
+
+class StubSession:
+    # Returns (or raises) the outcomes in order
+    def __init__(self, outcomes):
+        self.outcomes = list(outcomes)
+        self.calls    = 0
+
+    def get(self, url, timeout=None):
+        self.calls += 1
+        outcome = self.outcomes.pop(0)
+        if isinstance(outcome, Exception):
+            raise outcome
+        return outcome
+
+@pytest.fixture
+def clock(monkeypatch):
+    clock = FakeTime()
+    monkeypatch.setattr(apiLimiter, "time", clock)
+    monkeypatch.setattr(apiSession, "time", clock)
+    return clock
+
+@pytest.fixture
+def limiter(monkeypatch, clock):
+    limiter = HostRateLimiter(rate=10.0, burst=2, concurrency=1, minRate=1.0, maxRate=12.0, increase=1.0, decrease=0.5)
+    monkeypatch.setattr(apiSession, "API_LIMITER", limiter)
+    return limiter
+
+def serve(monkeypatch, *outcomes):
+    session = StubSession(outcomes)
+    monkeypatch.setattr(apiSession, "get_session", lambda url: session)
+    return session
+
+OK = StubResponse(200, '{"response": {"header": {"resultCode": "00"}}}')
+
+
+
+# * * *   Tests: HostRateLimiter   * * *
+def test_token_bucket_burst_then_rate(limiter, clock):
+    for _ in range(2): # Burst
+        limiter.acquire(URL)
+        limiter.release(URL)
+    assert clock.sleeps == []
+
+    limiter.acquire(URL) # Bucket is empty: wait for one token at the current rate (12/s after two successes)
+    limiter.release(URL)
+    assert clock.sleeps == [pytest.approx(1.0 / 12.0)]
+
+def test_aimd(limiter):
+    limiter.acquire(URL)
+    limiter.release(URL, throttled=True)
+    assert limiter.stats()[HOST]["rate"] == 5.0
+
+    for _ in range(3):
+        limiter.acquire(URL)
+        limiter.release(URL, throttled=True)
+    assert limiter.stats()[HOST]["rate"] == 1.0 # minRate
+
+    for _ in range(20):
+        limiter.acquire(URL)
+        limiter.release(URL)
+    assert limiter.stats()[HOST]["rate"] == 12.0 # maxRate
+    assert limiter.stats()[HOST]["throttled"] == 4 and limiter.stats()[HOST]["successes"] == 20
+
+def test_concurrency_per_host(limiter):
+    limiter.acquire(URL)
+
+    acquired = threading.Event()
+    def other():
+        limiter.acquire(URL)
+        acquired.set()
+        limiter.release(URL)
+
+    thread = threading.Thread(target=other)
+    thread.start()
+    assert not acquired.wait(0.1) # The only slot is in use
+
+    limiter.release(URL)
+    assert acquired.wait(1.0)
+    thread.join()
+
+    limiter.acquire("https://api.seibro.or.kr/openapi/service") # Other hosts have their own slots
+    limiter.release("https://api.seibro.or.kr/openapi/service")
+
+def test_backoff_full_jitter(monkeypatch):
+    monkeypatch.setattr(apiLimiter.random, "uniform", lambda low, high: high) # Upper bound of the jitter
+    assert [get_backoff_delay(attempt, base=0.5, maxDelay=3.0) for attempt in range(5)] == [0.5, 1.0, 2.0, 3.0, 3.0]
+
+    monkeypatch.undo()
+    assert all(0.0 <= get_backoff_delay(3, base=0.5) <= 4.0 for _ in range(100))
+
+@pytest.mark.parametrize("statusCode, text, expected", [
+    (200, '{"response": {}}', False),
+    (429, "", True),
+    (503, "", True),
+    (404, "", False),
+    (200, "<OpenAPI_ServiceResponse><returnAuthMsg>LIMITED_NUMBER_OF_SERVICE_REQUESTS_PER_SECOND_EXCEEDS_ERROR</returnAuthMsg></OpenAPI_ServiceResponse>", True),
+    (200, "<OpenAPI_ServiceResponse><returnAuthMsg>SERVICE_KEY_IS_NOT_REGISTERED_ERROR</returnAuthMsg></OpenAPI_ServiceResponse>", False),
+])
+def test_is_throttled_response(statusCode, text, expected):
+    assert is_throttled_response(statusCode, text) == expected
+
+
+
+# * * *   Tests: http_get   * * *
+def test_throttled_response_is_retried(monkeypatch, limiter, clock):
+    session = serve(monkeypatch, StubResponse(429, ""), OK)
+
+    assert apiSession.http_get(URL, useCache=False) == OK.text
+    assert session.calls == 2
+    assert limiter.stats()[HOST]["throttled"] == 1 and limiter.stats()[HOST]["retries"] == 1
+    assert len(clock.sleeps) >= 1 and 0.0 <= clock.sleeps[0] <= apiSession.RETRY_BACKOFF_BASE
+
+@pytest.mark.parametrize("error, throttled", [
+    (requests.exceptions.ReadTimeout("read timeout"), 1),
+    (requests.exceptions.ConnectionError("reset"), 0),
+    (requests.exceptions.ChunkedEncodingError("truncated"), 0),
+])
+def test_transient_errors_are_retried(monkeypatch, limiter, error, throttled):
+    session = serve(monkeypatch, error, OK)
+
+    assert apiSession.http_get(URL, useCache=False) == OK.text
+    assert session.calls == 2
+    assert limiter.stats()[HOST]["throttled"] == throttled # Only timeouts slow the host down
+
+@pytest.mark.parametrize("error", [requests.exceptions.InvalidURL("bad url"), ValueError("parse bug")])
+def test_other_errors_propagate_without_throttling(monkeypatch, limiter, error):
+    serve(monkeypatch, error)
+
+    with pytest.raises(type(error)):
+        apiSession.http_get(URL, useCache=False)
+
+    assert limiter.stats()[HOST]["throttled"] == 0
+    assert limiter.stats()[HOST]["rate"] >= 10.0 # Not cut
+
+    limiter.acquire(URL) # The slot was released
+    limiter.release(URL)
+
+def test_gives_up_after_max_retries(monkeypatch, limiter, clock):
+    session = serve(monkeypatch, *[StubResponse(503, "")] * 4)
+
+    with pytest.raises(requests.exceptions.RetryError):
+        apiSession.http_get(URL, useCache=False, maxRetries=3)
+
+    assert session.calls == 4
+    assert limiter.stats()[HOST]["failures"] == 1 and limiter.stats()[HOST]["retries"] == 3
+    assert len(clock.sleeps) >= 3 # Backoffs (And token waits at the reduced rate)
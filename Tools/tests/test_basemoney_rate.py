@@ -0,0 +1,94 @@
+# test_basemoney_rate.py
+# basemoney_rate against saved global-rates.com pages (tests/fixtures/base_rate_<nation>.html)
+
+# Author  : Byeong Heon Lee
+# Contact : lww7438@gmail.com
+
+# Required Modules
+import os
+import numpy  as np
+import pandas as pd
+import pytest
+
+import basemoney_rate
+
+
+
+FIXTURE_PATH = os.path.join(os.path.dirname(os.path.abspath(__file__)), "fixtures")
+
+def read_fixture(nation):
+    with open(os.path.join(FIXTURE_PATH, f"base_rate_{nation}.html"), encoding="utf-8") as file:
+        return file.read()
+
+@pytest.fixture
+def fetch_calls(monkeypatch):
+    # The network is replaced by the saved pages
+    calls = []
+    def fetch_rate_changes(nation):
+        calls.append(nation)
+        return basemoney_rate.parse_rate_changes(read_fixture(nation))
+
+    monkeypatch.setattr(basemoney_rate, "fetch_rate_changes", fetch_rate_changes)
+    return calls
+
+
+
+# * * *   Tests   * * *
+def test_parse_rate_changes():
+    df = basemoney_rate.parse_rate_changes(read_fixture("KOR"))
+
+    assert list(df.columns) == ["dt", "base_rate"]
+    assert len(df) == 13
+    assert df["dt"].is_monotonic_increasing
+    assert df.iloc[0].tolist() == [pd.Timestamp("2018-11-30"), 1.75]
+    assert df.iloc[-1].tolist() == [pd.Timestamp("2022-10-12"), 3.0]
+
+def test_parse_rate_changes_without_table():
+    with pytest.raises(ValueError):
+        basemoney_rate.parse_rate_changes("<html><body><table><tr><td>nothing</td></tr></table></body></html>")
+
+def test_html_does_not_touch_the_cache(tmp_path):
+    df = basemoney_rate.get_rate_changes("KOR", html=read_fixture("KOR"), cache_dir=str(tmp_path))
+
+    assert len(df) == 13
+    assert list(tmp_path.iterdir()) == []
+
+def test_cache_is_reused_within_ttl(tmp_path, fetch_calls):
+    first  = basemoney_rate.get_rate_changes("KOR", cache_dir=str(tmp_path))
+    second = basemoney_rate.get_rate_changes("KOR", cache_dir=str(tmp_path))
+
+    assert fetch_calls == ["KOR"]
+    assert (tmp_path / "KOR.csv").exists()
+    pd.testing.assert_frame_equal(first, second)
+
+def test_cache_keeps_history_missing_from_the_page(tmp_path, fetch_calls):
+    # An older cached change that the current page no longer lists
+    pd.DataFrame({"dt": [pd.Timestamp("2017-11-30")], "base_rate": [1.5]}).to_csv(tmp_path / "KOR.csv", index=False)
+
+    df = basemoney_rate.get_rate_changes("KOR", cache_dir=str(tmp_path), cache_ttl=0)
+
+    assert fetch_calls == ["KOR"]
+    assert len(df) == 14
+    assert df.iloc[0].tolist() == [pd.Timestamp("2017-11-30"), 1.5]
+    assert len(pd.read_csv(tmp_path / "KOR.csv")) == 14
+
+def test_rate_steps_lookup():
+    steps = basemoney_rate.get_rate_steps("KOR", html=read_fixture("KOR"), use_cache=False)
+
+    assert np.isnan(steps.at("2018-11-29"))
+    assert steps.at("2018-11-30") == 1.75
+    assert steps.at("2020-05-27") == 0.75
+    assert steps.at("2020-05-28") == 0.5
+    assert steps.at(np.array(["2022-10-11", "2022-10-12"], dtype="datetime64[D]")).tolist() == [2.5, 3.0]
+
+def test_to_daily_and_align():
+    kor = basemoney_rate.get_rate_steps("KOR", html=read_fixture("KOR"), use_cache=False)
+    usa = basemoney_rate.get_rate_steps("USA", html=read_fixture("USA"), use_cache=False)
+
+    daily = kor.to_daily("2022-10-14")
+    assert daily["dt"].iloc[0] == pd.Timestamp("2018-11-30") and daily["dt"].iloc[-1] == pd.Timestamp("2022-10-14")
+    assert daily.set_index("dt").loc["2022-10-13", "base_rate"] == 3.0
+
+    aligned = basemoney_rate.align_rates([kor, usa], pd.to_datetime(["2020-03-16", "2022-10-14"]))
+    assert aligned.loc["2020-03-16"].tolist() == [1.25, 0.25]
+    assert aligned.loc["2022-10-14"].tolist() == [3.0, 3.25]
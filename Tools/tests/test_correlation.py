@@ -0,0 +1,53 @@
+# test_correlation.py
+# dataIndicator.rolling_corr, ewm_corr against pandas with missing values
+
+# Author  : Byeong Heon Lee
+# Contact : lww7438@gmail.com
+
+# Required Modules
+import numpy  as np
+import pandas as pd
+import pytest
+
+from dataIndicator import rolling_corr, ewm_corr
+
+
+
+@pytest.fixture
+def values():
+    values = np.random.default_rng(0).normal(size=(80, 3))
+    values[5:12, 0] = np.nan # Suspended
+    values[30:33, 1] = np.nan
+    values[:3, 2]    = np.nan # Listed later
+    values[50, 2]    = np.nan
+    return values
+
+PAIRS = [(0, 1), (0, 2), (1, 2)]
+
+
+
+# * * *   Tests   * * *
+@pytest.mark.parametrize("i, j", PAIRS)
+def test_rolling_corr_matches_pandas(values, i, j):
+    result   = rolling_corr(values, 12)
+    df       = pd.DataFrame(values)
+    expected = df[i].rolling(12).corr(df[j]).to_numpy()
+
+    np.testing.assert_allclose(result[:, i, j], expected, atol=1e-6)
+
+@pytest.mark.parametrize("i, j", PAIRS)
+def test_ewm_corr_matches_pandas(values, i, j):
+    # Dates without an observation still decay the weights (pandas ignore_na=False)
+    result   = ewm_corr(values, span=10)
+    df       = pd.DataFrame(values)
+    expected = df[i].ewm(span=10).corr(df[j]).to_numpy()
+
+    np.testing.assert_allclose(result[:, i, j], expected, atol=1e-6)
+
+def test_ewm_corr_min_periods(values):
+    result = ewm_corr(values, alpha=0.2, minPeriods=5)
+
+    # Pair (0, 2) is observed on dates 3, 4, 12, 13, 14, ...
+    assert np.isnan(result[:14, 0, 2]).all()
+    assert not np.isnan(result[14, 0, 2])
+    np.testing.assert_allclose(result[:, 0, 1], result[:, 1, 0])
@@ -0,0 +1,99 @@
+# test_crawl_journal.py
+# CrawlJournal and get_financials_kr resuming after an interruption (Stub getters)
+
+# Author  : Byeong Heon Lee
+# Contact : lww7438@gmail.com
+
+# Required Modules
+import pytest
+
+import apiHandler
+from crawlJournal import CrawlJournal
+
+
+
+LISTING = [{"srtnCd": f"A00000{i}", "isinCd": f"KR700000{i}003", "shotnIsin": f"00000{i}", "crno": f"110111000000{i}", "corpNm": f"회사{i}", "itmsNm": f"종목{i}", "mrktCtg": "KOSPI"} for i in range(1, 4)]
+
+class StubGetters:
+    # Per company getters of _enrich_financial_data; failing: (step, crno) pairs that raise
+    def __init__(self, monkeypatch):
+        self.calls   = []
+        self.failing = set()
+
+        def getter(step, field, key):
+            def get(serviceKey, **params):
+                self.calls.append((step, params[key]))
+                if (step, params[key]) in self.failing:
+                    raise ConnectionError(f"{step} interrupted")
+                return [{field: f"{step}:{params[key]}"}]
+            return get
+
+        monkeypatch.setattr(apiHandler, "get_corp_outline",      getter("corp_outline", "enpEmpeCnt", "crno"))
+        monkeypatch.setattr(apiHandler, "get_stoc_issu_stat",    getter("stoc_issu_stat", "issuStckCnt", "crno"))
+        monkeypatch.setattr(apiHandler, "get_item_basi_info",    getter("item_basi_info", "stckParPrc", "crno"))
+        monkeypatch.setattr(apiHandler, "get_summ_fina_stat",    getter("summ_fina_stat", "enpSaleAmt", "crno"))
+        monkeypatch.setattr(apiHandler, "get_stock_price_info",  lambda serviceKey, **params: getter("stock_price_info", "clpr", "isinCd")(serviceKey, **params)[0])
+        monkeypatch.setattr(apiHandler, "resolve_issuco_custno", lambda serviceKey, shortIsin: None)
+        monkeypatch.setattr(apiHandler, "_get_listing",          self.get_listing)
+        monkeypatch.setattr(apiHandler, "get_id_crosswalk",      lambda: type("Crosswalk", (), {"refresh": lambda self, items: (0, 0)})())
+
+    def get_listing(self, serviceKey, numOfRow):
+        self.calls.append(("listing", None))
+        return [dict(item) for item in LISTING[:numOfRow]]
+
+@pytest.fixture
+def getters(monkeypatch):
+    return StubGetters(monkeypatch)
+
+
+
+# * * *   Tests   * * *
+def test_journal_survives_reopen(tmp_path):
+    path    = str(tmp_path / "crawl.journal")
+    journal = CrawlJournal(path)
+    journal.put_step("KR7000001003", "corp_outline", [{"crno": "1"}])
+    journal.put_step("KR7000001003", "issuco_custno", None) # No result is also a result
+    journal.put_company("KR7000002003", {"corpNm": "회사2"})
+    journal.close()
+
+    journal = CrawlJournal(path)
+    assert journal.get_step("KR7000001003", "corp_outline") == (True, [{"crno": "1"}])
+    assert journal.get_step("KR7000001003", "issuco_custno") == (True, None)
+    assert journal.get_step("KR7000001003", "summ_fina_stat") == (False, None)
+    assert journal.get_company("KR7000002003") == {"corpNm": "회사2"}
+    assert journal.get_company("KR7000001003") is None
+    assert journal.stats() == {"companies": 1, "steps": 2}
+    journal.close()
+
+def test_company_row_replaces_its_steps(tmp_path):
+    journal = CrawlJournal(str(tmp_path / "crawl.journal"))
+    journal.put_step("KR7000001003", "corp_outline", [{"crno": "1"}])
+    journal.put_company("KR7000001003", {"corpNm": "회사1"})
+
+    assert journal.stats() == {"companies": 1, "steps": 0}
+    journal.close()
+
+def test_resume_fetches_only_remaining_units(tmp_path, getters):
+    path = str(tmp_path / "crawl.journal")
+
+    # First Run: Interrupted at 요약재무제표 of the second company
+    getters.failing = {("summ_fina_stat", LISTING[1]["crno"])}
+    apiHandler.get_financials_kr("KEY", numOfRow=3, journalPath=path)
+    first_calls = list(getters.calls)
+    assert ("stock_price_info", LISTING[2]["isinCd"]) in first_calls # Other companies are not blocked
+
+    # Second Run: Only the remaining steps of the second company
+    getters.calls, getters.failing = [], set()
+    resumed = apiHandler.get_financials_kr("KEY", numOfRow=3, journalPath=path)
+    assert getters.calls == [("summ_fina_stat", LISTING[1]["crno"]), ("stock_price_info", LISTING[1]["isinCd"])]
+
+    # Same result as an uninterrupted crawl
+    getters.calls = []
+    fresh = apiHandler.get_financials_kr("KEY", numOfRow=3, journalPath=str(tmp_path / "fresh.journal"))
+    assert resumed == fresh
+    assert resumed[1]["enpSaleAmt"] == "summ_fina_stat:" + LISTING[1]["crno"]
+
+    # Third Run: Nothing left
+    getters.calls = []
+    apiHandler.get_financials_kr("KEY", numOfRow=3, journalPath=path)
+    assert getters.calls == []
@@ -0,0 +1,78 @@
+# test_data_collector.py
+# update_dataset against a stub KRX getter: days that failed in an earlier run are fetched again
+
+# Author  : Byeong Heon Lee
+# Contact : lww7438@gmail.com
+
+# Required Modules
+import pytest
+
+import dataCollector
+from dataStorage import load_dataset
+
+
+
+ENDPOINT = "kospi_daily_trading"
+
+class StubGetter:
+    # KRX daily getter; returns None (Failure) for the days in failing
+    def __init__(self):
+        self.calls   = []
+        self.failing = set()
+
+    def __call__(self, serviceKey, basDd):
+        self.calls.append(basDd)
+        if basDd in self.failing:
+            return None
+        return [{"BAS_DD": basDd, "ISU_CD": "005930", "ISU_NM": "삼성전자", "MKT_NM": "KOSPI", "TDD_CLSPRC": "70,000", "ACC_TRDVOL": "1,000"}]
+
+@pytest.fixture
+def getter(monkeypatch):
+    getter = StubGetter()
+    getter.__name__ = "get_" + ENDPOINT # Schema lookup of get_krx_daily_backfill
+    monkeypatch.setitem(dataCollector.COLLECTOR_ENDPOINTS, ENDPOINT, getter)
+    return getter
+
+def update(tmp_path, endDd="20240105"):
+    return dataCollector.update_dataset(ENDPOINT, "KEY", startDd="20240101", endDd=endDd, lakePath=str(tmp_path))
+
+def stored_days(tmp_path):
+    return load_dataset(ENDPOINT, columns=["BAS_DD"], lakePath=str(tmp_path))["BAS_DD"].dt.strftime("%Y%m%d").tolist()
+
+
+
+# * * *   Tests   * * *
+def test_failed_day_is_fetched_again(tmp_path, getter, capsys):
+    # 20240101 is a KRX holiday
+    getter.failing = {"20240103"}
+    assert update(tmp_path) == 3
+    assert sorted(getter.calls) == ["20240102", "20240103", "20240104", "20240105"]
+    assert "20240103" in capsys.readouterr().out
+    assert stored_days(tmp_path) == ["20240102", "20240104", "20240105"]
+
+    # Next run: only the failed day (Not the days after the latest stored date only)
+    getter.calls, getter.failing = [], set()
+    assert update(tmp_path) == 1
+    assert getter.calls == ["20240103"]
+    assert stored_days(tmp_path) == ["20240102", "20240103", "20240104", "20240105"]
+
+    # Up to date
+    getter.calls = []
+    assert update(tmp_path) == 0
+    assert getter.calls == []
+
+def test_new_days_are_appended(tmp_path, getter):
+    update(tmp_path, endDd="20240103")
+    getter.calls = []
+
+    assert update(tmp_path, endDd="20240109") == 4
+    assert sorted(getter.calls) == ["20240104", "20240105", "20240108", "20240109"]
+    assert load_dataset(ENDPOINT, lakePath=str(tmp_path))["TDD_CLSPRC"].tolist() == [70000.0] * 6
+
+def test_backfill_records_failed_days(getter):
+    getter.failing = {"20240104"}
+
+    df = dataCollector.get_krx_daily_backfill(getter, "KEY", "20240102", "20240105", numWorkers=2)
+
+    assert df["BAS_DD"].dt.strftime("%Y%m%d").tolist() == ["20240102", "20240103", "20240105"]
+    assert df.attrs["failedDd"] == ["20240104"]
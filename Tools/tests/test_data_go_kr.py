@@ -0,0 +1,80 @@
+# test_data_go_kr.py
+# 공공데이터포털 response parsing and paginated listing against a stub http_get
+
+# Author  : Byeong Heon Lee
+# Contact : lww7438@gmail.com
+
+# Required Modules
+import json
+import pytest
+
+import dataManipulator
+import apiHandler
+from dataManipulator import parse_data_go_kr_response
+
+
+
+def make_response(items, totalCount=None, pageNo=1, numOfRows=10):
+    return json.dumps({"response": {
+        "header": {"resultCode": "00", "resultMsg": "NORMAL SERVICE."},
+        "body"  : {"numOfRows": numOfRows, "pageNo": pageNo, "totalCount": len(items) if totalCount is None else totalCount, "items": {"item": items} if items else ""},
+    }})
+
+def make_listing(count):
+    return [{"basDt": "20240102", "srtnCd": f"A{i:06d}", "isinCd": f"KR7{i:06d}003", "mrktCtg": "KOSPI", "itmsNm": f"종목{i}",
+             "crno": f"{i:013d}", "corpNm": f"회사{i}(주)"} for i in range(1, count + 1)]
+
+@pytest.fixture
+def listing_server(monkeypatch):
+    # Serves make_listing(25) page by page and records the requested pages
+    listing  = make_listing(25)
+    requests = []
+
+    def http_get(url):
+        params    = dict(pair.split("=", 1) for pair in url.split("?", 1)[1].split("&"))
+        pageNo    = int(params["pageNo"])
+        numOfRows = int(params["numOfRows"])
+        requests.append((pageNo, numOfRows))
+        return make_response(listing[(pageNo - 1) * numOfRows:pageNo * numOfRows], len(listing), pageNo, numOfRows)
+
+    monkeypatch.setattr(dataManipulator, "http_get", http_get)
+    return requests
+
+
+
+# * * *   Tests   * * *
+@pytest.mark.parametrize("fields, schema", [(None, None), (None, {})])
+def test_parse_keeps_all_fields(fields, schema):
+    items = [{"srtnCd": "A005930", "crno": "1301110006246"}]
+
+    header, body, parsed = parse_data_go_kr_response(make_response(items), fields=fields, schema=schema)
+
+    assert header["resultCode"] == "00"
+    assert body["totalCount"] == 1
+    assert parsed == items
+
+def test_parse_projects_and_decodes():
+    items = [{"basDt": "20240102", "clpr": "71,000", "itmsNm": "삼성전자"}, {"basDt": "20240103", "clpr": "-", "itmsNm": "삼성전자"}]
+
+    _, _, parsed = parse_data_go_kr_response(make_response(items), fields=["basDt", "clpr"], schema={"clpr": "int"})
+
+    assert parsed == [{"basDt": "20240102", "clpr": 71000}, {"basDt": "20240103", "clpr": None}]
+
+def test_parse_single_item_and_empty():
+    assert parse_data_go_kr_response(make_response([{"a": "1"}]))[2] == [{"a": "1"}]
+    assert parse_data_go_kr_response(make_response([]))[2] == []
+    with pytest.raises(ValueError):
+        parse_data_go_kr_response("<OpenAPI_ServiceResponse>")
+
+def test_listing_is_projected_and_ordered(listing_server):
+    listing = apiHandler._get_listing("KEY", 25)
+
+    assert [item["isinCd"] for item in listing] == [item["isinCd"] for item in make_listing(25)]
+    assert set(listing[0]) == {"srtnCd", "isinCd", "mrktCtg", "itmsNm", "crno", "corpNm", "shotnIsin"}
+    assert listing[0]["shotnIsin"] == "000001"
+
+def test_listing_stops_at_num_of_row(listing_server):
+    listing = apiHandler._get_listing("KEY", 7)
+
+    assert [item["srtnCd"] for item in listing] == [f"A{i:06d}" for i in range(1, 8)]
+    assert listing_server[0] == (1, 7)
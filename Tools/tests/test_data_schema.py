@@ -0,0 +1,95 @@
+# test_data_schema.py
+# decode_items (vectorized) and RecordAccumulator (row by row) must decode the same values
+
+# Author  : Byeong Heon Lee
+# Contact : lww7438@gmail.com
+
+# Required Modules
+import numpy  as np
+import pandas as pd
+
+from dataSchema import decode_column, decode_items, RecordAccumulator
+
+
+
+SCHEMA = {"basDt": "date", "mrktCtg": "category", "trqu": "int", "fltRt": "float", "itmsNm": "str"}
+ITEMS  = [
+    {"basDt": "20240102", "mrktCtg": "KOSPI",  "trqu": "1,000", "fltRt": "-1.25", "itmsNm": "삼성전자"},
+    {"basDt": "-",        "mrktCtg": "-",      "trqu": "-",     "fltRt": "",      "itmsNm": "-"},
+    {"basDt": "20240103", "mrktCtg": "",       "trqu": "2",     "fltRt": "0.5",   "itmsNm": "SK하이닉스"},
+    {"basDt": "20240104", "mrktCtg": "KOSDAQ", "trqu": None,    "fltRt": "3",     "itmsNm": "에코프로"},
+    {"mrktCtg": None},
+]
+
+
+
+# * * *   Tests   * * *
+def test_blank_category_is_missing():
+    column = decode_column(pd.Series(["KOSPI", "-", "", None, "KOSDAQ"], dtype=object), "category")
+
+    assert column.dtype == "category"
+    assert sorted(column.cat.categories) == ["KOSDAQ", "KOSPI"]
+    assert column.isna().tolist() == [False, True, True, True, False]
+
+def test_decode_items_matches_record_accumulator():
+    decoded     = decode_items(ITEMS, SCHEMA)
+    accumulated = RecordAccumulator.from_items(ITEMS, SCHEMA).to_frame()
+
+    # Category order (Sorted / First seen) and datetime unit may differ; values may not
+    decoded["basDt"] = decoded["basDt"].astype("datetime64[ns]")
+    pd.testing.assert_frame_equal(decoded, accumulated, check_dtype=False, check_categorical=False)
+    assert accumulated["mrktCtg"].isna().tolist() == [False, True, True, False, True]
+    assert np.isnan(accumulated["fltRt"][1])
+
+
+
+# * * *   Tests: RecordAccumulator   * * *
+def test_accumulator_dtypes():
+    records = RecordAccumulator.from_items(ITEMS, SCHEMA)
+    df      = records.to_frame()
+
+    assert len(records) == len(ITEMS)
+    assert list(df.columns) == list(SCHEMA)
+    assert str(df["basDt"].dtype) == "datetime64[ns]"
+    assert str(df["trqu"].dtype) == "Int64"
+    assert df["fltRt"].dtype == "float64"
+    assert df["mrktCtg"].dtype == "category"
+    assert list(df["mrktCtg"].cat.categories) == ["KOSPI", "KOSDAQ"] # First seen order
+    assert df["trqu"].isna().tolist() == [False, True, False, True, True]
+    assert df["trqu"].dropna().tolist() == [1000, 2]
+
+def test_accumulator_missing_and_unknown_fields():
+    records = RecordAccumulator(SCHEMA, 3)
+    records.set(0, {"itmsNm": "삼성전자", "unknown": "ignored"})
+    records.set(2, {"basDt": "2024-01-02", "fltRt": "1.5%"})
+
+    df = records.to_frame()
+    assert "unknown" not in df.columns
+    assert df["itmsNm"].iloc[0] == "삼성전자" and df["itmsNm"].isna().tolist() == [False, True, True]
+    assert df["basDt"].isna().tolist() == [True, True, False]
+    assert df["fltRt"].iloc[2] == 1.5
+    assert df["mrktCtg"].isna().all() and df["trqu"].isna().all()
+
+def test_accumulator_set_updates_fields():
+    # set() overwrites the given fields only (Same as dict.update)
+    records = RecordAccumulator(SCHEMA, 1)
+    records.set(0, {"itmsNm": "삼성전자", "trqu": "10"})
+    records.set(0, {"trqu": "20", "mrktCtg": "KOSPI"})
+
+    assert records.to_frame().iloc[0][["itmsNm", "trqu", "mrktCtg"]].tolist() == ["삼성전자", 20, "KOSPI"]
+
+def test_accumulator_promotes_fractional_int():
+    records = RecordAccumulator({"trqu": "int"}, 3)
+    records.set(0, {"trqu": "1,000"})
+    records.set(2, {"trqu": "2.5"})
+
+    column = records.to_frame()["trqu"]
+    assert column.dtype == "float64"
+    np.testing.assert_array_equal(column.to_numpy(), [1000.0, np.nan, 2.5])
+    assert column.tolist()[2] == decode_column(pd.Series(["1,000", None, "2.5"]), "int").tolist()[2]
+
+def test_accumulator_rows_and_columns():
+    records = RecordAccumulator.from_items(ITEMS, SCHEMA)
+
+    assert list(records.to_frame(columns=["itmsNm", "trqu"]).columns) == ["itmsNm", "trqu"]
+    assert records.nbytes > 0
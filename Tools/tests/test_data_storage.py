@@ -0,0 +1,87 @@
+# test_data_storage.py
+# Batches appended with different dtypes must stay readable as one dataset
+
+# Author  : Byeong Heon Lee
+# Contact : lww7438@gmail.com
+
+# Required Modules
+import os
+import pandas          as pd
+import pyarrow         as pa
+import pyarrow.parquet as pq
+
+from dataSchema  import decode_items, SCHEMA_STOCK_DAILY_TRADING
+from dataStorage import append_dataset, load_dataset, get_latest_date, get_dataset_path
+
+
+
+ENDPOINT = "kospi_daily_trading"
+
+def make_batch(basDd:str, numStocks:int, volume="100"):
+    # numStocks stocks, each in its own 소속부 (numStocks categories)
+    items = [{"BAS_DD": basDd, "ISU_CD": f"{i:06d}", "ISU_NM": f"종목{i}", "MKT_NM": "KOSPI", "SECT_TP_NM": f"소속부{i}",
+              "TDD_CLSPRC": "1,000", "ACC_TRDVOL": volume} for i in range(numStocks)]
+    return decode_items(items, SCHEMA_STOCK_DAILY_TRADING, columns=list(items[0]))
+
+
+
+# * * *   Tests   * * *
+def test_categories_of_different_sizes(tmp_path):
+    append_dataset(ENDPOINT, make_batch("20240102", 1), lakePath=str(tmp_path))
+    append_dataset(ENDPOINT, make_batch("20240103", 200), lakePath=str(tmp_path))
+
+    df = load_dataset(ENDPOINT, lakePath=str(tmp_path))
+
+    assert len(df) == 201
+    assert df["SECT_TP_NM"].dtype == "category"
+    assert df["SECT_TP_NM"].iloc[-1] == "소속부199"
+
+def test_integral_and_fractional_batches(tmp_path):
+    first  = make_batch("20240102", 2, volume="100")
+    second = make_batch("20240103", 2, volume="1.5")
+    assert str(first["ACC_TRDVOL"].dtype) == "Int64" and second["ACC_TRDVOL"].dtype == "float64"
+
+    append_dataset(ENDPOINT, first, lakePath=str(tmp_path))
+    append_dataset(ENDPOINT, second, lakePath=str(tmp_path))
+
+    df = load_dataset(ENDPOINT, startDt="20240103", lakePath=str(tmp_path))
+    assert df["ACC_TRDVOL"].tolist() == [1.5, 1.5]
+    assert load_dataset(ENDPOINT, lakePath=str(tmp_path))["ACC_TRDVOL"].tolist() == [100.0, 100.0, 1.5, 1.5]
+
+def test_part_files_share_one_schema(tmp_path):
+    paths  = append_dataset(ENDPOINT, make_batch("20231228", 1), lakePath=str(tmp_path))
+    paths += append_dataset(ENDPOINT, make_batch("20240102", 300, volume=""), lakePath=str(tmp_path))
+
+    schemas = [pq.read_schema(path).remove_metadata() for path in paths]
+    assert all(schema.equals(schemas[0]) for schema in schemas)
+    assert get_latest_date(ENDPOINT, lakePath=str(tmp_path)) == "20240102"
+
+def test_filters_and_columns(tmp_path):
+    append_dataset(ENDPOINT, make_batch("20231228", 3), lakePath=str(tmp_path))
+    append_dataset(ENDPOINT, make_batch("20240102", 3), lakePath=str(tmp_path))
+
+    df = load_dataset(ENDPOINT, startDt="20231228", endDt="20231228", columns=["ISU_CD"], filters={"ISU_CD": ["000001", "000002"]}, lakePath=str(tmp_path))
+
+    assert list(df.columns) == ["BAS_DD", "ISU_CD"]
+    assert df["ISU_CD"].tolist() == ["000001", "000002"]
+
+def test_endpoint_without_schema(tmp_path):
+    df = pd.DataFrame({"BAS_DD": pd.to_datetime(["20240102", "20240103"]), "ISU_CD": ["A", "B"], "NAV": ["1,000", "-"]})
+    append_dataset("stub_daily_trading", df.iloc[:1], lakePath=str(tmp_path))
+    append_dataset("stub_daily_trading", df.iloc[1:], lakePath=str(tmp_path))
+
+    loaded = load_dataset("stub_daily_trading", lakePath=str(tmp_path))
+    assert loaded["NAV"].tolist() == ["1,000", "-"]
+    assert loaded["BAS_DD"].tolist() == df["BAS_DD"].tolist()
+
+def test_files_with_per_batch_schemas_are_readable(tmp_path):
+    # Files written before the lake schema (int8 / int16 dictionary, Int64 / float64) are cast while reading
+    partition_path = os.path.join(get_dataset_path(ENDPOINT, str(tmp_path)), "year=2024")
+    os.makedirs(partition_path)
+    for name, df in [("a", make_batch("20240102", 1)), ("b", make_batch("20240103", 200, volume="1.5"))]:
+        pq.write_table(pa.Table.from_pandas(df, preserve_index=False), os.path.join(partition_path, f"part-{name}.parquet"))
+
+    df = load_dataset(ENDPOINT, lakePath=str(tmp_path))
+
+    assert len(df) == 201
+    assert df["ACC_TRDVOL"].iloc[-1] == 1.5
@@ -0,0 +1,97 @@
+# test_financials_kr.py
+# get_financials_kr: mode="bulk" must merge the same result as mode="company" (Stub 공공데이터포털 server)
+
+# Author  : Byeong Heon Lee
+# Contact : lww7438@gmail.com
+
+# Required Modules
+import json
+import pytest
+
+import apiHandler
+import dataManipulator
+from apiConfig   import *
+from idCrosswalk import IdCrosswalk
+
+
+
+COMPANIES = [("005930", "1301110006246", "삼성전자"), ("000660", "1101110015762", "SK하이닉스"), ("035420", "1101111929160", "NAVER")]
+OLD_DT    = "20200102" # Older snapshot listed first; the bounds of BULK_ENRICHMENT_PARAMS must skip it
+
+def make_datasets():
+    datasets = {URL_KRX_LISTED_INFO: [], URL_CORP_OUTLINE: [], URL_STOC_ISSU_STAT: [], URL_ITEM_BASI_INFO: [], URL_SUMM_FINA_STAT: [], URL_STOCK_PRICE_INFO: []}
+    for i, (code, crno, name) in enumerate(COMPANIES):
+        isinCd = f"KR7{code}00{i}"
+        datasets[URL_KRX_LISTED_INFO].append({"basDt": PREVIOUS_BUSINESS_DAY, "srtnCd": "A" + code, "isinCd": isinCd, "mrktCtg": "KOSPI", "itmsNm": name, "crno": crno, "corpNm": name + "(주)"})
+        for basDt, employees in [(OLD_DT, "100"), (PREVIOUS_BUSINESS_DAY, "200")]:
+            datasets[URL_CORP_OUTLINE].append({"basDt": basDt, "crno": crno, "corpNm": name + "(주)", "enpEmpeCnt": employees, "sicNm": "제조업"})
+            datasets[URL_STOC_ISSU_STAT].append({"basDt": basDt, "crno": crno, "stckIssuCmpyNm": name, "issuStckCnt": employees})
+            datasets[URL_ITEM_BASI_INFO].append({"basDt": basDt, "crno": crno, "isinCd": isinCd, "itmsShrtnCd": code, "stckParPrc": employees})
+        for bizYear, sales in [(str(int(LAST_YEAR) - 1), "1"), (LAST_YEAR, "2")]:
+            datasets[URL_SUMM_FINA_STAT].append({"basDt": bizYear + "1231", "bizYear": bizYear, "crno": crno, "fnclDcd": "110", "enpSaleAmt": sales})
+        for basDt, fltRt in [(OLD_DT, "9.99"), (PREVIOUS_BUSINESS_DAY, ["1.5", "-", "-0.25"][i])]:
+            datasets[URL_STOCK_PRICE_INFO].append({"basDt": basDt, "srtnCd": code, "isinCd": isinCd, "itmsNm": name, "clpr": "1000", "fltRt": fltRt})
+    return datasets
+
+class StubServer:
+    # 공공데이터포털 list APIs: exact match on the search conditions, numOfRows per page ("" is every row)
+    FILTERS = ["basDt", "crno", "isinCd", "bizYear"]
+
+    def __init__(self):
+        self.datasets = make_datasets()
+        self.requests = []
+
+    def __call__(self, url, *args, **kwargs):
+        serviceUrl, query = url.split("?", 1)
+        params = dict(pair.split("=", 1) for pair in query.split("&"))
+        self.requests.append((serviceUrl, params))
+
+        items = [item for item in self.datasets[serviceUrl] if all(params.get(key, "") in ("", item.get(key, None)) for key in self.FILTERS)]
+
+        pageNo    = int(params.get("pageNo", 1))
+        numOfRows = int(params["numOfRows"]) if params.get("numOfRows", "") != "" else max(len(items), 1)
+        page      = items[(pageNo - 1) * numOfRows:pageNo * numOfRows]
+        return json.dumps({"response": {
+            "header": {"resultCode": "00", "resultMsg": "NORMAL SERVICE."},
+            "body"  : {"numOfRows": numOfRows, "pageNo": pageNo, "totalCount": len(items), "items": {"item": page} if page else ""},
+        }})
+
+@pytest.fixture
+def server(monkeypatch, tmp_path):
+    server    = StubServer()
+    crosswalk = IdCrosswalk(str(tmp_path / "crosswalk.db"))
+
+    monkeypatch.setattr(apiHandler, "http_get", server)
+    monkeypatch.setattr(dataManipulator, "http_get", server)
+    monkeypatch.setattr(apiHandler, "get_id_crosswalk", lambda: crosswalk)
+    monkeypatch.setattr(apiHandler, "resolve_issuco_custno", lambda serviceKey, shortIsin: {"issucoCustno": "9" + shortIsin})
+    monkeypatch.setattr(apiHandler, "get_issuco_basic_info", lambda serviceKey, issucoCustno: {"issucoCustno": issucoCustno, "totalStkCnt": "1000"})
+
+    yield server
+    crosswalk.close()
+
+
+
+# * * *   Tests   * * *
+def test_bulk_matches_company(server):
+    company = apiHandler.get_financials_kr("KEY", numOfRow=len(COMPANIES), mode="company")
+    bulk    = apiHandler.get_financials_kr("KEY", numOfRow=len(COMPANIES), mode="bulk")
+
+    assert bulk == company
+    assert [item["fltRt"] for item in bulk] == ["+1.50%", "", "-0.25%"]
+    assert all(item["enpEmpeCnt"] == "200" and item["stckParPrc"] == "200" and item["enpSaleAmt"] == "2" for item in bulk)
+    assert all(item["totalStkCnt"] == "1000" for item in bulk)
+
+def test_bulk_requests_are_bounded(server):
+    apiHandler.get_financials_kr("KEY", numOfRow=len(COMPANIES), mode="bulk")
+
+    bounds = {URL_CORP_OUTLINE: "basDt", URL_STOC_ISSU_STAT: "basDt", URL_ITEM_BASI_INFO: "basDt", URL_SUMM_FINA_STAT: "bizYear", URL_STOCK_PRICE_INFO: "basDt"}
+    for serviceUrl, params in server.requests:
+        if serviceUrl in bounds:
+            assert params.get(bounds[serviceUrl], "") != "", serviceUrl
+    assert sum(serviceUrl in bounds for serviceUrl, _ in server.requests) == len(bounds) # One page each
+
+def test_bulk_params_override(server):
+    bulk = apiHandler.get_financials_kr("KEY", numOfRow=len(COMPANIES), mode="bulk", bulkParams={"corp_outline": {"basDt": OLD_DT}})
+
+    assert [item["enpEmpeCnt"] for item in bulk] == ["100"] * len(COMPANIES)
@@ -0,0 +1,65 @@
+# test_id_crosswalk.py
+
+# Author  : Byeong Heon Lee
+# Contact : lww7438@gmail.com
+
+# Required Modules
+import numpy as np
+import pytest
+
+from idCrosswalk import IdCrosswalk
+
+
+
+# Two share classes of one company (The same crno)
+COMMON    = {"isinCd": "KR7005930003", "srtnCd": "A005930", "crno": "1301110006246", "itmsNm": "삼성전자",   "corpNm": "삼성전자(주)", "mrktCtg": "KOSPI"}
+PREFERRED = {"isinCd": "KR7005931001", "srtnCd": "A005935", "crno": "1301110006246", "itmsNm": "삼성전자우", "corpNm": "삼성전자(주)", "mrktCtg": "KOSPI"}
+
+@pytest.fixture
+def crosswalk(tmp_path):
+    crosswalk = IdCrosswalk(str(tmp_path / "crosswalk.db"))
+    yield crosswalk
+    crosswalk.close()
+
+
+
+# * * *   Tests   * * *
+def test_refresh_and_lookup(crosswalk):
+    assert crosswalk.refresh([COMMON, PREFERRED], basDt="20240102") == (2, 0)
+    assert crosswalk.refresh([COMMON, PREFERRED]) == (0, 0)
+
+    assert crosswalk.get_id("005930") == 1
+    assert crosswalk.get_id("A005935") == 2
+    assert crosswalk.get_id("1301110006246") == 1 # Earliest registered
+    assert crosswalk.lookup("KR7005931001")["shotnIsin"] == "005935"
+    assert crosswalk.get_refreshed_date() == "20240102"
+    assert crosswalk.map_ids(np.array(["KR7005931001", "KR0000000000"])).tolist() == [2, -1]
+
+def test_rename_keeps_shared_identifier_order(crosswalk):
+    crosswalk.refresh([COMMON, PREFERRED])
+
+    # Only the name changes; crno (Unchanged) must still resolve to the earliest registered id
+    assert crosswalk.refresh([dict(COMMON, itmsNm="삼성전자보통주")]) == (0, 1)
+    assert crosswalk.get_id("1301110006246", key="crno") == 1
+    assert crosswalk.lookup("005930")["itmsNm"] == "삼성전자보통주"
+
+def test_changed_identifier_is_reindexed(crosswalk):
+    crosswalk.refresh([COMMON, PREFERRED])
+    crosswalk.refresh([dict(PREFERRED, crno="1301110000000")])
+
+    assert crosswalk.get_id("1301110006246", key="crno") == 1
+    assert crosswalk.get_id("1301110000000", key="crno") == 2
+    crosswalk.refresh([dict(COMMON, crno="1301110000000")])
+    assert crosswalk.get_id("1301110006246", key="crno") is None
+    assert crosswalk.get_id("1301110000000", key="crno") == 2
+
+def test_reload_from_file(crosswalk):
+    crosswalk.refresh([COMMON, PREFERRED])
+    crosswalk.put_issuco_custno("005930", {"issucoCustno": "593", "issucoNm": "삼성전자", "listNm": "유가증권"})
+    crosswalk.refresh([dict(COMMON, itmsNm="삼성전자보통주")])
+    crosswalk.close()
+
+    assert len(crosswalk) == 2
+    assert crosswalk.get_id("1301110006246") == 1
+    assert crosswalk.get_issuco_custno("005930")["issucoCustno"] == "593"
+    assert crosswalk.get_id("593", key="issucoCustno") == 1
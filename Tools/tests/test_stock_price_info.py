@@ -0,0 +1,79 @@
+# test_stock_price_info.py
+# format_flt_rt and get_stock_price_info (First row / allRows) against a stub http_get
+
+# Author  : Byeong Heon Lee
+# Contact : lww7438@gmail.com
+
+# Required Modules
+import json
+import numpy  as np
+import pandas as pd
+import pytest
+
+import apiHandler
+from dataManipulator import format_flt_rt
+
+
+
+ITEMS = [
+    {"basDt": "20240102", "srtnCd": "005930", "isinCd": "KR7005930003", "itmsNm": "삼성전자",   "mrktCtg": "KOSPI", "clpr": "79600",  "vs": "1100", "fltRt": "1.4",  "trqu": "17142847"},
+    {"basDt": "20240102", "srtnCd": "000660", "isinCd": "KR7000660001", "itmsNm": "SK하이닉스", "mrktCtg": "KOSPI", "clpr": "137500", "vs": "-",    "fltRt": "-",    "trqu": "3148609"},
+    {"basDt": "20240102", "srtnCd": "373220", "isinCd": "KR7373220003", "itmsNm": "LG에너지솔루션", "mrktCtg": "KOSPI", "clpr": "420000", "vs": "0", "fltRt": "-.01", "trqu": ""},
+]
+
+@pytest.fixture
+def serve(monkeypatch):
+    # serve(items): every request returns items as one page
+    def serve(items):
+        text = json.dumps({"response": {
+            "header": {"resultCode": "00", "resultMsg": "NORMAL SERVICE."},
+            "body"  : {"numOfRows": len(items), "pageNo": 1, "totalCount": len(items), "items": {"item": items}},
+        }})
+        monkeypatch.setattr(apiHandler, "http_get", lambda url: text)
+
+    return serve
+
+
+
+# * * *   Tests   * * *
+@pytest.mark.parametrize("fltRt, expected", [(1.234, "+1.23%"), (-0.5, "-0.50%"), (0.0, "0.00%"), (-0.001, "0.00%"), (29.999, "+30.00%"), (np.nan, "")])
+def test_format_flt_rt(fltRt, expected):
+    assert format_flt_rt(fltRt) == expected
+
+def test_format_flt_rt_series():
+    fltRt = pd.Series([1.0, None, -2.346], index=[10, 11, 12], name="fltRt")
+
+    formatted = format_flt_rt(fltRt)
+
+    assert formatted.tolist() == ["+1.00%", "", "-2.35%"]
+    assert formatted.index.tolist() == [10, 11, 12] and formatted.name == "fltRt"
+
+def test_first_row(serve):
+    serve(ITEMS)
+
+    item = apiHandler.get_stock_price_info("KEY", isinCd="KR7005930003")
+
+    assert item["isinCd"] == "KR7005930003"
+    assert item["fltRt"] == "+1.40%"
+
+@pytest.mark.parametrize("fltRt", ["-", "", None])
+def test_first_row_without_flt_rt(serve, fltRt):
+    serve([dict(ITEMS[1], fltRt=fltRt)])
+
+    assert apiHandler.get_stock_price_info("KEY", isinCd="KR7000660001")["fltRt"] == ""
+
+def test_all_rows(serve):
+    serve(ITEMS)
+
+    df = apiHandler.get_stock_price_info("KEY", numOfRows=3, allRows=True)
+
+    assert df["isinCd"].tolist() == [item["isinCd"] for item in ITEMS]
+    assert df["fltRt"].dtype == "float64"
+    np.testing.assert_allclose(df["fltRt"], [1.4, np.nan, -0.01])
+    assert format_flt_rt(df["fltRt"]).tolist() == ["+1.40%", "", "-0.01%"]
+    assert df["trqu"].isna().tolist() == [False, False, True]
+
+def test_no_result(serve):
+    serve([])
+
+    assert apiHandler.get_stock_price_info("KEY", isinCd="KR0000000000") is None
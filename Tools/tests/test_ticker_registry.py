@@ -0,0 +1,39 @@
+# test_ticker_registry.py
+
+# Author  : Byeong Heon Lee
+# Contact : lww7438@gmail.com
+
+# Required Modules
+import zipfile
+import pytest
+
+from tickerRegistry import TickerRegistry
+
+
+
+TICKERS = ["AAPL", "AZN", "AZO", "Z", "ZG", "ZION", "^GSPC", "aapl_old"]
+
+@pytest.fixture
+def registry(tmp_path):
+    source_path = tmp_path / "supported_tickers.zip"
+    with zipfile.ZipFile(source_path, "w") as archive:
+        rows = ["ticker,exchange,assetType,priceCurrency,startDate,endDate"] + [f"{ticker},NASDAQ,Stock,USD,2000-01-03,2022-10-14" for ticker in TICKERS]
+        archive.writestr("supported_tickers.csv", "\n".join(rows) + "\n")
+
+    registry = TickerRegistry(sourcePath=str(source_path), path=str(tmp_path / "tickers.sqlite"))
+    yield registry
+    registry.close()
+
+
+
+# * * *   Tests   * * *
+@pytest.mark.parametrize("prefix", ["Z", "z", "AZ", "az", "A", "^", "aapl"])
+def test_search_prefix_is_case_insensitive(registry, prefix):
+    expected = sorted((ticker for ticker in TICKERS if ticker.lower().startswith(prefix.lower())), key=str.lower)
+
+    assert [row["ticker"] for row in registry.search_prefix(prefix)] == expected
+
+def test_lookup_and_search(registry):
+    assert registry.lookup("zion")[0]["ticker"] == "ZION"
+    assert [row["ticker"] for row in registry.search("_")] == ["aapl_old"] # LIKE wildcards are escaped
+    assert registry.count() == len(TICKERS)
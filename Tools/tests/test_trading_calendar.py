@@ -0,0 +1,29 @@
+# test_trading_calendar.py
+
+# Author  : Byeong Heon Lee
+# Contact : lww7438@gmail.com
+
+# Required Modules
+import pytest
+
+from tradingCalendar import get_krx_trading_days
+
+
+
+# * * *   Tests   * * *
+@pytest.mark.parametrize("year, count", [(2019, 246), (2020, 248), (2021, 248), (2022, 246), (2023, 245)])
+def test_trading_days_per_year(year, count):
+    assert len(get_krx_trading_days(f"{year}0101", f"{year}1231")) == count
+
+@pytest.mark.parametrize("basDd", [
+    "20220131", "20220201", "20220202", # 설날
+    "20220309",                         # 대통령 선거일
+    "20220912", "20221010",             # 대체공휴일
+    "20050405", "20070717",             # 식목일, 제헌절
+    "20221230",                         # 연말 휴장일
+])
+def test_holidays_are_skipped(basDd):
+    assert basDd not in get_krx_trading_days(basDd, basDd)
+
+def test_trading_day_is_kept():
+    assert get_krx_trading_days("20221011", "20221011") == ["20221011"]
@@ -0,0 +1,95 @@
+# test_world_index.py
+# get_world_index / _read_world_index against a local stub data source (dataReader)
+
+# Author  : Byeong Heon Lee
+# Contact : lww7438@gmail.com
+
+# Required Modules
+import pandas as pd
+import pytest
+
+import apiHandler
+
+
+
+# * * *   Stub Data Source   * * *
+class StubReader:
+    """
+    pandas_datareader 대신 사용하는 (ticker, start, end) -> DataFrame 데이터 소스
+    lastDt 이후의 일자는 아직 게시되지 않은 것처럼 반환하지 않으며, 호출된 기간을 calls에 기록한다.
+    """
+
+    def __init__(self, lastDt:str="20221014"):
+        self.lastDt = pd.Timestamp(lastDt)
+        self.calls  = []
+
+    def __call__(self, ticker, start, end):
+        self.calls.append((ticker, pd.Timestamp(start).strftime("%Y%m%d"), pd.Timestamp(end).strftime("%Y%m%d")))
+
+        dates = pd.bdate_range(start, min(pd.Timestamp(end), self.lastDt), name="Date")
+        close = pd.Series(range(len(dates)), index=dates, dtype="float64") + dates.day
+        return pd.DataFrame({"Open": close, "High": close + 1, "Low": close - 1, "Close": close, "Volume": 100.0}, index=dates)
+
+
+
+@pytest.fixture
+def cache_path(tmp_path, monkeypatch):
+    monkeypatch.setattr(apiHandler, "WORLD_INDEX_CACHE_PATH", str(tmp_path))
+    return tmp_path
+
+
+
+# * * *   Tests   * * *
+def test_cache_hit_does_not_call_the_source(cache_path):
+    reader = StubReader()
+
+    first  = apiHandler.get_world_index("^GSPC", startDt="20220901", endDt="20221014", dataReader=reader)
+    second = apiHandler.get_world_index("^GSPC", startDt="20220905", endDt="20221007", dataReader=reader)
+
+    assert len(reader.calls) == 1
+    pd.testing.assert_frame_equal(second, first.loc["20220905":"20221007"], check_freq=False)
+
+def test_incremental_fetch_requests_only_new_days(cache_path):
+    reader = StubReader()
+
+    apiHandler.get_world_index("^GSPC", startDt="20220901", endDt="20220930", dataReader=reader)
+    df = apiHandler.get_world_index("^GSPC", startDt="20220901", endDt="20221014", dataReader=reader)
+
+    assert reader.calls[-1] == ("^GSPC", "20221001", "20221014")
+    assert df.index.min() == pd.Timestamp("20220901") and df.index.max() == pd.Timestamp("20221014")
+    assert not df.index.duplicated().any()
+
+def test_unpublished_trailing_days_are_fetched_again(cache_path):
+    reader = StubReader(lastDt="20221012")
+
+    apiHandler.get_world_index("^GSPC", startDt="20220901", endDt="20221014", dataReader=reader)
+    assert [path.name for path in cache_path.iterdir()] == ["GSPC_20220901_20221012.parquet"]
+
+    # The source publishes the missing days later
+    reader.lastDt = pd.Timestamp("20221014")
+    df = apiHandler.get_world_index("^GSPC", startDt="20220901", endDt="20221014", dataReader=reader)
+
+    assert reader.calls[-1] == ("^GSPC", "20221013", "20221014")
+    assert df.index.max() == pd.Timestamp("20221014")
+
+def test_empty_result_is_not_cached(cache_path):
+    reader = StubReader(lastDt="20000101")
+
+    df = apiHandler.get_world_index("^GSPC", startDt="20220901", endDt="20221014", dataReader=reader)
+
+    assert len(df) == 0
+    assert list(cache_path.iterdir()) == []
+
+def test_all_indices_wide_and_long(cache_path):
+    reader = StubReader()
+
+    wide = apiHandler.get_world_index(startDt="20221003", endDt="20221014", dataReader=reader, numWorkers=4)
+    long = apiHandler.get_world_index(startDt="20221003", endDt="20221014", wide=False, dataReader=reader)
+
+    assert list(wide.columns) == [index_info["ticker"] for index_info in apiHandler.WORLD_INDEX_TICKERS]
+    assert len(long) == wide.size
+    assert long["ticker"].dtype == "category"
+    assert len(reader.calls) == len(apiHandler.WORLD_INDEX_TICKERS) # The second call is served from the cache
+
+def test_unknown_index_returns_none(cache_path):
+    assert apiHandler.get_world_index("NOT_AN_INDEX", dataReader=StubReader()) is None
@@ -0,0 +1,206 @@
+# tickerRegistry.py
+# supported_tickers.zip (supported_tickers.csv: ticker, exchange, assetType, priceCurrency, startDate, endDate)
+
+# Author  : Byeong Heon Lee
+# Contact : lww7438@gmail.com
+
+# Required Modules
+import csv
+import io
+import os
+import sqlite3
+import threading
+import zipfile
+
+from apiConfig import *
+
+
+
+# * * *   Classes   * * *
+class TickerRegistry:
+    """
+    supported_tickers.zip을 한 번만 읽어 SQLite 파일로 변환하고, 인덱스로 종목을 조회하는 Registry
+    ticker(대소문자 구분 없음), exchange, assetType에 인덱스가 있으므로 정확한 조회와 접두어 검색은 O(log n)이다.
+    압축 파일이 바뀌면(수정 시각, 크기) 다음 조회 시 다시 변환한다.
+
+    [Parameters]
+    sourcePath (str) : supported_tickers.zip 경로 (Default: TICKER_SOURCE_PATH)
+    path       (str) : 변환된 SQLite 파일 경로 (Default: TICKER_REGISTRY_PATH)
+    """
+
+    COLUMNS = ["ticker", "exchange", "assetType", "priceCurrency", "startDate", "endDate"]
+
+    def __init__(self, sourcePath:str=TICKER_SOURCE_PATH, path:str=TICKER_REGISTRY_PATH):
+        self.sourcePath = sourcePath
+        self.path       = path
+
+        self._lock = threading.Lock()
+        self._conn = None
+
+    def _get_source_version(self):
+        stat = os.stat(self.sourcePath)
+        return f"{int(stat.st_mtime)}:{stat.st_size}"
+
+    def _connect(self):
+        # Lazy: The archive is converted on the first lookup, not on import
+        with self._lock:
+            if self._conn is not None:
+                return self._conn
+
+            version = self._get_source_version()
+            if os.path.exists(self.path):
+                conn = sqlite3.connect(self.path, check_same_thread=False)
+                try:
+                    if conn.execute("SELECT value FROM meta WHERE key = 'version'").fetchone() == (version,):
+                        self._conn = conn
+                        return conn
+                except sqlite3.DatabaseError:
+                    pass
+                conn.close()
+
+            self._build(version)
+            self._conn = sqlite3.connect(self.path, check_same_thread=False)
+            return self._conn
+
+    def _build(self, version:str):
+        os.makedirs(os.path.dirname(os.path.abspath(self.path)), exist_ok=True)
+
+        temp_path = self.path + ".tmp"
+        if os.path.exists(temp_path):
+            os.remove(temp_path)
+
+        conn = sqlite3.connect(temp_path)
+        conn.execute("""
+            CREATE TABLE ticker (
+                ticker        TEXT NOT NULL COLLATE NOCASE,
+                exchange      TEXT,
+                assetType     TEXT,
+                priceCurrency TEXT,
+                startDate     TEXT,
+                endDate       TEXT
+            )
+        """)
+        conn.execute("CREATE TABLE meta (key TEXT PRIMARY KEY, value TEXT)")
+
+        # Stream the CSV out of the archive
+        with zipfile.ZipFile(self.sourcePath) as archive:
+            with archive.open(archive.namelist()[0]) as file:
+                reader = csv.DictReader(io.TextIOWrapper(file, encoding="utf-8", newline=""))
+                conn.executemany(
+                    "INSERT INTO ticker VALUES (?, ?, ?, ?, ?, ?)",
+                    ([row[column] or None for column in self.COLUMNS] for row in reader)
+                )
+
+        # Indexes after the bulk insert
+        conn.execute("CREATE INDEX idx_ticker_ticker    ON ticker (ticker COLLATE NOCASE)")
+        conn.execute("CREATE INDEX idx_ticker_exchange  ON ticker (exchange, ticker)")
+        conn.execute("CREATE INDEX idx_ticker_assetType ON ticker (assetType, ticker)")
+        conn.execute("INSERT INTO meta VALUES ('version', ?)", (version,))
+        conn.commit()
+        conn.execute("VACUUM")
+        conn.close()
+
+        os.replace(temp_path, self.path)
+
+    def _select(self, where:str, params:tuple, exchange:str=None, assetType:str=None, limit:int=None):
+        conditions = [where]
+        if exchange is not None:
+            conditions.append("exchange = ?")
+            params += (exchange,)
+        if assetType is not None:
+            conditions.append("assetType = ?")
+            params += (assetType,)
+
+        query = f"SELECT {', '.join(self.COLUMNS)} FROM ticker WHERE {' AND '.join(conditions)} ORDER BY ticker COLLATE NOCASE, exchange"
+        if limit is not None:
+            query += f" LIMIT {int(limit)}"
+
+        conn = self._connect()
+        with self._lock:
+            rows = conn.execute(query, params).fetchall()
+
+        return [dict(zip(self.COLUMNS, row)) for row in rows]
+
+    def lookup(self, ticker:str, exchange:str=None, assetType:str=None):
+        """
+        ticker가 일치하는 종목 목록을 반환한다. (대소문자 구분 없음, 거래소가 다른 같은 ticker가 있을 수 있다.)
+        """
+
+        return self._select("ticker = ?", (ticker,), exchange, assetType)
+
+    def search_prefix(self, prefix:str, exchange:str=None, assetType:str=None, limit:int=100):
+        """
+        ticker가 prefix로 시작하는 종목 목록을 반환한다. (인덱스 범위 조회)
+        """
+
+        if prefix == "":
+            return self._select("1 = 1", (), exchange, assetType, limit)
+
+        # NOCASE compares the lowercase form, so the bound is built on the lowercase prefix ("Z" -> "{", not "[")
+        prefix      = prefix.lower()
+        upper_bound = prefix[:-1] + chr(ord(prefix[-1]) + 1)
+        return self._select("ticker >= ? AND ticker < ?", (prefix, upper_bound), exchange, assetType, limit)
+
+    def search(self, keyword:str, exchange:str=None, assetType:str=None, limit:int=100):
+        """
+        ticker에 keyword가 포함된 종목 목록을 반환한다. (supported_tickers.csv에는 종목명 필드가 없다.)
+        """
+
+        keyword = keyword.replace("!", "!!").replace("%", "!%").replace("_", "!_")
+        return self._select("ticker LIKE ? ESCAPE '!'", (f"%{keyword}%",), exchange, assetType, limit)
+
+    def is_supported(self, ticker:str):
+        return len(self.lookup(ticker)) > 0
+
+    def count(self):
+        conn = self._connect()
+        with self._lock:
+            return conn.execute("SELECT COUNT(*) FROM ticker").fetchone()[0]
+
+    def close(self):
+        with self._lock:
+            if self._conn is not None:
+                self._conn.close()
+                self._conn = None
+
+
+
+# * * *   Functions   * * *
+_ticker_registry      = None
+_ticker_registry_lock = threading.Lock()
+
+def get_ticker_registry():
+    """
+    공용 TickerRegistry를 반환한다. (처음 조회할 때 TICKER_REGISTRY_PATH로 변환된다.)
+    """
+
+    global _ticker_registry
+
+    with _ticker_registry_lock:
+        if _ticker_registry is None:
+            _ticker_registry = TickerRegistry()
+
+    return _ticker_registry
+
+def get_ticker_info(ticker:str, exchange:str=None, assetType:str=None):
+    """
+    supported_tickers.zip에서 ticker가 일치하는 종목 목록을 반환한다.
+    (예: get_ticker_info("AAPL") -> [{'ticker': 'AAPL', 'exchange': 'NASDAQ', 'assetType': 'Stock', ...}])
+
+    [Parameters]
+    ticker    (str) : 종목 Ticker (대소문자 구분 없음) (Mandatory)
+    exchange  (str) : 거래소 (예: "NYSE", "NASDAQ", "SHE") (Default: None; 전체)
+    assetType (str) : 자산 유형 (예: "Stock", "ETF", "Mutual Fund") (Default: None; 전체)
+
+    [Returns]
+    list of dict : ticker, exchange, assetType, priceCurrency, startDate, endDate
+    """
+
+    return get_ticker_registry().lookup(ticker, exchange, assetType)
+
+def search_tickers(prefix:str, exchange:str=None, assetType:str=None, limit:int=100):
+    """
+    supported_tickers.zip에서 ticker가 prefix로 시작하는 종목 목록을 반환한다. (최대 limit개)
+    """
+
+    return get_ticker_registry().search_prefix(prefix, exchange, assetType, limit)
@@ -0,0 +1,63 @@
+# tradingCalendar.py
+# http://open.krx.co.kr/contents/MKD/01/0110/01100305/MKD01100305.jsp (KRX 휴장일)
+
+# Author  : Byeong Heon Lee
+# Contact : lww7438@gmail.com
+
+# Required Modules
+from datetime import datetime, timedelta
+
+from apiConfig import *
+
+
+
+# * * *   Functions   * * *
+def is_krx_fixed_holiday(date:datetime):
+    """
+    양력 고정 휴장일 여부를 반환한다.
+    (신정, 삼일절, 근로자의 날, 어린이날, 현충일, 광복절, 개천절, 한글날(2013~), 성탄절, 연말 휴장일)
+    """
+
+    mmdd = date.strftime("%m%d")
+
+    if mmdd in KRX_FIXED_HOLIDAYS:
+        return True
+
+    # 한글날: 2013년부터 공휴일
+    if mmdd == "1009" and date.year >= 2013:
+        return True
+
+    # 연말 휴장일: 12월의 마지막 평일
+    if date.month == 12 and date.weekday() < 5:
+        next_weekday = date + timedelta(days=(3 if date.weekday() == 4 else 1))
+        if next_weekday.year != date.year:
+            return True
+
+    return False
+
+def get_krx_trading_days(startDd:str, endDd:str=PREVIOUS_BUSINESS_DAY, holidays=KRX_HOLIDAYS):
+    """
+    startDd ~ endDd 사이의 KRX 영업일 목록을 반환한다.
+    주말, 양력 고정 휴장일, holidays에 포함된 날짜(설날, 추석, 부처님오신날, 선거일, 대체공휴일 등)를 제외한다.
+
+    [Parameters]
+    startDd  (str)          : 시작일자 (YYYYMMDD) (Mandatory)
+    endDd    (str)          : 종료일자 (YYYYMMDD, 포함) (Default: PREVIOUS_BUSINESS_DAY)
+    holidays (iterable str) : 추가 휴장일 목록 (YYYYMMDD) (Default: KRX_HOLIDAYS)
+
+    [Returns]
+    trading_days : 영업일 목록 (list of str, YYYYMMDD, 오름차순)
+    """
+
+    holidays = set(holidays)
+    end_date = datetime.strptime(endDd, "%Y%m%d")
+    date     = datetime.strptime(startDd, "%Y%m%d")
+
+    trading_days = []
+    while date <= end_date:
+        basDd = date.strftime("%Y%m%d")
+        if date.weekday() < 5 and not is_krx_fixed_holiday(date) and basDd not in holidays:
+            trading_days.append(basDd)
+        date += timedelta(days=1)
+
+    return trading_days